@@ -216,7 +216,116 @@ os.makedirs(LOGS_DIR, exist_ok=True)
 # ---------------------------------------------------------------
 # Scraping Configuration
 # ---------------------------------------------------------------
+# Upper bound (seconds) for the per-page readiness wait; override per source with
+# SourceModel.settle_timeout. Pages usually settle well before it.
 SCRAPING_SLEEP_TIME = int(os.getenv("SCRAPING_SLEEP_TIME", 5))
+SCRAPING_READY_POLL = float(os.getenv("SCRAPING_READY_POLL", 0.25))
+SCRAPING_READY_QUIET = float(os.getenv("SCRAPING_READY_QUIET", 0.5))
+# Parallel scrape executor (manage.py scrape --workers / --deadline)
+SCRAPING_WORKERS = int(os.getenv("SCRAPING_WORKERS", 1))
+SCRAPING_RUN_DEADLINE = float(os.getenv("SCRAPING_RUN_DEADLINE", 0))  # 0 = no deadline
+SCRAPING_CANCEL_GRACE = float(os.getenv("SCRAPING_CANCEL_GRACE", 10))
+# Per-page retries of transient WebDriver errors, capped per source per run
+SCRAPING_RETRY_ATTEMPTS = int(os.getenv("SCRAPING_RETRY_ATTEMPTS", 3))
+SCRAPING_RETRY_BUDGET = int(os.getenv("SCRAPING_RETRY_BUDGET", 6))
+SCRAPING_RETRY_WAIT_MIN = float(os.getenv("SCRAPING_RETRY_WAIT_MIN", 4))
+SCRAPING_RETRY_WAIT_MAX = float(os.getenv("SCRAPING_RETRY_WAIT_MAX", 10))
+# Per-source circuit breaker: open after N consecutive failed page loads, probe
+# again after the cool-down (seconds); latency is tracked as an EWMA
+SCRAPING_BREAKER_THRESHOLD = int(os.getenv("SCRAPING_BREAKER_THRESHOLD", 3))
+SCRAPING_BREAKER_COOLDOWN = float(os.getenv("SCRAPING_BREAKER_COOLDOWN", 300))
+SCRAPING_HEALTH_EWMA_ALPHA = float(os.getenv("SCRAPING_HEALTH_EWMA_ALPHA", 0.3))
+# Hedged instruments (InstrumentModel.hedge): start the first fallback source once
+# the default exceeds this percentile of its recent page load times (or
+# SCRAPING_HEDGE_BUDGET seconds while it has no history)
+SCRAPING_HEDGE_PERCENTILE = float(os.getenv("SCRAPING_HEDGE_PERCENTILE", 90))
+SCRAPING_HEDGE_BUDGET = float(os.getenv("SCRAPING_HEDGE_BUDGET", 15))
+# WebDriver pool (browsers are reused across scrapers and recycled on limits)
+SCRAPING_DRIVER_POOL_SIZE = int(os.getenv("SCRAPING_DRIVER_POOL_SIZE", 2))
+SCRAPING_DRIVER_MAX_PAGES = int(os.getenv("SCRAPING_DRIVER_MAX_PAGES", 50))
+SCRAPING_DRIVER_MAX_RSS_MB = int(os.getenv("SCRAPING_DRIVER_MAX_RSS_MB", 1024))
+# Lean browser profile: memory-saving flags, images off, CDP blocklist (see
+# engine.driver_pool.DEFAULT_BLOCKED_URLS) plus these comma-separated patterns
+SCRAPING_BROWSER_LEAN = os.getenv("SCRAPING_BROWSER_LEAN", "True") == "True"
+SCRAPING_BROWSER_BLOCKED_URLS = os.getenv("SCRAPING_BROWSER_BLOCKED_URLS", "")
+SCRAPING_PAGE_LOAD_STRATEGY = os.getenv("SCRAPING_PAGE_LOAD_STRATEGY", "eager")
+# Opt-in persistent Chrome profiles per source (disk cache kept between runs);
+# clean up with manage.py cleanbrowsercache
+SCRAPING_BROWSER_CACHE = os.getenv("SCRAPING_BROWSER_CACHE", "False") == "True"
+SCRAPING_BROWSER_CACHE_DIR = os.getenv(
+    "SCRAPING_BROWSER_CACHE_DIR", str(BASE_DIR / "browser_cache")
+)
+SCRAPING_BROWSER_CACHE_SLOTS = int(os.getenv("SCRAPING_BROWSER_CACHE_SLOTS", 2))
+SCRAPING_BROWSER_CACHE_MB = int(os.getenv("SCRAPING_BROWSER_CACHE_MB", 200))
+# HTTP-first fetch tier (sources/configs with requires_js disabled)
+SCRAPING_HTTP_TIMEOUT = float(os.getenv("SCRAPING_HTTP_TIMEOUT", 10))
+SCRAPING_HTTP_MAX_CONNECTIONS = int(os.getenv("SCRAPING_HTTP_MAX_CONNECTIONS", 20))
+# Async HTTP engine (manage.py scrape --engine): auto | async | selenium
+SCRAPING_ENGINE = os.getenv("SCRAPING_ENGINE", "auto")
+SCRAPING_ASYNC_PER_HOST = int(os.getenv("SCRAPING_ASYNC_PER_HOST", 4))
+SCRAPING_ASYNC_PARSE_WORKERS = int(os.getenv("SCRAPING_ASYNC_PARSE_WORKERS", 4))
+# Write-behind tick ingestion (one batching writer per process)
+SCRAPING_INGEST_BATCH_SIZE = int(os.getenv("SCRAPING_INGEST_BATCH_SIZE", 200))
+SCRAPING_INGEST_FLUSH_INTERVAL = float(os.getenv("SCRAPING_INGEST_FLUSH_INTERVAL", 1))
+SCRAPING_INGEST_QUEUE_SIZE = int(os.getenv("SCRAPING_INGEST_QUEUE_SIZE", 1000))
+SCRAPING_INGEST_PUT_TIMEOUT = float(os.getenv("SCRAPING_INGEST_PUT_TIMEOUT", 30))
+# Skip ticks identical to the last one per (instrument, source); still write one
+# every SCRAPING_TICK_HEARTBEAT seconds to prove freshness
+SCRAPING_TICK_DEDUPE = os.getenv("SCRAPING_TICK_DEDUPE", "True") == "True"
+SCRAPING_TICK_HEARTBEAT = float(os.getenv("SCRAPING_TICK_HEARTBEAT", 900))
+# Parse page N on a worker thread while the browser loads page N+1
+SCRAPING_PIPELINE = os.getenv("SCRAPING_PIPELINE", "True") == "True"
+# BeautifulSoup backend: html.parser (stdlib) or lxml (faster, pip install lxml)
+SCRAPING_HTML_PARSER = os.getenv("SCRAPING_HTML_PARSER", "html.parser")
+# Take and parse only the page fragment a scraper reads (fragment_selector)
+SCRAPING_HTML_FRAGMENTS = os.getenv("SCRAPING_HTML_FRAGMENTS", "True") == "True"
+# Offline copies of source pages for benchparse (saved by refreshcorpus)
+SCRAPING_CORPUS_DIR = os.getenv(
+    "SCRAPING_CORPUS_DIR", str(BASE_DIR / "scraping" / "fixtures" / "pages")
+)
+# Browser backend: chrome, or fake (corpus pages for both WebDriver and HTTP, no network)
+SCRAPING_DRIVER = os.getenv("SCRAPING_DRIVER", "chrome")
+# Fake backend: per-page latency + jitter (seconds) and failure rates (0..1)
+SCRAPING_FAKE_LATENCY = float(os.getenv("SCRAPING_FAKE_LATENCY", 0.2))
+SCRAPING_FAKE_JITTER = float(os.getenv("SCRAPING_FAKE_JITTER", 0.1))
+SCRAPING_FAKE_FAILURE_RATE = float(os.getenv("SCRAPING_FAKE_FAILURE_RATE", 0.0))
+SCRAPING_FAKE_TIMEOUT_RATE = float(os.getenv("SCRAPING_FAKE_TIMEOUT_RATE", 0.0))
+SCRAPING_FAKE_SEED = int(os.getenv("SCRAPING_FAKE_SEED", 0))
+# Per-run / per-page timing telemetry (ScrapeRunModel), kept for N days (0 = forever)
+SCRAPING_TELEMETRY = os.getenv("SCRAPING_TELEMETRY", "True") == "True"
+SCRAPING_TELEMETRY_DAYS = int(os.getenv("SCRAPING_TELEMETRY_DAYS", 30))
+# Adaptive cadence between SourceConfigModel.min_interval and max_interval: the
+# interval is shortest once the largest tick-to-tick move of the last LOOKBACK
+# seconds reaches VOLATILE (0.005 = 0.5%) and longest at or below FLAT
+SCRAPING_CADENCE_VOLATILE = float(os.getenv("SCRAPING_CADENCE_VOLATILE", 0.005))
+SCRAPING_CADENCE_FLAT = float(os.getenv("SCRAPING_CADENCE_FLAT", 0.0005))
+SCRAPING_CADENCE_LOOKBACK = int(os.getenv("SCRAPING_CADENCE_LOOKBACK", 3600))
+# scrape --skip-fresh: leave out configs scraped less than their interval ago
+# (minus SLACK of the interval, so cron runs do not skip what is almost due)
+SCRAPING_SKIP_FRESH = os.getenv("SCRAPING_SKIP_FRESH", "False") == "True"
+SCRAPING_CADENCE_SLACK = float(os.getenv("SCRAPING_CADENCE_SLACK", 0.1))
+# scrape --profile: pstats / allocation report / RSS CSV directory, RSS sample period (s)
+SCRAPING_PROFILE_DIR = os.getenv(
+    "SCRAPING_PROFILE_DIR", os.path.join(LOGS_DIR, "profiles")
+)
+SCRAPING_PROFILE_INTERVAL = float(os.getenv("SCRAPING_PROFILE_INTERVAL", 0.5))
+# Scrapers hand ticks to storage every N parsed pages instead of at the end of a run
+SCRAPING_STREAM_BATCH_SIZE = int(os.getenv("SCRAPING_STREAM_BATCH_SIZE", 5))
+# Scrape daemon (manage.py scrapeloop)
+SCRAPING_LOOP_INTERVAL = int(os.getenv("SCRAPING_LOOP_INTERVAL", 300))
+SCRAPING_LOOP_JITTER = float(os.getenv("SCRAPING_LOOP_JITTER", 0.1))
+SCRAPING_LOOP_REFRESH = int(os.getenv("SCRAPING_LOOP_REFRESH", 300))
+SCRAPING_LOOP_TICK = float(os.getenv("SCRAPING_LOOP_TICK", 1))
+# Read-through refresh: an API / bot read of a price older than SLA seconds
+# enqueues one on-demand scrape of the instrument (run by scrapeloop, polled
+# every POLL s); repeat stale reads within DEDUPE s are not looked at again,
+# claims older than TIMEOUT s are retried. Only enable it where scrapeloop runs:
+# nothing else consumes the queue
+SCRAPING_REFRESH_ON_READ = os.getenv("SCRAPING_REFRESH_ON_READ", "False") == "True"
+SCRAPING_FRESHNESS_SLA = int(os.getenv("SCRAPING_FRESHNESS_SLA", 900))
+SCRAPING_REFRESH_DEDUPE = int(os.getenv("SCRAPING_REFRESH_DEDUPE", 60))
+SCRAPING_REFRESH_POLL = float(os.getenv("SCRAPING_REFRESH_POLL", 2))
+SCRAPING_REFRESH_TIMEOUT = int(os.getenv("SCRAPING_REFRESH_TIMEOUT", 600))
 
 # ---------------------------------------------------------------
 # Telegram Configuration
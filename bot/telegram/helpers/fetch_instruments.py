@@ -3,12 +3,14 @@ from django.db.models import OuterRef, Subquery
 from django.db.models.functions import Coalesce
 from scraping.api.serializers import InstrumentSerializer
 from scraping.models import InstrumentModel, PriceTickModel
+from scraping.engine.refresh import request_refresh
 
 
 async def fetch_instruments(category: str) -> dict:
     """
     Fetch instruments of a given category (optional) with the latest tick.
     Returns serialized data as dict, including a localized category name.
+    Stale prices are returned as they are and enqueue a refresh for later reads.
     """
 
     def get_queryset():
@@ -54,6 +56,7 @@ async def fetch_instruments(category: str) -> dict:
         return qs
 
     queryset = await sync_to_async(list)(get_queryset())
+    await sync_to_async(request_refresh)(queryset)
     serializer = InstrumentSerializer(queryset, many=True)
     data = {"results": serializer.data, "count": len(serializer.data)}
 
@@ -1,3 +1,6 @@
 from .price_tick_admin import PriceTickAdmin  # noqa
 from .instrument_admin import InstrumentAdmin  # noqa
 from .source_admin import SourceAdmin, SourceConfigAdmin  # noqa
+from .source_health_admin import SourceHealthAdmin  # noqa
+from .scrape_run_admin import ScrapeRunAdmin, ScrapePageAdmin  # noqa
+from .refresh_request_admin import RefreshRequestAdmin  # noqa
@@ -28,6 +28,7 @@ class InstrumentAdmin(admin.ModelAdmin):
         "category",
         "default_source",
         # "get_price_tick_count",
+        "hedge",
         "enabled",
         "created_at",
         "updated_at",
@@ -35,7 +36,7 @@ class InstrumentAdmin(admin.ModelAdmin):
 
     ordering = ["symbol"]
     list_filter = ["category"]
-    list_editable = ["enabled"]
+    list_editable = ["enabled", "hedge"]
     search_fields = ["symbol", "name", "fa_name"]
 
     # inlines = [PriceTickInline]
@@ -0,0 +1,13 @@
+from django.contrib import admin
+from ..models import RefreshRequestModel
+
+
+@admin.register(RefreshRequestModel)
+class RefreshRequestAdmin(admin.ModelAdmin):
+    list_display = ["instrument", "requested_at", "stale_since", "claimed_at"]
+    search_fields = ["instrument__symbol", "instrument__name"]
+    ordering = ["requested_at"]
+    readonly_fields = ["instrument", "requested_at", "stale_since", "claimed_at"]
+
+    def has_add_permission(self, request):
+        return False
@@ -0,0 +1,117 @@
+from collections import defaultdict
+
+from django.contrib import admin
+from django.utils import timezone
+
+from ..engine.stats import percentile
+from ..models import ScrapePageModel, ScrapeRunModel
+
+STAGES = ["driver_launch", "navigation", "wait", "parse", "db_write"]
+# Most recent filtered pages the timing table is computed from
+TIMINGS_MAX_PAGES = 5000
+
+
+class ScrapePageInline(admin.TabularInline):
+    model = ScrapePageModel
+    extra = 0
+    can_delete = False
+    fields = ["source", "url", "via", "outcome", *STAGES, "retries", "ticks", "error"]
+    readonly_fields = fields
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(ScrapeRunModel)
+class ScrapeRunAdmin(admin.ModelAdmin):
+    list_display = [
+        "started_at",
+        "command",
+        "arguments",
+        "outcome",
+        "duration",
+        "page_loads",
+        "failed_pages",
+        "retries",
+        "ticks",
+        "driver_launch",
+        "db_write",
+    ]
+
+    list_filter = ["command", "outcome", "started_at"]
+    search_fields = ["arguments"]
+    ordering = ["-started_at"]
+    list_per_page = 50
+    date_hierarchy = "started_at"
+    inlines = [ScrapePageInline]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(ScrapePageModel)
+class ScrapePageAdmin(admin.ModelAdmin):
+    """Page timings, with p50/p95 per source and day of the filtered pages on top."""
+
+    change_list_template = "scrape_page_timings.html"
+
+    list_display = [
+        "started_at",
+        "source__name",
+        "url",
+        "via",
+        "outcome",
+        *STAGES,
+        "retries",
+        "ticks",
+    ]
+
+    list_filter = ["source", "outcome", "via", "run__command"]
+    search_fields = ["url", "symbols", "error"]
+    ordering = ["-started_at"]
+    list_per_page = 50
+    date_hierarchy = "started_at"
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("source")
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def changelist_view(self, request, extra_context=None):
+        response = super().changelist_view(request, extra_context)
+        context = getattr(response, "context_data", None)
+        if context and "cl" in context:
+            context["timings"] = self.timings(context["cl"].queryset)
+            context["timing_stages"] = [*STAGES, "total"]
+        return response
+
+    @staticmethod
+    def timings(queryset):
+        """[{day, source, pages, cells: [(p50, p95) per stage]}], newest day first."""
+        rows = queryset.order_by("-started_at").values_list(
+            "source__name", "started_at", *STAGES
+        )[:TIMINGS_MAX_PAGES]
+        groups = defaultdict(list)
+        for name, started_at, *values in rows:
+            day = timezone.localtime(started_at).date()
+            groups[(day, name)].append([*values, sum(values)])
+
+        table = []
+        for (day, name), pages in sorted(groups.items(), reverse=True):
+            columns = list(zip(*pages))
+            table.append(
+                {
+                    "source": name,
+                    "day": day,
+                    "pages": len(pages),
+                    "cells": [(percentile(c, 50), percentile(c, 95)) for c in columns],
+                }
+            )
+        return table
@@ -23,15 +23,33 @@ class PriceTickInline(admin.TabularInline):
 class SourceConfigInline(admin.TabularInline):
     model = SourceConfigModel
     extra = 1  # Number of empty forms to display
-    fields = ["source", "instrument", "path"]
+    fields = [
+        "source",
+        "instrument",
+        "path",
+        "row_key",
+        "requires_js",
+        "scrape_interval",
+        "min_interval",
+        "max_interval",
+    ]
     ordering = ["source__name", "instrument__symbol"]
     show_change_link = True
 
 
 @admin.register(SourceConfigModel)
 class SourceConfigAdmin(admin.ModelAdmin):
-    list_display = ["source", "instrument", "path"]
-    list_filter = ["source", "instrument"]
+    list_display = [
+        "source",
+        "instrument",
+        "path",
+        "row_key",
+        "requires_js",
+        "scrape_interval",
+        "min_interval",
+        "max_interval",
+    ]
+    list_filter = ["source", "instrument", "requires_js"]
     search_fields = ["source__name", "instrument__symbol"]
     ordering = ["source__name", "instrument__symbol"]
 
@@ -42,6 +60,9 @@ class SourceAdmin(admin.ModelAdmin):
         "name",
         "base_url_link",
         # "get_price_tick_count",
+        "requires_js",
+        "settle_timeout",
+        "listing_path",
         "enabled",
         "created_at",
         "updated_at",
@@ -49,8 +70,8 @@ class SourceAdmin(admin.ModelAdmin):
 
     ordering = ["name"]
     search_fields = ["name"]
-    list_filter = ["enabled"]
-    list_editable = ["enabled"]  # Allow inline editing of enabled status
+    list_filter = ["enabled", "requires_js"]
+    list_editable = ["enabled", "requires_js"]  # Allow inline editing of flags
 
     # inlines = [PriceTickInline, SourceConfigInline]
     actions = ["enable_sources", "disable_sources"]
@@ -0,0 +1,34 @@
+from django.contrib import admin
+from ..models import SourceHealthModel
+
+
+@admin.register(SourceHealthModel)
+class SourceHealthAdmin(admin.ModelAdmin):
+    list_display = [
+        "source",
+        "state",
+        "consecutive_failures",
+        "latency_ewma",
+        "opened_at",
+        "last_success_at",
+        "last_failure_at",
+        "last_error",
+    ]
+
+    list_filter = ["state"]
+    search_fields = ["source__name", "last_error"]
+    ordering = ["source__name"]
+    actions = ["close_circuits"]
+
+    readonly_fields = [
+        "latency_ewma",
+        "last_success_at",
+        "last_failure_at",
+        "last_error",
+        "updated_at",
+    ]
+
+    def close_circuits(self, request, queryset):
+        queryset.update(state=SourceHealthModel.State.CLOSED, consecutive_failures=0)
+
+    close_circuits.short_description = "Close circuit (resume scraping on next run)"
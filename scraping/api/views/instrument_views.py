@@ -4,6 +4,7 @@ from django.db.models import OuterRef, Subquery
 
 from rest_framework import exceptions
 from rest_framework.generics import ListAPIView
+from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework.throttling import ScopedRateThrottle
 from django_filters.rest_framework import DjangoFilterBackend
@@ -12,6 +13,7 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExampl
 
 from ...utils import parse_iso_dt
 from ...models import InstrumentModel, PriceTickModel
+from ...engine.refresh import request_refresh
 from api_key.authentication import APIKeyAuthentication
 from ..serializers import InstrumentSerializer, PriceTickSerializer
 
@@ -54,6 +56,9 @@ class InstrumentListView(ListAPIView):
 
     Query params:
       - category (optional): filter by category (gold, coin, currency, crypto)
+
+    Prices older than SCRAPING_FRESHNESS_SLA are still served as they are, but
+    enqueue an on-demand scrape so later reads get a fresh one (engine.refresh).
     """
 
     serializer_class = InstrumentSerializer
@@ -116,6 +121,18 @@ class InstrumentListView(ListAPIView):
 
         return qs
 
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        rows = list(queryset) if page is None else page
+
+        request_refresh(rows)
+
+        serializer = self.get_serializer(rows, many=True)
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data)
+
 
 @extend_schema(
     description=(
@@ -0,0 +1,92 @@
+from .executor import ParallelExecutor, ScrapeUnit, UnitOutcome
+from .driver_pool import (
+    DriverPool,
+    get_driver_pool,
+    create_chrome_driver,
+    create_driver,
+    resolve_driver_path,
+)
+from .fake_web import FakeWeb, FakeWebDriver, fake_transport, get_fake_web
+from .http_client import get_http_client, close_http_client, fetch_html
+from .parsing import fragment_html, parse_html, resolve_parser, strainer_for
+from .corpus import CorpusPage, PageCorpus, get_page_corpus
+from .scheduler import JobScheduler, ScheduledJob
+from .cadence import Cadence, CadencePolicy, get_cadence_policy
+from .refresh import claim_refreshes, finish_refreshes, request_refresh
+from .retry import RetryBudget
+from .health import HealthTracker, get_health_tracker
+from .hedge import HedgedExecutor, HedgeOutcome
+from .fingerprint import ChangeDetector, fingerprint, get_change_detector
+from .ingestion import (
+    TickRecord,
+    TickWriter,
+    clear_instrument_cache,
+    get_tick_writer,
+    save_ticks,
+)
+from .stats import PageStat, ScrapeStats
+from .telemetry import RunRecorder, get_run_recorder, prune_runs
+from .profiling import ProfileReport, RunProfiler
+from .planner import PlanCompiler, PlanError, PlanUnit, ScrapePlan, compile_plan
+from .async_engine import AsyncHttpEngine, AsyncJob, get_async_engine
+
+__all__ = [
+    "ParallelExecutor",
+    "ScrapeUnit",
+    "UnitOutcome",
+    "DriverPool",
+    "get_driver_pool",
+    "create_chrome_driver",
+    "create_driver",
+    "FakeWeb",
+    "FakeWebDriver",
+    "fake_transport",
+    "get_fake_web",
+    "resolve_driver_path",
+    "get_http_client",
+    "close_http_client",
+    "fetch_html",
+    "fragment_html",
+    "parse_html",
+    "resolve_parser",
+    "strainer_for",
+    "CorpusPage",
+    "PageCorpus",
+    "get_page_corpus",
+    "JobScheduler",
+    "ScheduledJob",
+    "Cadence",
+    "CadencePolicy",
+    "get_cadence_policy",
+    "request_refresh",
+    "claim_refreshes",
+    "finish_refreshes",
+    "RetryBudget",
+    "HealthTracker",
+    "get_health_tracker",
+    "HedgedExecutor",
+    "HedgeOutcome",
+    "ChangeDetector",
+    "fingerprint",
+    "get_change_detector",
+    "TickRecord",
+    "TickWriter",
+    "get_tick_writer",
+    "clear_instrument_cache",
+    "save_ticks",
+    "PageStat",
+    "ScrapeStats",
+    "RunRecorder",
+    "get_run_recorder",
+    "prune_runs",
+    "ProfileReport",
+    "RunProfiler",
+    "PlanCompiler",
+    "PlanError",
+    "PlanUnit",
+    "ScrapePlan",
+    "compile_plan",
+    "AsyncHttpEngine",
+    "AsyncJob",
+    "get_async_engine",
+]
@@ -0,0 +1,212 @@
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import httpx
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+from .fake_web import fake_enabled, fake_transport, get_fake_web
+from .http_client import HTTP_HEADERS
+from .parsing import parse_html
+from .ingestion import TickRecord
+from .stats import PageStat, ScrapeStats
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AsyncJob:
+    """A scraper (used for its URL / parse hooks) and the configs to fetch over HTTP."""
+
+    scraper: object
+    configs: Sequence
+    stats: ScrapeStats = field(init=False)
+    # Configs whose page could not be fetched or lacked the ready element
+    fallback: List = field(default_factory=list)
+
+    def __post_init__(self):
+        self.stats = ScrapeStats(source=self.scraper.source.name)  # type: ignore
+
+
+class AsyncHttpEngine:
+    """
+    Scrapes browser-less configs concurrently on one asyncio event loop.
+
+    - One httpx.AsyncClient (connection pool) per host, each limited to
+      `per_host` concurrent requests so no site gets hammered.
+    - HTML parsing runs in a thread pool of `parse_workers`, keeping
+      BeautifulSoup off the event loop. Parsed ticks are stored per page.
+    - Pages that fail over HTTP, or whose static HTML lacks the scraper's
+      ready element, are left in job.fallback for the browser path.
+
+    The scrapers' own hooks (group_by_url, page_locator, page_ready,
+    listing_rows, parse_config, store) do the source-specific work.
+    `backend` "fake" serves the fixture corpus (SCRAPING_DRIVER when None).
+    """
+
+    def __init__(
+        self,
+        per_host: int = 4,
+        parse_workers: int = 4,
+        timeout: float = 10.0,
+        backend: Optional[str] = None,
+    ):
+        self.per_host = max(1, per_host)
+        self.parse_workers = max(1, parse_workers)
+        self.timeout = timeout
+        self.backend = backend
+
+    # -------------------- worker-thread side --------------------
+
+    @staticmethod
+    def _process(job: AsyncJob, url: str, configs: List, html: str, page: PageStat):
+        """Parse one page and store its ticks. Returns (ok, failed, fallback) configs."""
+        scraper = job.scraper
+        ok: List = []
+        failed: List = []
+        started = time.monotonic()
+        try:
+            soup = parse_html(html, scraper.group_fragment(configs))  # type: ignore
+            if not scraper.page_ready(soup, scraper.page_locator(configs[0])):  # type: ignore
+                logger.info(f"Expected element missing in static HTML of {url}")
+                page.outcome, page.error = "failed", "expected element missing"
+                return ok, failed, list(configs)
+
+            rows = None
+            if any(scraper.uses_listing(c) for c in configs):  # type: ignore
+                rows = scraper.listing_rows(soup)  # type: ignore
+            records = []
+            for config in configs:
+                data = scraper.parse_config(config, url, soup, rows)  # type: ignore
+                if data is None:
+                    failed.append(config)
+                    continue
+                ok.append(config)
+                records.append(TickRecord.from_data(scraper.source, data))  # type: ignore
+            page.parse = time.monotonic() - started
+            page.finish([(c, c in ok or None) for c in configs])
+            if records:
+                stored = time.monotonic()
+                scraper.store(records)  # type: ignore
+                page.store = time.monotonic() - stored
+                page.ticks = len(records)
+            return ok, failed, []
+        finally:
+            # Parse threads may have touched the DB (store without a tick writer)
+            connections.close_all()
+
+    # -------------------- event-loop side --------------------
+
+    def _client_for(self, url: str, clients: Dict[str, Tuple]) -> Tuple:
+        host = urlsplit(url).netloc
+        if host not in clients:
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers=HTTP_HEADERS,
+                limits=httpx.Limits(
+                    max_connections=self.per_host,
+                    max_keepalive_connections=self.per_host,
+                    keepalive_expiry=60,
+                ),
+                transport=(
+                    fake_transport(get_fake_web(), is_async=True)
+                    if fake_enabled(self.backend)
+                    else None
+                ),
+            )
+            clients[host] = (client, asyncio.Semaphore(self.per_host))
+        return clients[host]
+
+    async def _page(self, job, url, configs, clients, pool):
+        client, limit = self._client_for(url, clients)
+        page = PageStat(
+            url=url,
+            via="async",
+            symbols=", ".join(c.instrument.symbol for c in configs)[:255],
+            started_at=timezone.now(),
+        )
+        job.scraper.page_stats.append(page)  # type: ignore
+        async with limit:
+            started = time.monotonic()
+            try:
+                response = await client.get(url)
+                response.raise_for_status()
+                html = response.text
+            except httpx.HTTPError as e:
+                # Not reported to the circuit breaker: the browser retry will be
+                logger.info(f"HTTP fetch failed for {url}: {e}")
+                page.navigation = time.monotonic() - started
+                page.outcome, page.error = "failed", str(e)[:255]
+                job.fallback.extend(configs)
+                return
+            page.navigation = time.monotonic() - started
+            job.scraper.health.record_success(  # type: ignore
+                job.scraper.source, page.navigation  # type: ignore
+            )
+
+        loop = asyncio.get_running_loop()
+        try:
+            ok, failed, fallback = await loop.run_in_executor(
+                pool, self._process, job, url, configs, html, page
+            )
+        except Exception as e:
+            # One broken page must not abort the other pages of the run
+            logger.exception(f"Processing {url} failed: {e}")
+            page.outcome, page.error = "failed", str(e)[:255]
+            job.scraper.health.record_failure(job.scraper.source, str(e))  # type: ignore
+            job.fallback.extend(configs)
+            return
+        job.stats.page_loads += 1
+        job.stats.pages += len(ok) + len(failed)
+        job.stats.succeeded += len(ok)
+        job.stats.ok_symbols.extend(c.instrument.symbol for c in ok)
+        job.stats.saved += len(ok)
+        job.stats.failed += len(failed)
+        job.stats.failed_symbols.extend(c.instrument.symbol for c in failed)
+        job.fallback.extend(fallback)
+
+    async def _run(self, jobs: List[AsyncJob]):
+        clients: Dict[str, Tuple] = {}
+        pool = ThreadPoolExecutor(self.parse_workers, thread_name_prefix="parse")
+        try:
+            tasks = [
+                self._page(job, url, configs, clients, pool)
+                for job in jobs
+                for url, configs in job.scraper.group_by_url(job.configs).items()  # type: ignore
+            ]
+            await asyncio.gather(*tasks)
+        finally:
+            await asyncio.gather(*(c.aclose() for c, _ in clients.values()))
+            pool.shutdown(wait=True)
+
+    def run(self, jobs: List[AsyncJob]) -> List[AsyncJob]:
+        """Run all jobs to completion on a fresh event loop (blocking)."""
+        if not jobs:
+            return jobs
+        started = time.monotonic()
+        # Breaker state is read lazily from the DB, which the event loop must not do
+        for job in jobs:
+            job.scraper.health._ensure_loaded()  # type: ignore
+        asyncio.run(self._run(jobs))
+        pages = sum(job.stats.page_loads for job in jobs)
+        logger.info(
+            f"Async HTTP engine: {pages} page(s) across {len(jobs)} source job(s) "
+            f"in {time.monotonic() - started:.2f}s"
+        )
+        return jobs
+
+
+def get_async_engine(backend: Optional[str] = None) -> AsyncHttpEngine:
+    return AsyncHttpEngine(
+        per_host=settings.SCRAPING_ASYNC_PER_HOST,
+        parse_workers=settings.SCRAPING_ASYNC_PARSE_WORKERS,
+        timeout=settings.SCRAPING_HTTP_TIMEOUT,
+        backend=backend,
+    )
@@ -0,0 +1,196 @@
+import os
+import time
+import shutil
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.utils.text import slugify
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+
+def _lock_fd(fd: int):
+    """Non-blocking exclusive lock on an open file; OSError when it is held."""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+
+def _dir_size(path: Path) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+    return total
+
+
+@dataclass
+class CacheSlot:
+    """One Chrome user-data dir, held by a single browser through its lock file."""
+
+    path: Path
+    lock_path: Path
+    fd: Optional[int] = None
+    released: bool = False
+
+    def release(self):
+        if self.released:
+            return
+        self.released = True
+        if self.fd is not None:
+            # Closing drops the lock; the file stays, unlinking it would race
+            # with a process that just opened it
+            os.close(self.fd)
+
+
+class BrowserCache:
+    """
+    Persistent Chrome profiles (and so disk caches) per source, reused across runs.
+
+    Each source gets up to `slots` profile dirs (<root>/<source>/slot-N). Chrome
+    cannot share a profile between processes, so a browser claims a free slot by
+    taking an exclusive OS lock (flock) on slot-N.lock, which holds its PID for
+    inspection. The OS drops the lock when its process dies, so crashed runs
+    leave nothing behind. When every slot is busy the browser starts without a
+    cache.
+    The disk cache of each profile is capped at `size_mb`.
+    """
+
+    def __init__(self, root, slots: int = 2, size_mb: int = 200):
+        self.root = Path(root)
+        self.slots = max(1, slots)
+        self.size_mb = max(1, size_mb)
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        return self.size_mb * 1024 * 1024
+
+    def source_dir(self, source_name: str) -> Path:
+        return self.root / (slugify(source_name) or "default")
+
+    # -------------------- locking --------------------
+
+    def lock_owner(self, lock_path: Path) -> Optional[int]:
+        """PID holding a slot lock, or None when the slot is free."""
+        fd = self._try_lock(lock_path)
+        if fd is not None:
+            os.close(fd)
+            return None
+        try:
+            return int(lock_path.read_text().strip() or 0) or None
+        except (FileNotFoundError, ValueError):
+            return None
+
+    @staticmethod
+    def _try_lock(lock_path: Path) -> Optional[int]:
+        """Lock the slot and record our PID; the open fd holds the lock, or None."""
+        fd = os.open(lock_path, os.O_CREAT | os.O_RDWR)
+        try:
+            _lock_fd(fd)
+        except OSError:
+            os.close(fd)
+            return None
+        os.ftruncate(fd, 0)
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, str(os.getpid()).encode())
+        return fd
+
+    def claim(self, source_name: str) -> Optional[CacheSlot]:
+        base = self.source_dir(source_name)
+        base.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            for i in range(self.slots):
+                lock_path = base / f"slot-{i}.lock"
+                fd = self._try_lock(lock_path)
+                if fd is not None:
+                    path = base / f"slot-{i}"
+                    path.mkdir(exist_ok=True)
+                    os.utime(path)  # last use, for clean(max_age_days)
+                    return CacheSlot(path=path, lock_path=lock_path, fd=fd)
+        logger.info(f"All {self.slots} browser cache slot(s) of {source_name} busy")
+        return None
+
+    # -------------------- maintenance --------------------
+
+    def iter_slots(self, source_name: Optional[str] = None) -> Iterator[Path]:
+        if source_name:
+            bases = [self.source_dir(source_name)]
+        elif self.root.exists():
+            bases = [p for p in self.root.iterdir() if p.is_dir()]
+        else:
+            bases = []
+        for base in bases:
+            if base.exists():
+                yield from sorted(p for p in base.glob("slot-*") if p.is_dir())
+
+    def clean(
+        self,
+        source_name: Optional[str] = None,
+        max_age_days: Optional[float] = None,
+        everything: bool = False,
+    ) -> Tuple[List[Path], int]:
+        """
+        Remove slots that are not in use and either exceed the size limit, were
+        not used for `max_age_days`, or all of them with `everything`.
+        Returns (removed slot dirs, bytes freed).
+        """
+        removed: List[Path] = []
+        freed = 0
+        now = time.time()
+        for path in self.iter_slots(source_name):
+            # Hold the slot while inspecting it so no browser claims it meanwhile
+            lock_path = path.with_suffix(".lock")
+            fd = self._try_lock(lock_path)
+            if fd is None:
+                continue
+            slot = CacheSlot(path=path, lock_path=lock_path, fd=fd)
+            try:
+                size = _dir_size(path)
+                # Allow for profile files on top of the capped disk cache
+                too_big = size > self.size_bytes * 1.5
+                too_old = (
+                    max_age_days is not None
+                    and now - path.stat().st_mtime > max_age_days * 86400
+                )
+                if everything or too_big or too_old:
+                    shutil.rmtree(path, ignore_errors=True)
+                    removed.append(path)
+                    freed += size
+            finally:
+                slot.release()
+        return removed, freed
+
+
+_shared_cache: Optional[BrowserCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_browser_cache() -> Optional[BrowserCache]:
+    """Process-wide browser cache, or None unless SCRAPING_BROWSER_CACHE is on."""
+    global _shared_cache
+    if not settings.SCRAPING_BROWSER_CACHE:
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = BrowserCache(
+                root=settings.SCRAPING_BROWSER_CACHE_DIR,
+                slots=settings.SCRAPING_BROWSER_CACHE_SLOTS,
+                size_mb=settings.SCRAPING_BROWSER_CACHE_MB,
+            )
+        return _shared_cache
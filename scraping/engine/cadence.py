@@ -0,0 +1,183 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Collection, Dict, Iterable, Optional, Set, Tuple
+
+from django.conf import settings
+from django.db.models import Max
+from django.utils import timezone
+
+from ..models import PriceTickModel, SourceConfigModel, TickFingerprintModel
+
+# (instrument_id, source_id)
+PairKey = Tuple[object, object]
+
+
+@dataclass(frozen=True)
+class Cadence:
+    """How often a config should be scraped now, and when it last was."""
+
+    interval: float
+    move: Optional[float] = None  # largest tick-to-tick move in the lookback
+    seen_at: Optional[datetime] = None
+
+    def due_in(self, now: Optional[datetime] = None) -> float:
+        """Seconds until the pair goes stale (0 if never scraped or already stale)."""
+        if self.seen_at is None:
+            return 0.0
+        age = ((now or timezone.now()) - self.seen_at).total_seconds()
+        return max(0.0, self.interval - age)
+
+    def fresh(self, now: Optional[datetime] = None, slack: float = 0.0) -> bool:
+        """Whether more than `slack` of the interval is left before it goes stale."""
+        return self.due_in(now) > self.interval * slack
+
+
+class CadencePolicy:
+    """
+    Adaptive refresh interval per (instrument, source) config.
+
+    Configs with min_interval / max_interval are scraped every max_interval
+    seconds while their price is flat and every min_interval seconds while it
+    moves: the interval shrinks linearly as the largest tick-to-tick move of
+    the last `lookback` seconds goes from `flat` to `volatile` (relative
+    changes, 0.005 = 0.5%). Unset bounds fall back to scrape_interval, else
+    `default`, so configs without bounds keep a fixed interval.
+
+    Ticks are deduplicated (ChangeDetector), so a pair's stored ticks are its
+    price changes plus heartbeats; when it was last scraped comes from
+    TickFingerprintModel.seen_at, else its last tick.
+    """
+
+    def __init__(
+        self,
+        default: float,
+        volatile: float = 0.005,
+        flat: float = 0.0005,
+        lookback: float = 3600.0,
+        slack: float = 0.1,
+    ):
+        self.default = float(default)
+        self.volatile = volatile
+        self.flat = min(flat, volatile)
+        self.lookback = timedelta(seconds=max(0.0, lookback))
+        self.slack = slack
+
+    def bounds(self, cfg: SourceConfigModel) -> Tuple[float, float]:
+        """(min, max) interval of a config in seconds."""
+        base = cfg.scrape_interval or self.default
+        low = cfg.min_interval or base
+        high = cfg.max_interval or base
+        return float(min(low, high)), float(max(low, high))
+
+    def interval(self, cfg: SourceConfigModel, move: Optional[float]) -> float:
+        low, high = self.bounds(cfg)
+        if low == high or move is None or move <= self.flat:
+            return high
+        if move >= self.volatile:
+            return low
+        share = (move - self.flat) / (self.volatile - self.flat)
+        return high - share * (high - low)
+
+    # -------------------- data --------------------
+
+    def moves(self, keys: Set[PairKey]) -> Dict[PairKey, float]:
+        """Largest relative move between consecutive ticks in the lookback, per pair."""
+        rows = (
+            PriceTickModel.objects.filter(
+                instrument_id__in={k[0] for k in keys},
+                source_id__in={k[1] for k in keys},
+                timestamp__gte=timezone.now() - self.lookback,
+            )
+            .order_by("timestamp")
+            .values_list("instrument_id", "source_id", "price")
+        )
+        last: Dict[PairKey, object] = {}
+        moves: Dict[PairKey, float] = {}
+        for instrument_id, source_id, price in rows:
+            key = (instrument_id, source_id)
+            if key not in keys:
+                continue
+            prev = last.get(key)
+            move = abs(float(price / prev - 1)) if prev else 0.0  # type: ignore
+            moves[key] = max(moves.get(key, 0.0), move)
+            last[key] = price
+        return moves
+
+    def seen(self, keys: Set[PairKey], horizon: float) -> Dict[PairKey, datetime]:
+        """When each pair was last scraped, looking back `horizon` seconds for ticks."""
+        instrument_ids = {k[0] for k in keys}
+        source_ids = {k[1] for k in keys}
+        seen: Dict[PairKey, datetime] = {}
+
+        def note(key: PairKey, at: Optional[datetime]):
+            if key in keys and at and (key not in seen or at > seen[key]):
+                seen[key] = at
+
+        for (
+            instrument_id,
+            source_id,
+            seen_at,
+            written_at,
+        ) in TickFingerprintModel.objects.filter(
+            instrument_id__in=instrument_ids, source_id__in=source_ids
+        ).values_list(
+            "instrument_id", "source_id", "seen_at", "written_at"
+        ):
+            note((instrument_id, source_id), seen_at or written_at)
+        # Without dedupe every scrape writes a tick; older ones are stale anyway
+        for instrument_id, source_id, last in (
+            PriceTickModel.objects.filter(
+                instrument_id__in=instrument_ids,
+                source_id__in=source_ids,
+                timestamp__gte=timezone.now() - timedelta(seconds=horizon),
+            )
+            .order_by()
+            .values("instrument_id", "source_id")
+            .annotate(last=Max("timestamp"))
+            .values_list("instrument_id", "source_id", "last")
+        ):
+            note((instrument_id, source_id), last)
+        return seen
+
+    def evaluate(self, configs: Iterable[SourceConfigModel]) -> Dict[object, Cadence]:
+        """Cadence per config pk, in three queries whatever the number of configs."""
+        configs = list(configs)
+        if not configs:
+            return {}
+        keys = {(cfg.instrument_id, cfg.source_id) for cfg in configs}
+        moves = self.moves(keys)
+        seen = self.seen(keys, horizon=max(self.bounds(cfg)[1] for cfg in configs))
+        cadences = {}
+        for cfg in configs:
+            key = (cfg.instrument_id, cfg.source_id)
+            move = moves.get(key)
+            cadences[cfg.pk] = Cadence(
+                interval=self.interval(cfg, move), move=move, seen_at=seen.get(key)
+            )
+        return cadences
+
+    def stale(
+        self, configs: Collection[SourceConfigModel], now: Optional[datetime] = None
+    ) -> Tuple[list, Dict[object, Cadence]]:
+        """Split configs into those due for a scrape and {pk: Cadence} of the fresh ones."""
+        now = now or timezone.now()
+        cadences = self.evaluate(configs)
+        due = []
+        fresh: Dict[object, Cadence] = {}
+        for cfg in configs:
+            cadence = cadences[cfg.pk]
+            if cadence.fresh(now, self.slack):
+                fresh[cfg.pk] = cadence
+            else:
+                due.append(cfg)
+        return due, fresh
+
+
+def get_cadence_policy() -> CadencePolicy:
+    return CadencePolicy(
+        default=settings.SCRAPING_LOOP_INTERVAL,
+        volatile=settings.SCRAPING_CADENCE_VOLATILE,
+        flat=settings.SCRAPING_CADENCE_FLAT,
+        lookback=settings.SCRAPING_CADENCE_LOOKBACK,
+        slack=settings.SCRAPING_CADENCE_SLACK,
+    )
@@ -0,0 +1,123 @@
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from django.utils.text import slugify
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_records(records: List[Optional[Dict[str, Any]]]) -> List[Any]:
+    """Records as plain JSON values (Decimals and dates as strings), for comparing."""
+    return json.loads(json.dumps(records, cls=DjangoJSONEncoder, sort_keys=True))
+
+
+@dataclass
+class CorpusPage:
+    """A saved page: <source>/<slug>.html plus <slug>.json with its URL and records."""
+
+    source: str
+    url: str
+    html_path: Path
+    fetched_at: str = ""
+    symbols: List[str] = field(default_factory=list)
+    expected: List[Any] = field(default_factory=list)
+
+    @property
+    def html(self) -> str:
+        return self.html_path.read_text(encoding="utf-8")
+
+
+class PageCorpus:
+    """
+    Offline copies of source pages, used to benchmark and regression-test the
+    parsing half of the scrapers without the live sites.
+
+    Pages are stored per source as full documents (never fragments), each with
+    a sidecar holding the URL, the symbols read from it and the records
+    expected from it: what the scraper parsed when refreshcorpus saved it, or
+    written by hand for the synthetic pages shipped with the repository.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def source_dir(self, source_name: str) -> Path:
+        return self.root / (slugify(source_name) or "default")
+
+    @staticmethod
+    def slug_for(url: str) -> str:
+        parts = urlsplit(url)
+        return slugify(f"{parts.path} {parts.query}".replace("/", " ")) or "index"
+
+    def save(
+        self,
+        source_name: str,
+        url: str,
+        html: str,
+        symbols: List[str],
+        records: List[Optional[Dict[str, Any]]],
+    ) -> CorpusPage:
+        base = self.source_dir(source_name)
+        base.mkdir(parents=True, exist_ok=True)
+        slug = self.slug_for(url)
+        page = CorpusPage(
+            source=source_name,
+            url=url,
+            html_path=base / f"{slug}.html",
+            fetched_at=timezone.now().isoformat(),
+            symbols=list(symbols),
+            expected=normalize_records(records),
+        )
+        page.html_path.write_text(html, encoding="utf-8")
+        sidecar = {
+            "url": page.url,
+            "fetched_at": page.fetched_at,
+            "symbols": page.symbols,
+            "expected": page.expected,
+        }
+        (base / f"{slug}.json").write_text(
+            json.dumps(sidecar, ensure_ascii=False, indent=2, sort_keys=True),
+            encoding="utf-8",
+        )
+        return page
+
+    def sources(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir())
+
+    def iter_pages(self, source_name: Optional[str] = None) -> Iterator[CorpusPage]:
+        names = [slugify(source_name)] if source_name else self.sources()
+        for name in names:
+            base = self.root / name
+            if not base.exists():
+                continue
+            for sidecar in sorted(base.glob("*.json")):
+                html_path = sidecar.with_suffix(".html")
+                if not html_path.exists():
+                    logger.warning(f"Corpus page {html_path} is missing")
+                    continue
+                meta = json.loads(sidecar.read_text(encoding="utf-8"))
+                yield CorpusPage(
+                    source=name,
+                    url=meta["url"],
+                    html_path=html_path,
+                    fetched_at=meta.get("fetched_at", ""),
+                    symbols=meta.get("symbols", []),
+                    expected=meta.get("expected", []),
+                )
+
+    def index(self) -> Dict[str, CorpusPage]:
+        """Every saved page keyed by URL."""
+        return {page.url: page for page in self.iter_pages()}
+
+
+def get_page_corpus() -> PageCorpus:
+    return PageCorpus(settings.SCRAPING_CORPUS_DIR)
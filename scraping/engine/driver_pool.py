@@ -0,0 +1,441 @@
+import time
+import logging
+import platform
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+import psutil
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+from django.conf import settings
+
+from .browser_cache import get_browser_cache
+from .fake_web import FakeWebDriver, fake_enabled, get_fake_web
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+
+# Lean profile (SCRAPING_BROWSER_LEAN): Chrome flags that cut memory and
+# background work on small VMs. Images are disabled via blink settings.
+LEAN_CHROME_FLAGS = [
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-sync",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--mute-audio",
+    "--no-first-run",
+    "--renderer-process-limit=2",
+    "--js-flags=--max-old-space-size=256",
+    "--blink-settings=imagesEnabled=false",
+]
+
+# Requests blocked through CDP (Network.setBlockedURLs) in the lean profile:
+# images, fonts, media and common ad / analytics hosts, none of which we parse.
+DEFAULT_BLOCKED_URLS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.ico",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*.mp4",
+    "*.webm",
+    "*.mp3",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*mc.yandex.ru*",
+    "*connect.facebook.net*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+]
+
+
+def blocked_urls_for(source=None) -> List[str]:
+    """
+    URL patterns to block for a source: the built-in list, SCRAPING_BROWSER_BLOCKED_URLS
+    and the source's own SourceModel.blocked_urls (one pattern per line).
+    Empty when the lean profile is off.
+    """
+    if not settings.SCRAPING_BROWSER_LEAN:
+        return []
+    urls = DEFAULT_BLOCKED_URLS + [
+        u.strip()
+        for u in settings.SCRAPING_BROWSER_BLOCKED_URLS.split(",")
+        if u.strip()
+    ]
+    extra = getattr(source, "blocked_urls", "") or ""
+    urls += [line.strip() for line in extra.splitlines() if line.strip()]
+    return list(dict.fromkeys(urls))
+
+
+def apply_blocked_urls(driver, urls: Iterable[str]):
+    """Set the request blocklist of a (pooled) Chrome; replaces the previous one."""
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(urls)})
+    except Exception as e:
+        logger.debug(f"Could not set blocked URLs: {e}")
+
+
+_driver_path_lock = threading.Lock()
+_driver_path_cache: Dict[bool, str] = {}
+
+
+def resolve_driver_path(auto_driver: bool = False) -> str:
+    """
+    Resolve the ChromeDriver binary once per process.
+    With auto_driver, webdriver_manager is only consulted on the first call.
+    """
+    with _driver_path_lock:
+        path = _driver_path_cache.get(auto_driver)
+        if path:
+            return path
+        if auto_driver:
+            path = ChromeDriverManager().install()
+        else:
+            path = (
+                f"{settings.BASE_DIR}/scraping/sources/drivers/chromedriver.exe"
+                if platform.system() == "Windows"
+                else f"{settings.BASE_DIR}/scraping/sources/drivers/chromedriver"
+            )
+        _driver_path_cache[auto_driver] = path
+        return path
+
+
+class _Chrome(webdriver.Chrome):
+    """Chrome that hands its persistent cache slot back when it quits."""
+
+    cache_slot = None
+
+    def quit(self):
+        try:
+            super().quit()
+        finally:
+            slot, self.cache_slot = self.cache_slot, None
+            if slot is not None:
+                slot.release()
+
+
+def create_chrome_driver(
+    auto_driver: bool = False, cache_key: Optional[str] = None
+) -> webdriver.Chrome:
+    """
+    Launch a new headless Chrome instance (lean profile unless disabled).
+    With a cache_key (source name) and SCRAPING_BROWSER_CACHE on, Chrome runs on
+    a persistent per-source profile so its disk cache survives between runs.
+    """
+    service = Service(resolve_driver_path(auto_driver))
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument(f"user-agent={USER_AGENT}")
+    if settings.SCRAPING_BROWSER_LEAN:
+        for flag in LEAN_CHROME_FLAGS:
+            options.add_argument(flag)
+    # "eager": driver.get() returns at DOMContentLoaded; readiness is awaited explicitly
+    options.page_load_strategy = settings.SCRAPING_PAGE_LOAD_STRATEGY
+
+    cache = get_browser_cache() if cache_key else None
+    slot = cache.claim(cache_key) if cache else None  # type: ignore
+    if slot is not None:
+        options.add_argument(f"--user-data-dir={slot.path}")
+        options.add_argument(f"--disk-cache-size={cache.size_bytes}")  # type: ignore
+    try:
+        driver = _Chrome(service=service, options=options)
+    except Exception:
+        if slot is not None:
+            slot.release()
+        raise
+    driver.cache_slot = slot
+    return driver
+
+
+def create_driver(
+    auto_driver: bool = False,
+    cache_key: Optional[str] = None,
+    backend: Optional[str] = None,
+):
+    """
+    A new browser: Chrome, or a FakeWebDriver when `backend` is "fake"
+    (SCRAPING_DRIVER when None).
+    """
+    if fake_enabled(backend):
+        return FakeWebDriver(get_fake_web())
+    return create_chrome_driver(auto_driver, cache_key=cache_key)
+
+
+def driver_rss_mb(driver) -> float:
+    """Resident memory of the chromedriver process and all its Chrome children (MB)."""
+    try:
+        proc = psutil.Process(driver.service.process.pid)
+        procs = [proc] + proc.children(recursive=True)
+    except Exception:
+        return 0.0
+    total = 0
+    for p in procs:
+        try:
+            total += p.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return total / (1024 * 1024)
+
+
+@dataclass
+class _PooledDriver:
+    driver: webdriver.Chrome
+    created: float = field(default_factory=time.monotonic)
+    pages: int = 0
+    uses: int = 0
+    key: Optional[str] = None  # cache key (source) of its persistent profile
+
+
+class DriverPool:
+    """
+    Thread-safe pool of warm Chrome drivers shared by scrapers.
+
+    - acquire() hands out an idle browser when one exists, otherwise launches a new
+      one (up to `max_size` live browsers; further callers wait).
+      Browsers launched for a cache key (persistent per-source profile) are only
+      reused for that key; an idle browser of another key is evicted when the
+      pool is full.
+    - release() returns the browser to the pool. It is recycled (quit) once it has
+      served `max_pages` pages or its process tree exceeds `max_rss_mb`.
+    - Health checks, cookie resets, recycling checks and quits run outside the
+      pool lock, so one hung browser does not block other workers.
+    - stats() reports launch / reuse / recycle counts.
+    - `backend` picks the browser ("chrome" / "fake"); SCRAPING_DRIVER when None.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1,
+        max_pages: int = 50,
+        max_rss_mb: float = 1024,
+        auto_driver: bool = False,
+        acquire_timeout: float = 300,
+        backend: Optional[str] = None,
+    ):
+        self.max_size = max(1, int(max_size))
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.auto_driver = auto_driver
+        self.acquire_timeout = acquire_timeout
+        self.backend = backend
+
+        self._cond = threading.Condition()
+        self._idle: List[_PooledDriver] = []
+        self._in_use: Dict[int, _PooledDriver] = {}
+        self._closed = False
+
+        self.launched = 0
+        self.reused = 0
+        self.recycled = 0
+        self.discarded = 0
+
+    # -------------------- internals --------------------
+
+    def _live(self) -> int:
+        return len(self._idle) + len(self._in_use)
+
+    @staticmethod
+    def _healthy(entry: _PooledDriver) -> bool:
+        try:
+            entry.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(entry: _PooledDriver):
+        try:
+            entry.driver.quit()
+        except Exception:
+            pass
+
+    def _should_recycle(self, entry: _PooledDriver) -> Optional[str]:
+        if self.max_pages and entry.pages >= self.max_pages:
+            return f"{entry.pages} pages served"
+        if self.max_rss_mb:
+            rss = driver_rss_mb(entry.driver)
+            if rss >= self.max_rss_mb:
+                return f"RSS {rss:.0f} MB"
+        return None
+
+    # -------------------- public API --------------------
+
+    def _reserve(self, key: Optional[str], deadline: float):
+        """
+        Under the lock, take an idle browser of `key` (entry) or a slot to launch
+        one in (placeholder), evicting an idle browser of another key (victim)
+        when the pool is full. Nothing slow happens here: checking, quitting and
+        launching browsers is left to the caller, outside the lock.
+        """
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Driver pool is closed")
+
+                for entry in reversed(self._idle):
+                    if entry.key == key:
+                        self._idle.remove(entry)
+                        self._in_use[id(entry.driver)] = entry
+                        return entry, None, None
+
+                victim = None
+                if self._live() >= self.max_size and self._idle:
+                    # Full, but idle browsers of other keys can make room
+                    victim = self._idle.pop(0)
+                    self.discarded += 1
+
+                if self._live() < self.max_size:
+                    placeholder = object()
+                    self._in_use[id(placeholder)] = None  # type: ignore
+                    return None, victim, placeholder
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("Timed out waiting for a pooled WebDriver")
+                self._cond.wait(remaining)
+
+    def acquire(self, key: Optional[str] = None) -> webdriver.Chrome:
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            entry, victim, placeholder = self._reserve(key, deadline)
+            if victim is not None:
+                self._quit(victim)
+            if entry is None:
+                break
+            if self._healthy(entry):
+                with self._cond:
+                    entry.uses += 1
+                    self.reused += 1
+                return entry.driver
+            self._quit(entry)
+            with self._cond:
+                self._in_use.pop(id(entry.driver), None)
+                self.discarded += 1
+                self._cond.notify()
+
+        try:
+            started = time.monotonic()
+            driver = create_driver(
+                self.auto_driver, cache_key=key, backend=self.backend
+            )
+        except Exception:
+            with self._cond:
+                self._in_use.pop(id(placeholder))
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._in_use.pop(id(placeholder))
+            self._in_use[id(driver)] = _PooledDriver(driver=driver, uses=1, key=key)
+            self.launched += 1
+        logger.debug(f"Launched Chrome in {time.monotonic() - started:.2f}s")
+        return driver
+
+    def release(self, driver, pages: int = 0, broken: bool = False):
+        with self._cond:
+            entry = self._in_use.get(id(driver))
+            if entry is not None:
+                entry.pages += pages
+            closed = self._closed
+        if entry is None:
+            # Not ours (or already released); make sure it does not leak.
+            self._quit(_PooledDriver(driver=driver))
+            return
+
+        # Browser round-trips stay outside the lock; the entry keeps its slot
+        # (still in _in_use) until it is quit or back in the idle list
+        reason = None
+        if not broken and not closed:
+            reason = self._should_recycle(entry)
+            if reason:
+                logger.info(f"Recycling Chrome after {reason}")
+            else:
+                try:
+                    entry.driver.delete_all_cookies()
+                except Exception:
+                    pass
+        keep = not (broken or closed or reason)
+        if not keep:
+            self._quit(entry)
+
+        closed_meanwhile = False
+        with self._cond:
+            self._in_use.pop(id(driver), None)
+            if keep and self._closed:
+                closed_meanwhile = True
+                self.discarded += 1
+            elif keep:
+                self._idle.append(entry)
+            elif reason:
+                self.recycled += 1
+            else:
+                self.discarded += 1
+            self._cond.notify()
+        if closed_meanwhile:
+            self._quit(entry)
+
+    def warm(self, count: int = 1):
+        """Pre-launch browsers so the first scrapers do not pay the startup cost."""
+        drivers = []
+        for _ in range(min(count, self.max_size)):
+            drivers.append(self.acquire())
+        for driver in drivers:
+            self.release(driver)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for entry in idle:
+            self._quit(entry)
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "launched": self.launched,
+                "reused": self.reused,
+                "recycled": self.recycled,
+                "discarded": self.discarded,
+                "idle": len(self._idle),
+                "in_use": len([e for e in self._in_use.values() if e]),
+            }
+
+
+_shared_pool: Optional[DriverPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_driver_pool(auto_driver: bool = False) -> DriverPool:
+    """Process-wide pool for long-lived processes (daemon, bot, API workers)."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None or _shared_pool._closed:
+            _shared_pool = DriverPool(
+                max_size=settings.SCRAPING_DRIVER_POOL_SIZE,
+                max_pages=settings.SCRAPING_DRIVER_MAX_PAGES,
+                max_rss_mb=settings.SCRAPING_DRIVER_MAX_RSS_MB,
+                auto_driver=auto_driver,
+            )
+        return _shared_pool
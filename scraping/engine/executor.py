@@ -0,0 +1,225 @@
+import math
+import time
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from django.db import connections
+
+from ..models import SourceModel
+from .stats import ScrapeStats
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScrapeUnit:
+    """
+    One independent piece of work: a single source scraping a batch of instruments.
+    `key` is the label used in the failures list (e.g. "tgju" or "USD@tgju").
+    `configs`, when set, are handed to the scraper so it does not query them again.
+    """
+
+    key: str
+    source: SourceModel
+    symbols: List[str]
+    scraper_cls: type
+    configs: Optional[Sequence] = None
+
+
+@dataclass
+class UnitOutcome:
+    unit: ScrapeUnit
+    ok: bool
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    stats: Optional[ScrapeStats] = None
+
+
+@dataclass
+class _Running:
+    unit: ScrapeUnit
+    started: float
+    scraper: Optional[object] = None
+    aborted: bool = False
+
+
+class ParallelExecutor:
+    """
+    Runs ScrapeUnits on a bounded thread pool.
+
+    - Every unit builds its own scraper (and therefore its own WebDriver).
+    - Sources are isolated: a source may occupy at most `per_source` workers at a
+      time, and pending units are dispatched round-robin across sources, so one
+      slow site cannot starve the others.
+    - `deadline` (seconds) bounds the whole run. When it passes, pending units are
+      cancelled, running scrapers are asked to abort (their driver is quit), and
+      anything still alive after `grace` seconds is reported as a failure.
+      Aborted units that return within the grace period fail too ("stopped at
+      deadline"), but keep their stats: what they stored before the stop is in
+      stats.succeeded, the configs they never reached in stats.skipped_symbols.
+
+    Callbacks (on_start / on_success / on_failure) are always invoked from the
+    calling thread, so command output stays ordered. on_success and on_failure
+    also get the scraper's stats (None when it did not return): a unit
+    "succeeds" when scrape() returns without being aborted, even if some of its
+    configs failed (stats.failed_symbols).
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        deadline: Optional[float] = None,
+        grace: float = 10.0,
+        per_source: Optional[int] = None,
+    ):
+        self.workers = max(1, int(workers))
+        self.deadline = deadline if deadline and deadline > 0 else None
+        self.grace = max(0.0, grace)
+        self.per_source = per_source
+
+    # -------------------- internals --------------------
+
+    def _source_cap(self, n_sources: int) -> int:
+        if self.per_source:
+            return max(1, self.per_source)
+        return max(1, math.ceil(self.workers / max(1, n_sources)))
+
+    @staticmethod
+    def _run_unit(unit: ScrapeUnit, build: Callable, state: _Running):
+        try:
+            scraper = build(unit)
+            state.scraper = scraper
+            if state.aborted:
+                raise RuntimeError("cancelled before start")
+            return scraper.scrape()  # type: ignore
+        finally:
+            # Worker threads own their DB connections; release them per unit.
+            connections.close_all()
+
+    # -------------------- entrypoint --------------------
+
+    def run(
+        self,
+        units: List[ScrapeUnit],
+        build: Callable[[ScrapeUnit], object],
+        on_start: Optional[Callable[[ScrapeUnit], None]] = None,
+        on_success: Optional[
+            Callable[[ScrapeUnit, Optional[ScrapeStats]], None]
+        ] = None,
+        on_failure: Optional[
+            Callable[[ScrapeUnit, str, Optional[ScrapeStats]], None]
+        ] = None,
+    ) -> List[UnitOutcome]:
+        if not units:
+            return []
+
+        # Per-source queues, preserving the original order inside each source
+        queues: Dict[str, Deque[ScrapeUnit]] = {}
+        for unit in units:
+            queues.setdefault(unit.source.name, deque()).append(unit)
+        order = list(queues.keys())
+        cap = self._source_cap(len(order))
+        busy: Dict[str, int] = {name: 0 for name in order}
+
+        outcomes: List[UnitOutcome] = []
+        running: Dict[Future, _Running] = {}
+        started_at = time.monotonic()
+        cursor = 0
+
+        def finish(
+            state: _Running,
+            ok: bool,
+            error: Optional[str] = None,
+            stats: Optional[ScrapeStats] = None,
+        ):
+            busy[state.unit.source.name] -= 1
+            elapsed = time.monotonic() - state.started
+            outcomes.append(UnitOutcome(state.unit, ok, error, elapsed, stats))
+            if ok and on_success:
+                on_success(state.unit, stats)
+            elif not ok and on_failure:
+                on_failure(state.unit, error or "unknown error", stats)
+
+        def next_unit() -> Optional[ScrapeUnit]:
+            nonlocal cursor
+            for i in range(len(order)):
+                name = order[(cursor + i) % len(order)]
+                if queues[name] and busy[name] < cap:
+                    cursor = (cursor + i + 1) % len(order)
+                    return queues[name].popleft()
+            return None
+
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="scrape")
+        try:
+            while True:
+                # Fill free workers
+                while len(running) < self.workers:
+                    unit = next_unit()
+                    if unit is None:
+                        break
+                    busy[unit.source.name] += 1
+                    if on_start:
+                        on_start(unit)
+                    state = _Running(unit=unit, started=time.monotonic())
+                    running[pool.submit(self._run_unit, unit, build, state)] = state
+
+                if not running:
+                    break
+
+                timeout = None
+                if self.deadline is not None:
+                    timeout = self.deadline - (time.monotonic() - started_at)
+                    if timeout <= 0:
+                        break
+
+                done, _ = wait(
+                    list(running.keys()), timeout=timeout, return_when=FIRST_COMPLETED
+                )
+                for fut in done:
+                    state = running.pop(fut)
+                    exc = fut.exception()
+                    if exc is None:
+                        finish(state, True, stats=fut.result())
+                    else:
+                        logger.exception("Scrape unit error", exc_info=exc)
+                        finish(state, False, str(exc))
+
+            # -------------------- deadline reached --------------------
+            if running or any(queues.values()):
+                logger.warning(
+                    f"Scrape deadline of {self.deadline}s reached; "
+                    f"cancelling {len(running)} running and "
+                    f"{sum(len(q) for q in queues.values())} pending unit(s)."
+                )
+
+            for name in order:
+                while queues[name]:
+                    unit = queues[name].popleft()
+                    outcomes.append(UnitOutcome(unit, False, "cancelled: deadline"))
+                    if on_failure:
+                        on_failure(unit, "cancelled: deadline", None)
+
+            for state in running.values():
+                state.aborted = True
+                abort = getattr(state.scraper, "abort", None)
+                if abort:
+                    abort()
+
+            if running:
+                wait(list(running.keys()), timeout=self.grace)
+                for fut, state in running.items():
+                    # Stopped early: whatever was stored is in the stats
+                    if fut.done() and fut.exception() is None:
+                        finish(state, False, "stopped at deadline", fut.result())
+                    elif fut.done():
+                        finish(state, False, str(fut.exception()))
+                    else:
+                        finish(state, False, "deadline exceeded")
+                running.clear()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return outcomes
@@ -0,0 +1,246 @@
+import time
+import random
+import asyncio
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from django.conf import settings
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+
+from .corpus import PageCorpus, get_page_corpus
+from .parsing import _FRAGMENT_JS, parse_html, strainer_for
+from .readiness import _PROBE_SCRIPT
+
+logger = logging.getLogger(__name__)
+
+TIMEOUT = "timeout"
+ERROR = "error"
+
+
+class FakeWeb:
+    """
+    The recorded web: pages of the fixture corpus keyed by URL, served with a
+    simulated latency (`latency` plus up to `jitter` seconds) and failures.
+
+    Whether the n-th request of a URL fails (a timeout with `timeout_rate`,
+    any other error with `failure_rate`) and how long it takes only depends on
+    `seed`, the URL and n, so runs are reproducible whatever the thread
+    interleaving. Unknown URLs behave like unreachable hosts.
+    """
+
+    def __init__(
+        self,
+        corpus: PageCorpus,
+        latency: float = 0.2,
+        jitter: float = 0.1,
+        failure_rate: float = 0.0,
+        timeout_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.pages = {url: page.html_path for url, page in corpus.index().items()}
+        self.latency = max(0.0, latency)
+        self.jitter = max(0.0, jitter)
+        self.failure_rate = failure_rate
+        self.timeout_rate = timeout_rate
+        self.seed = seed
+        self._attempts: Dict[str, int] = {}
+        self._html: Dict[str, str] = {}
+        self._soups: Dict[str, object] = {}
+        self._lock = threading.Lock()
+        if not self.pages:
+            logger.warning(
+                f"Fixture corpus at {corpus.root} is empty; every page will fail"
+            )
+
+    def roll(self, url: str) -> Tuple[float, Optional[str]]:
+        """(delay, failure kind or None) of the next request for url."""
+        with self._lock:
+            attempt = self._attempts.get(url, 0)
+            self._attempts[url] = attempt + 1
+        rng = random.Random(f"{self.seed}:{url}:{attempt}")
+        delay = self.latency + rng.uniform(0, self.jitter)
+        draw = rng.random()
+        if draw < self.timeout_rate:
+            return delay, TIMEOUT
+        if draw < self.timeout_rate + self.failure_rate:
+            return delay, ERROR
+        return delay, None
+
+    def html(self, url: str) -> Optional[str]:
+        path = self.pages.get(url)
+        if path is None:
+            return None
+        with self._lock:
+            if url not in self._html:
+                self._html[url] = path.read_text(encoding="utf-8")
+            return self._html[url]
+
+    def soup(self, url: str):
+        """Parsed page (cached; only read afterwards, so threads can share it)."""
+        with self._lock:
+            soup = self._soups.get(url)
+        if soup is None:
+            soup = parse_html(self.html(url) or "")
+            with self._lock:
+                self._soups[url] = soup
+        return soup
+
+
+class _FakeElement:
+    def __init__(self, node):
+        self.node = node
+
+    @property
+    def text(self) -> str:
+        if hasattr(self.node, "get_text"):
+            return self.node.get_text(" ", strip=True)
+        return (self.node.text_content() or "").strip()
+
+
+class FakeWebDriver:
+    """
+    Stand-in for webdriver.Chrome serving FakeWeb pages, for scrape runs
+    without a browser or network. Implements what the scrapers, the readiness
+    probe, fragment extraction and the driver pool use.
+    """
+
+    def __init__(self, web: FakeWeb):
+        self.web = web
+        self._url: Optional[str] = None
+        self._quit = threading.Event()
+
+    def _alive(self):
+        if self._quit.is_set():
+            raise WebDriverException("invalid session id: session deleted")
+
+    def get(self, url: str):
+        self._alive()
+        delay, failure = self.web.roll(url)
+        # quit() from another thread (abort) interrupts the load
+        if self._quit.wait(delay):
+            raise WebDriverException("invalid session id: session deleted")
+        if failure == TIMEOUT:
+            raise TimeoutException(f"Timed out receiving message from renderer: {url}")
+        if failure == ERROR:
+            raise WebDriverException(
+                f"unknown error: net::ERR_CONNECTION_RESET ({url})"
+            )
+        if self.web.html(url) is None:
+            raise WebDriverException(
+                f"unknown error: net::ERR_NAME_NOT_RESOLVED ({url})"
+            )
+        self._url = url
+
+    @property
+    def current_url(self) -> str:
+        self._alive()
+        return self._url or "about:blank"
+
+    @property
+    def page_source(self) -> str:
+        self._alive()
+        return (self.web.html(self._url) if self._url else None) or "<html></html>"
+
+    def _find(self, by: str, value: str) -> List[_FakeElement]:
+        if not self._url:
+            return []
+        if by == By.XPATH:
+            try:
+                import lxml.html
+            except ImportError:
+                # Cannot evaluate XPath without lxml; assume the element is there
+                return [_FakeElement(self.web.soup(self._url))]
+            tree = lxml.html.fromstring(self.web.html(self._url))
+            return [
+                _FakeElement(n) for n in tree.xpath(value) if hasattr(n, "text_content")
+            ]
+        selector = {By.ID: f"#{value}", By.CLASS_NAME: f".{value}"}.get(by, value)
+        return [_FakeElement(n) for n in self.web.soup(self._url).select(selector)]  # type: ignore
+
+    def find_elements(self, by: str = By.ID, value: str = "") -> List[_FakeElement]:
+        self._alive()
+        return self._find(by, value)
+
+    def find_element(self, by: str = By.ID, value: str = "") -> _FakeElement:
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"no such element: {by}={value}")
+        return elements[0]
+
+    def execute_script(self, script: str, *args):
+        self._alive()
+        if script is _PROBE_SCRIPT:
+            # Recorded pages never change: ready as soon as the text is there
+            text = "\n".join(e.text for e in self._find(args[0], args[1]))
+            return [text, 60_000]
+        if script is _FRAGMENT_JS:
+            html = self.web.html(self._url) if self._url else None
+            if not html or strainer_for(args[0]) is None:
+                return ""
+            return str(parse_html(html, args[0]))
+        return None
+
+    def delete_all_cookies(self):
+        self._alive()
+
+    def quit(self):
+        self._quit.set()
+
+
+def fake_transport(web: FakeWeb, is_async: bool = False) -> httpx.MockTransport:
+    """httpx transport answering from FakeWeb, with the same latency and failures."""
+
+    def respond(request: httpx.Request, failure: Optional[str]) -> httpx.Response:
+        url = str(request.url)
+        if failure == TIMEOUT:
+            raise httpx.ReadTimeout(f"Timed out reading {url}", request=request)
+        if failure == ERROR:
+            raise httpx.ConnectError(f"Connection reset by {url}", request=request)
+        html = web.html(url)
+        if html is None:
+            return httpx.Response(404, text="Not recorded", request=request)
+        return httpx.Response(200, text=html, request=request)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        delay, failure = web.roll(str(request.url))
+        time.sleep(delay)
+        return respond(request, failure)
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        delay, failure = web.roll(str(request.url))
+        await asyncio.sleep(delay)
+        return respond(request, failure)
+
+    return httpx.MockTransport(async_handler if is_async else handler)
+
+
+def fake_enabled(backend: Optional[str] = None) -> bool:
+    """Whether `backend` (SCRAPING_DRIVER when None) is the fake web."""
+    return (backend or settings.SCRAPING_DRIVER) == "fake"
+
+
+_shared_web: Optional[FakeWeb] = None
+_shared_web_lock = threading.Lock()
+
+
+def get_fake_web() -> FakeWeb:
+    """Process-wide FakeWeb over the fixture corpus, built from settings."""
+    global _shared_web
+    with _shared_web_lock:
+        if _shared_web is None:
+            _shared_web = FakeWeb(
+                get_page_corpus(),
+                latency=settings.SCRAPING_FAKE_LATENCY,
+                jitter=settings.SCRAPING_FAKE_JITTER,
+                failure_rate=settings.SCRAPING_FAKE_FAILURE_RATE,
+                timeout_rate=settings.SCRAPING_FAKE_TIMEOUT_RATE,
+                seed=settings.SCRAPING_FAKE_SEED,
+            )
+        return _shared_web
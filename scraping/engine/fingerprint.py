@@ -0,0 +1,129 @@
+import json
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from ..models import PriceTickModel, TickFingerprintModel
+
+# (instrument_id, source_id)
+PairKey = Tuple[object, object]
+
+
+def fingerprint(tick: PriceTickModel) -> str:
+    """Stable hash of what a tick says: price, currency and meta."""
+    payload = json.dumps(
+        [str(tick.price), tick.currency, tick.meta or {}],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class ChangeDetector:
+    """
+    Drops ticks whose payload equals the last one written for the same
+    (instrument, source), unless `heartbeat` seconds have passed since that
+    write; the heartbeat tick proves the price is still fresh.
+
+    Last fingerprints live in memory and in TickFingerprintModel (one row per
+    pair), so a new process, e.g. a cron run, needs one query per batch for
+    the pairs it has not seen yet. The row's seen_at is refreshed for dropped
+    ticks too: it is when the pair was last scraped (see engine.cadence).
+    """
+
+    def __init__(self, heartbeat: float = 900.0):
+        self.heartbeat = timedelta(seconds=max(0.0, heartbeat))
+        self._last: Dict[PairKey, Tuple[str, datetime]] = {}
+        self._lock = threading.Lock()
+        self.skipped = 0
+
+    def _load(self, keys: List[PairKey]):
+        missing = [k for k in keys if k not in self._last]
+        if not missing:
+            return
+        wanted = set(missing)
+        rows = TickFingerprintModel.objects.filter(
+            instrument_id__in={k[0] for k in missing},
+            source_id__in={k[1] for k in missing},
+        ).values_list("instrument_id", "source_id", "fingerprint", "written_at")
+        for instrument_id, source_id, fp, written_at in rows:
+            if (instrument_id, source_id) in wanted:
+                self._last[(instrument_id, source_id)] = (fp, written_at)
+
+    def select(
+        self, ticks: List[PriceTickModel]
+    ) -> Tuple[List[PriceTickModel], Dict[PairKey, Tuple[str, datetime]]]:
+        """
+        Return the ticks to write and the fingerprints of every pair in the
+        batch (unchanged pairs keep their last written_at). Pass the latter to
+        save() in the same transaction as the insert.
+        """
+        now = timezone.now()
+        keep: List[PriceTickModel] = []
+        seen: Dict[PairKey, Tuple[str, datetime]] = {}
+        with self._lock:
+            self._load(list({(t.instrument_id, t.source_id) for t in ticks}))
+            for tick in ticks:
+                key = (tick.instrument_id, tick.source_id)
+                fp = fingerprint(tick)
+                last = seen.get(key) or self._last.get(key)
+                if last and last[0] == fp and now - last[1] < self.heartbeat:
+                    self.skipped += 1
+                    seen[key] = last
+                    continue
+                keep.append(tick)
+                seen[key] = (fp, now)
+        return keep, seen
+
+    def save(self, fingerprints: Dict[PairKey, Tuple[str, datetime]]):
+        """Upsert fingerprints; the cache is updated once the transaction commits."""
+        if not fingerprints:
+            return
+        now = timezone.now()
+        TickFingerprintModel.objects.bulk_create(
+            [
+                TickFingerprintModel(
+                    instrument_id=instrument_id,
+                    source_id=source_id,
+                    fingerprint=fp,
+                    written_at=written_at,
+                    seen_at=now,
+                )
+                for (instrument_id, source_id), (fp, written_at) in fingerprints.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["instrument", "source"],
+            update_fields=["fingerprint", "written_at", "seen_at"],
+        )
+        transaction.on_commit(lambda: self._remember(fingerprints))
+
+    def _remember(self, fingerprints: Dict[PairKey, Tuple[str, datetime]]):
+        with self._lock:
+            self._last.update(fingerprints)
+
+    def clear(self):
+        with self._lock:
+            self._last.clear()
+
+
+_shared_detector: Optional[ChangeDetector] = None
+_shared_detector_lock = threading.Lock()
+
+
+def get_change_detector() -> Optional[ChangeDetector]:
+    """Process-wide change detector, or None when SCRAPING_TICK_DEDUPE is off."""
+    global _shared_detector
+    if not settings.SCRAPING_TICK_DEDUPE:
+        return None
+    with _shared_detector_lock:
+        if _shared_detector is None:
+            _shared_detector = ChangeDetector(
+                heartbeat=settings.SCRAPING_TICK_HEARTBEAT
+            )
+        return _shared_detector
@@ -0,0 +1,212 @@
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+from ..models import SourceHealthModel, SourceModel
+from .stats import percentile
+
+logger = logging.getLogger(__name__)
+
+# Page load times kept (and persisted) per source for latency percentiles
+SAMPLE_SIZE = 50
+
+CLOSED = SourceHealthModel.State.CLOSED
+OPEN = SourceHealthModel.State.OPEN
+HALF_OPEN = SourceHealthModel.State.HALF_OPEN
+
+
+@dataclass
+class SourceHealth:
+    """In-memory copy of a SourceHealthModel row."""
+
+    state: str = CLOSED
+    consecutive_failures: int = 0
+    latency_ewma: Optional[float] = None
+    opened_at: Optional[datetime] = None
+    last_success_at: Optional[datetime] = None
+    last_failure_at: Optional[datetime] = None
+    last_error: str = ""
+    dirty: bool = False
+    # Recent page load times, for latency percentiles
+    samples: deque = field(default_factory=lambda: deque(maxlen=SAMPLE_SIZE))
+
+
+class HealthTracker:
+    """
+    Per-source circuit breaker.
+
+    - Every page load reports success (with its latency, folded into an EWMA)
+      or failure. `threshold` consecutive failures open the circuit.
+    - While open, allows() is False: the planner skips the source and scrapers
+      stop loading its pages, so instruments fall back to their next source.
+    - After `cooldown` seconds the source is half-open: it is planned again as
+      a probe. One success closes the circuit, one failure re-opens it.
+
+    State is kept in memory and persisted to SourceHealthModel by save(), so it
+    survives across runs and shows up in the admin. That includes the last
+    SAMPLE_SIZE page load times, so a fresh process computes latency
+    percentiles (the hedge budget) from earlier runs. Thread-safe.
+    """
+
+    def __init__(self, threshold: int = 3, cooldown: float = 300.0, alpha: float = 0.3):
+        self.threshold = max(1, threshold)
+        self.cooldown = timedelta(seconds=max(0.0, cooldown))
+        self.alpha = min(1.0, max(0.01, alpha))
+        self._health: Optional[Dict[object, SourceHealth]] = None
+        self._lock = threading.Lock()
+
+    # -------------------- state --------------------
+
+    def load(self):
+        """(Re)load every source's state from the database (one query)."""
+        health = {}
+        for row in SourceHealthModel.objects.all():
+            health[row.source_id] = SourceHealth(
+                state=row.state,
+                consecutive_failures=row.consecutive_failures,
+                latency_ewma=row.latency_ewma,
+                opened_at=row.opened_at,
+                last_success_at=row.last_success_at,
+                last_failure_at=row.last_failure_at,
+                last_error=row.last_error,
+                samples=deque(row.latency_samples or [], maxlen=SAMPLE_SIZE),
+            )
+        with self._lock:
+            self._health = health
+
+    def _ensure_loaded(self):
+        if self._health is None:
+            self.load()
+
+    def _get(self, source: SourceModel) -> SourceHealth:
+        # Callers hold the lock and have called _ensure_loaded()
+        return self._health.setdefault(source.pk, SourceHealth())  # type: ignore
+
+    def _state(self, health: SourceHealth, now: datetime) -> str:
+        if (
+            health.state == OPEN
+            and health.opened_at
+            and now - health.opened_at >= self.cooldown
+        ):
+            return HALF_OPEN
+        return health.state
+
+    def state(self, source: SourceModel) -> str:
+        self._ensure_loaded()
+        with self._lock:
+            return self._state(self._get(source), timezone.now())
+
+    def allows(self, source: SourceModel) -> bool:
+        """False while the source's circuit is open and cooling down."""
+        return self.state(source) != OPEN
+
+    def reopens_at(self, source: SourceModel) -> Optional[datetime]:
+        self._ensure_loaded()
+        with self._lock:
+            health = self._get(source)
+            if health.state != OPEN or not health.opened_at:
+                return None
+            return health.opened_at + self.cooldown
+
+    def latency(self, source: SourceModel) -> Optional[float]:
+        self._ensure_loaded()
+        with self._lock:
+            return self._get(source).latency_ewma
+
+    def latency_percentile(self, source: SourceModel, pct: float) -> Optional[float]:
+        """pct-th percentile of recent page loads; the EWMA until samples exist."""
+        self._ensure_loaded()
+        with self._lock:
+            health = self._get(source)
+            return percentile(list(health.samples), pct) or health.latency_ewma
+
+    # -------------------- reporting --------------------
+
+    def record_success(self, source: SourceModel, latency: Optional[float] = None):
+        self._ensure_loaded()
+        now = timezone.now()
+        with self._lock:
+            health = self._get(source)
+            if latency is not None:
+                health.samples.append(latency)
+                health.latency_ewma = (
+                    latency
+                    if health.latency_ewma is None
+                    else self.alpha * latency + (1 - self.alpha) * health.latency_ewma
+                )
+            if health.state != CLOSED:
+                logger.info(
+                    f"Circuit for {source.name} closed after a successful probe"
+                )
+            health.state = CLOSED
+            health.opened_at = None
+            health.consecutive_failures = 0
+            health.last_success_at = now
+            health.dirty = True
+
+    def record_failure(self, source: SourceModel, error: str = ""):
+        self._ensure_loaded()
+        now = timezone.now()
+        with self._lock:
+            health = self._get(source)
+            state = self._state(health, now)
+            health.consecutive_failures += 1
+            health.last_failure_at = now
+            health.last_error = error[:255]
+            health.dirty = True
+            if state == HALF_OPEN or (
+                state == CLOSED and health.consecutive_failures >= self.threshold
+            ):
+                health.state = OPEN
+                health.opened_at = now
+                logger.warning(
+                    f"Circuit for {source.name} opened after "
+                    f"{health.consecutive_failures} consecutive failure(s); "
+                    f"cooling down for {self.cooldown.total_seconds():.0f}s"
+                )
+
+    def save(self):
+        """Persist states changed since the last save."""
+        with self._lock:
+            if not self._health:
+                return
+            dirty = {pk: h for pk, h in self._health.items() if h.dirty}
+            for health in dirty.values():
+                health.dirty = False
+        for source_id, health in dirty.items():
+            SourceHealthModel.objects.update_or_create(
+                source_id=source_id,
+                defaults={
+                    "state": health.state,
+                    "consecutive_failures": health.consecutive_failures,
+                    "latency_ewma": health.latency_ewma,
+                    "opened_at": health.opened_at,
+                    "last_success_at": health.last_success_at,
+                    "last_failure_at": health.last_failure_at,
+                    "last_error": health.last_error,
+                    "latency_samples": list(health.samples),
+                },
+            )
+
+
+_shared_tracker: Optional[HealthTracker] = None
+_shared_tracker_lock = threading.Lock()
+
+
+def get_health_tracker() -> HealthTracker:
+    """Process-wide health tracker built from settings."""
+    global _shared_tracker
+    with _shared_tracker_lock:
+        if _shared_tracker is None:
+            _shared_tracker = HealthTracker(
+                threshold=settings.SCRAPING_BREAKER_THRESHOLD,
+                cooldown=settings.SCRAPING_BREAKER_COOLDOWN,
+                alpha=settings.SCRAPING_HEALTH_EWMA_ALPHA,
+            )
+        return _shared_tracker
@@ -0,0 +1,142 @@
+import time
+import logging
+from dataclasses import dataclass, field
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.db import connections
+
+from .ingestion import TickRecord
+from .stats import ScrapeStats
+
+logger = logging.getLogger(__name__)
+
+
+class _Collector:
+    """Stands in for the tick writer, so a contender's ticks are only kept if it wins."""
+
+    def __init__(self):
+        self.records: List[TickRecord] = []
+
+    def submit(self, records) -> int:
+        records = list(records)
+        self.records.extend(records)
+        return len(records)
+
+
+@dataclass
+class HedgeOutcome:
+    symbol: str
+    winner: Optional[str] = None  # source name of the first valid price
+    hedged: bool = False  # the fallback source was started
+    budget: float = 0.0
+    elapsed: float = 0.0
+    saved: int = 0
+    stats: List[ScrapeStats] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.winner is not None
+
+
+class HedgedExecutor:
+    """
+    Races an instrument's default source against its first fallback.
+
+    The default config is scraped first. If it has not produced a valid price
+    within `budget_for(default source)` seconds, or failed before that, the
+    fallback config is started too. The first contender with a valid price
+    wins: its ticks are stored, the other scraper is aborted and whatever it
+    collected is dropped.
+
+    `build(config, collector)` returns a scraper for one config that hands its
+    ticks to `collector`; `store(records)` persists the winner's ticks.
+    """
+
+    def __init__(
+        self,
+        build: Callable,
+        store: Callable[[List[TickRecord]], int],
+        budget_for: Callable[[object], float],
+        workers: int = 1,
+    ):
+        self.build = build
+        self.store = store
+        self.budget_for = budget_for
+        self.workers = max(1, workers)
+
+    @staticmethod
+    def _scrape(scraper) -> ScrapeStats:
+        try:
+            return scraper.scrape()
+        finally:
+            connections.close_all()
+
+    def _race(self, primary, backup) -> HedgeOutcome:
+        outcome = HedgeOutcome(symbol=primary.instrument.symbol)
+        outcome.budget = self.budget_for(primary.source)
+        started = time.monotonic()
+        contenders: Dict[Future, Tuple[object, _Collector]] = {}
+        pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hedge")
+
+        def start(config):
+            collector = _Collector()
+            scraper = self.build(config, collector)
+            contenders[pool.submit(self._scrape, scraper)] = (scraper, collector)
+
+        def valid(future: Future) -> bool:
+            if future.exception() is not None:
+                return False
+            stats = future.result()
+            if stats is not None:
+                outcome.stats.append(stats)
+            return bool(contenders[future][1].records)
+
+        try:
+            start(primary)
+            pending = set(contenders)
+            done, pending = wait(pending, timeout=outcome.budget)
+            winner = next((f for f in done if valid(f)), None)
+            if winner is None:
+                outcome.hedged = True
+                logger.info(
+                    f"[{outcome.symbol}] {primary.source.name} gave no price within "
+                    f"{outcome.budget:.1f}s; hedging with {backup.source.name}"
+                )
+                start(backup)
+                pending = set(contenders) - done
+            while winner is None and pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                winner = next((f for f in done if valid(f)), None)
+
+            for future, (scraper, _) in contenders.items():
+                if future is not winner and not future.done():
+                    scraper.abort()  # type: ignore
+            if winner is not None:
+                scraper, collector = contenders[winner]
+                outcome.winner = scraper.source.name  # type: ignore
+                outcome.saved = self.store(collector.records)
+        finally:
+            pool.shutdown(wait=True)
+            outcome.elapsed = time.monotonic() - started
+        return outcome
+
+    def run(
+        self, pairs: List[Tuple[object, object]], on_done: Optional[Callable] = None
+    ) -> List[HedgeOutcome]:
+        """Race every (default config, fallback config) pair, `workers` at a time."""
+        outcomes: List[HedgeOutcome] = []
+        if not pairs:
+            return outcomes
+        with ThreadPoolExecutor(self.workers, thread_name_prefix="hedges") as pool:
+            futures = [(pool.submit(self._race, p, b), p) for p, b in pairs]
+            for future, primary in futures:
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    logger.exception(f"Hedged scrape of {primary.instrument.symbol} failed: {e}")  # type: ignore
+                    outcome = HedgeOutcome(symbol=primary.instrument.symbol)  # type: ignore
+                outcomes.append(outcome)
+                if on_done:
+                    on_done(outcome)
+        return outcomes
@@ -0,0 +1,66 @@
+import logging
+import threading
+from typing import Dict, Optional
+
+import httpx
+from django.conf import settings
+
+from .driver_pool import USER_AGENT
+from .fake_web import fake_enabled, fake_transport, get_fake_web
+
+logger = logging.getLogger(__name__)
+
+HTTP_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "fa-IR,fa;q=0.9,en;q=0.8",
+}
+
+_clients: Dict[str, httpx.Client] = {}
+_client_lock = threading.Lock()
+
+
+def get_http_client(backend: Optional[str] = None) -> httpx.Client:
+    """
+    Process-wide httpx client with keep-alive connection pooling, one per
+    driver backend (SCRAPING_DRIVER when None).
+    httpx.Client is thread-safe, so parallel scrapers share one pool.
+    """
+    backend = backend or settings.SCRAPING_DRIVER
+    with _client_lock:
+        client = _clients.get(backend)
+        if client is None or client.is_closed:
+            client = _clients[backend] = httpx.Client(
+                timeout=settings.SCRAPING_HTTP_TIMEOUT,
+                follow_redirects=True,
+                headers=HTTP_HEADERS,
+                limits=httpx.Limits(
+                    max_connections=settings.SCRAPING_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.SCRAPING_HTTP_MAX_CONNECTIONS,
+                    keepalive_expiry=60,
+                ),
+                # Fake backend: answer from the fixture corpus, no network
+                transport=(
+                    fake_transport(get_fake_web()) if fake_enabled(backend) else None
+                ),
+            )
+        return client
+
+
+def close_http_client():
+    with _client_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+def fetch_html(url: str, backend: Optional[str] = None) -> Optional[str]:
+    """GET a page over plain HTTP. Returns None on any transport/HTTP error."""
+    try:
+        response = get_http_client(backend).get(url)
+        response.raise_for_status()
+        return response.text
+    except httpx.HTTPError as e:
+        logger.info(f"HTTP fetch failed for {url}: {e}")
+        return None
@@ -0,0 +1,293 @@
+import time
+import queue
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import OperationalError, connections, transaction
+
+from ..models import InstrumentModel, PriceTickModel, SourceModel
+from .fingerprint import get_change_detector
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TickRecord:
+    """One parsed price, as produced by a scraper and consumed by the writer."""
+
+    symbol: str
+    source: SourceModel
+    price: Any
+    currency: str = "IRR"
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_data(cls, source: SourceModel, data: Dict[str, Any]) -> "TickRecord":
+        return cls(
+            symbol=data["symbol"],
+            source=source,
+            price=data["price"],
+            currency=data.get("currency") or "IRR",
+            meta=data.get("meta") or {},
+        )
+
+
+class InstrumentCache:
+    """
+    symbol -> InstrumentModel, loaded on first use and topped up on misses.
+    Misses are remembered for `miss_ttl` seconds, so a bad symbol does not
+    cost a query per batch but an instrument added later is still picked up.
+    """
+
+    def __init__(self, miss_ttl: float = 60.0):
+        self.miss_ttl = miss_ttl
+        self._map: Dict[str, InstrumentModel] = {}
+        self._missing: Dict[str, float] = {}  # symbol -> monotonic time of the miss
+        self._lock = threading.Lock()
+
+    def resolve(self, symbols: Iterable[str]) -> Dict[str, InstrumentModel]:
+        with self._lock:
+            now = time.monotonic()
+            unknown = {
+                s
+                for s in symbols
+                if s not in self._map
+                and (s not in self._missing or now - self._missing[s] >= self.miss_ttl)
+            }
+            if unknown:
+                found = InstrumentModel.objects.filter(symbol__in=unknown)
+                for inst in found:
+                    self._map[inst.symbol] = inst
+                    self._missing.pop(inst.symbol, None)
+                for symbol in unknown - set(self._map):
+                    self._missing[symbol] = now
+            return self._map
+
+    def clear(self):
+        with self._lock:
+            self._map.clear()
+            self._missing.clear()
+
+
+_instrument_cache = InstrumentCache()
+
+
+def clear_instrument_cache():
+    """Forget cached instruments (reference data was reloaded or a run starts)."""
+    _instrument_cache.clear()
+
+
+def save_ticks(
+    records: List[TickRecord], cache: Optional[InstrumentCache] = None
+) -> int:
+    """
+    Insert records in one transaction. Unknown symbols are logged and skipped,
+    and so are ticks identical to the last one written for their
+    (instrument, source) unless a heartbeat is due (see ChangeDetector).
+    Returns the number of ticks written.
+    """
+    if not records:
+        return 0
+    inst_map = (cache or _instrument_cache).resolve(r.symbol for r in records)
+
+    objs = []
+    for r in records:
+        inst = inst_map.get(r.symbol)
+        if not inst:
+            logger.warning(f"Instrument not found: {r.symbol}")
+            continue
+        objs.append(
+            PriceTickModel(
+                instrument=inst,
+                source=r.source,
+                price=r.price,
+                currency=r.currency,
+                meta=r.meta,
+            )
+        )
+
+    detector = get_change_detector()
+    with transaction.atomic():
+        if detector is not None:
+            objs, fingerprints = detector.select(objs)
+            detector.save(fingerprints)
+        PriceTickModel.objects.bulk_create(objs, ignore_conflicts=True)
+    return len(objs)
+
+
+_STOP = object()
+
+
+class TickWriter:
+    """
+    Single background writer for price ticks (write-behind).
+
+    - Scrapers submit() records into a bounded queue; when it is full they block
+      for up to `put_timeout` seconds (backpressure) instead of piling up memory.
+    - The writer thread coalesces records and inserts them with one bulk_create
+      per batch, flushing once `batch_size` records are buffered or
+      `flush_interval` seconds after the first buffered record.
+    - Being the only writer, it keeps concurrent scrapers from fighting over the
+      SQLite write lock; a locked database is retried with backoff.
+    - Symbols resolve through the process-wide instrument cache (unless `cache`
+      is given), so clear_instrument_cache() on a reload reaches the writer.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        max_queue: int = 1000,
+        put_timeout: float = 30.0,
+        lock_retries: int = 5,
+        cache: Optional[InstrumentCache] = None,
+    ):
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval)
+        self.put_timeout = put_timeout
+        self.lock_retries = lock_retries
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, max_queue))
+        self._cache = cache or _instrument_cache
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self.written = 0
+        self.batches = 0
+        self.failed = 0
+        self.write_seconds = 0.0  # time spent in save_ticks
+
+    # -------------------- producer side --------------------
+
+    def start(self) -> "TickWriter":
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="tick-writer", daemon=True
+                )
+                self._thread.start()
+        return self
+
+    def submit(self, records: Iterable[TickRecord]) -> int:
+        """Queue records for writing; blocks while the queue is full."""
+        if self._closed:
+            raise RuntimeError("Tick writer is closed")
+        self.start()
+        count = 0
+        for record in records:
+            try:
+                self._queue.put(record, timeout=self.put_timeout)
+            except queue.Full:
+                raise RuntimeError(
+                    f"Tick writer queue full for {self.put_timeout}s; writer stalled?"
+                )
+            count += 1
+        return count
+
+    def flush(self):
+        """Block until everything submitted so far has been written."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self):
+        """Write what is left and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join()
+
+    def stats(self) -> Dict[str, int]:
+        detector = get_change_detector()
+        return {
+            "written": self.written,
+            "unchanged": detector.skipped if detector else 0,
+            "batches": self.batches,
+            "failed": self.failed,
+            "queued": self._queue.qsize(),
+        }
+
+    # -------------------- writer thread --------------------
+
+    def _write(self, batch: List[TickRecord]):
+        for attempt in range(self.lock_retries + 1):
+            started = time.monotonic()
+            try:
+                self.written += save_ticks(batch, self._cache)
+                self.batches += 1
+                return
+            except OperationalError as e:
+                if "locked" not in str(e) or attempt == self.lock_retries:
+                    raise
+            finally:
+                self.write_seconds += time.monotonic() - started
+            delay = min(2.0, 0.1 * 2**attempt)
+            logger.warning(f"Database locked; retrying tick batch in {delay}s")
+            time.sleep(delay)
+
+    def _flush(self, batch: List[TickRecord]):
+        if not batch:
+            return
+        try:
+            self._write(batch)
+        except Exception as e:
+            self.failed += len(batch)
+            logger.exception(f"Failed to write {len(batch)} tick(s): {e}")
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+            batch.clear()
+
+    def _run(self):
+        batch: List[TickRecord] = []
+        first_at = 0.0
+        try:
+            while True:
+                timeout = None
+                if batch:
+                    timeout = max(
+                        0.0, first_at + self.flush_interval - time.monotonic()
+                    )
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    self._flush(batch)
+                    continue
+
+                if item is _STOP:
+                    self._flush(batch)
+                    self._queue.task_done()
+                    return
+
+                if not batch:
+                    first_at = time.monotonic()
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    self._flush(batch)
+        finally:
+            connections.close_all()
+
+
+_shared_writer: Optional[TickWriter] = None
+_shared_writer_lock = threading.Lock()
+
+
+def get_tick_writer() -> TickWriter:
+    """Process-wide tick writer built from settings (started on first submit)."""
+    global _shared_writer
+    with _shared_writer_lock:
+        if _shared_writer is None or _shared_writer._closed:
+            _shared_writer = TickWriter(
+                batch_size=settings.SCRAPING_INGEST_BATCH_SIZE,
+                flush_interval=settings.SCRAPING_INGEST_FLUSH_INTERVAL,
+                max_queue=settings.SCRAPING_INGEST_QUEUE_SIZE,
+                put_timeout=settings.SCRAPING_INGEST_PUT_TIMEOUT,
+            )
+        return _shared_writer
@@ -0,0 +1,110 @@
+import re
+import logging
+from functools import lru_cache
+from typing import FrozenSet, Optional, Set
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+from django.conf import settings
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+# One compound selector a SoupStrainer can express: tag, .class, #id, [attr], [attr=value]
+_COMPOUND = re.compile(
+    r"^(?P<tag>[a-zA-Z][\w-]*)?"
+    r"(?P<rest>(?:\.[\w-]+|#[\w-]+|\[[\w-]+(?:=(?:\"[^\"]*\"|'[^']*'|[^\]]*))?\])*)$"
+)
+_PART = re.compile(
+    r"\.([\w-]+)|#([\w-]+)|\[([\w-]+)(?:=(\"[^\"]*\"|'[^']*'|[^\]]*))?\]"
+)
+
+# outerHTML of every match; table parts are returned with their table so the
+# fragment still parses as it did in the page
+_FRAGMENT_JS = """
+const seen = new Set();
+const out = [];
+for (const el of document.querySelectorAll(arguments[0])) {
+    const node = /^(TBODY|THEAD|TFOOT|TR|TD|TH)$/.test(el.tagName)
+        ? (el.closest("table") || el) : el;
+    if (!seen.has(node)) {
+        seen.add(node);
+        out.push(node.outerHTML);
+    }
+}
+return out.join("");
+"""
+
+_warned_parsers: Set[str] = set()
+
+
+def _has_classes(wanted: FrozenSet[str]):
+    def match(value) -> bool:
+        if not value:
+            return False
+        classes = value.split() if isinstance(value, str) else value
+        return wanted <= set(classes)
+
+    return match
+
+
+@lru_cache(maxsize=None)
+def strainer_for(selector: Optional[str]) -> Optional[SoupStrainer]:
+    """
+    SoupStrainer keeping the subtrees matched by the first compound of a CSS
+    selector ("table.prices tbody tr" keeps table.prices), so select_one(selector)
+    still works on the strained soup. None when the selector is too complex.
+    """
+    if not selector or any(c in selector for c in ",+~:"):
+        return None
+    first = re.split(r"\s*>\s*|\s+", selector.strip())[0]
+    match = _COMPOUND.match(first)
+    if not match:
+        return None
+    attrs = {}
+    classes = set()
+    for cls, id_, attr, value in _PART.findall(match.group("rest")):
+        if cls:
+            classes.add(cls)
+        elif id_:
+            attrs["id"] = id_
+        elif attr:
+            attrs[attr] = value.strip("\"'") if value else True
+    if classes:
+        attrs["class"] = _has_classes(frozenset(classes))
+    if not match.group("tag") and not attrs:
+        return None
+    return SoupStrainer(match.group("tag") or None, attrs=attrs)
+
+
+def resolve_parser(name: Optional[str] = None) -> str:
+    """The configured BeautifulSoup backend, or html.parser if it is not installed."""
+    name = name or settings.SCRAPING_HTML_PARSER
+    if builder_registry.lookup(name) is None:
+        if name not in _warned_parsers:
+            _warned_parsers.add(name)
+            logger.warning(f"HTML parser '{name}' is not installed; using html.parser")
+        return "html.parser"
+    return name
+
+
+def parse_html(
+    html: str, fragment: Optional[str] = None, parser: Optional[str] = None
+) -> BeautifulSoup:
+    """
+    Parse html with the configured backend. With a fragment selector only the
+    matching subtrees are built, which is much cheaper than the whole document.
+    """
+    parser = resolve_parser(parser)
+    strainer = strainer_for(fragment) if parser != "html5lib" else None
+    return BeautifulSoup(html, parser, parse_only=strainer)
+
+
+def fragment_html(driver, selector: str) -> Optional[str]:
+    """outerHTML of the elements matching selector, or None (use page_source)."""
+    try:
+        html = driver.execute_script(_FRAGMENT_JS, selector)
+    except WebDriverException as e:
+        logger.debug(f"Could not extract fragment '{selector}': {e}")
+        return None
+    return html if isinstance(html, str) and html else None
@@ -0,0 +1,395 @@
+import logging
+from dataclasses import dataclass
+from typing import Collection, Dict, List, Optional, Tuple
+
+from django.db import connection
+from django.utils import timezone
+
+from ..models import InstrumentModel, SourceConfigModel, SourceModel
+from .cadence import Cadence, CadencePolicy
+from .health import HealthTracker
+
+logger = logging.getLogger(__name__)
+
+ALL = "__ALL__"
+
+
+class _QueryCounter:
+    """connection.execute_wrapper hook that counts the queries run inside it."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def page_key(cfg: SourceConfigModel) -> str:
+    """The page a config is read from (its listing page when it has a row_key)."""
+    if cfg.source.listing_path and cfg.row_key:
+        return cfg.source.listing_path
+    return cfg.path
+
+
+class PlanError(Exception):
+    """The requested scope cannot be planned (unknown/disabled instrument or source)."""
+
+
+@dataclass(frozen=True)
+class PlanUnit:
+    """One scraper session: a source and the configs (pages) it should visit."""
+
+    source: SourceModel
+    configs: Tuple[SourceConfigModel, ...]
+
+    @property
+    def symbols(self) -> Tuple[str, ...]:
+        return tuple(cfg.instrument.symbol for cfg in self.configs)
+
+    @property
+    def pages(self) -> int:
+        """Expected page loads: configs read from the same listing page share one."""
+        return len({page_key(cfg) for cfg in self.configs})
+
+    def split(self, parts: int) -> Tuple["PlanUnit", ...]:
+        """Split into at most `parts` contiguous units of near-equal size."""
+        parts = max(1, min(parts, len(self.configs)))
+        if parts == 1:
+            return (self,)
+        size = -(-len(self.configs) // parts)  # ceil division
+        return tuple(
+            PlanUnit(self.source, self.configs[i : i + size])
+            for i in range(0, len(self.configs), size)
+        )
+
+
+@dataclass(frozen=True)
+class ScrapePlan:
+    """
+    Immutable result of scope resolution.
+    `scope` is "source" or "instrument"; `warnings` lists skipped targets and
+    are reported separately from explain(). `hedges` holds (default, fallback)
+    config pairs of hedged instruments; those are not part of `units`.
+    `fresh` holds the configs left out because they were scraped recently.
+    """
+
+    scope: str
+    units: Tuple[PlanUnit, ...]
+    warnings: Tuple[str, ...] = ()
+    queries: int = 0
+    hedges: Tuple[Tuple[SourceConfigModel, SourceConfigModel], ...] = ()
+    fresh: Tuple[Tuple[SourceConfigModel, Cadence], ...] = ()
+
+    @property
+    def pages(self) -> int:
+        return sum(unit.pages for unit in self.units) + len(self.hedges)
+
+    def explain(self) -> List[str]:
+        """Human-readable plan, one line per unit."""
+        lines = [
+            f"Plan ({self.scope} scope): {len(self.units)} unit(s), "
+            f"{self.pages} page(s), planned in {self.queries} queries"
+            + (f", {len(self.fresh)} fresh config(s) skipped" if self.fresh else "")
+        ]
+        width = max((len(u.source.name) for u in self.units), default=0)
+        for unit in self.units:
+            lines.append(
+                f"  {unit.source.name:<{width}}  {unit.pages:>3} page(s)  "
+                f"{', '.join(unit.symbols)}"
+            )
+        for primary, backup in self.hedges:
+            lines.append(
+                f"  hedge {primary.instrument.symbol}: {primary.source.name}, "
+                f"then {backup.source.name} after the latency budget"
+            )
+        now = timezone.now()
+        for cfg, cadence in self.fresh:
+            lines.append(
+                f"  fresh {cfg.instrument.symbol}@{cfg.source.name}: "
+                f"due in {cadence.due_in(now):.0f}s (interval {cadence.interval:.0f}s)"
+            )
+        return lines
+
+
+class PlanCompiler:
+    """
+    Resolves --source / --instrument scopes into a ScrapePlan with a fixed number
+    of queries (enabled instruments, enabled sources, their configs), whatever the
+    number of instruments. Selection rules match the scrape command:
+
+    - source scope: every config of the selected source(s).
+    - instrument scope, no source: default-first per instrument (active default
+      source with a config, else the first active configured source).
+    - instrument scope, source ALL: every active configured source.
+    - instrument scope, named source: that source only, if configured.
+
+    `supported` restricts sources to those that have a scraper; others are
+    reported as warnings. With a `health` tracker, sources whose circuit is
+    open are skipped (default-first then falls back to the next configured
+    source); a source named explicitly is still planned, as a manual probe.
+
+    With `hedge`, default-first instruments flagged InstrumentModel.hedge are
+    planned as (default, first fallback) pairs in ScrapePlan.hedges instead.
+
+    With a `cadence` policy, configs scraped less than their current interval
+    ago are left out (ScrapePlan.fresh); hedges go with their default config.
+    """
+
+    def __init__(
+        self,
+        supported: Collection[str],
+        health: Optional[HealthTracker] = None,
+        hedge: bool = False,
+        cadence: Optional[CadencePolicy] = None,
+    ):
+        self.supported = {name.lower() for name in supported}
+        self.health = health
+        self.hedge = hedge
+        self.cadence = cadence
+
+    # -------------------- loading --------------------
+
+    def _sources(self, source_key: Optional[str]) -> List[SourceModel]:
+        qs = SourceModel.objects.filter(enabled=True)
+        if source_key and source_key != ALL:
+            qs = qs.filter(name__iexact=source_key)
+        return list(qs)
+
+    def _instruments(
+        self, symbol: Optional[str], only: Optional[Collection[str]] = None
+    ) -> List[InstrumentModel]:
+        qs = InstrumentModel.objects.filter(enabled=True).select_related(
+            "default_source"
+        )
+        if symbol and symbol != ALL:
+            qs = qs.filter(symbol=symbol.upper())
+        if only is not None:
+            qs = qs.filter(symbol__in=list(only))
+        return list(qs)
+
+    def _configs(
+        self, sources: List[SourceModel], symbol: Optional[str] = None
+    ) -> List[SourceConfigModel]:
+        qs = (
+            SourceConfigModel.objects.filter(
+                source__in=[s.pk for s in sources], instrument__enabled=True
+            )
+            .select_related("source", "instrument")
+            .order_by("instrument__symbol", "source__name")
+        )
+        if symbol and symbol != ALL:
+            qs = qs.filter(instrument__symbol=symbol.upper())
+        return list(qs)
+
+    # -------------------- compiling --------------------
+
+    def compile(
+        self,
+        instrument: Optional[str] = None,
+        source: Optional[str] = None,
+        only: Optional[Collection[str]] = None,
+    ) -> ScrapePlan:
+        """
+        instrument / source take the command's option values:
+        None (flag absent), ALL (flag without value) or a symbol / name.
+        `only` further restricts an instrument scope to these symbols.
+        """
+        if instrument is None and source is None:
+            raise PlanError("Provide a source or an instrument scope.")
+
+        hedges: List[Tuple[SourceConfigModel, SourceConfigModel]] = []
+        fresh: List[Tuple[SourceConfigModel, Cadence]] = []
+        counter = _QueryCounter()
+        with connection.execute_wrapper(counter):
+            if instrument is None:
+                scope = "source"
+                units, warnings = self._source_scope(source)  # type: ignore
+            else:
+                scope = "instrument"
+                units, warnings = self._instrument_scope(
+                    instrument, source, only, hedges
+                )
+            if self.cadence is not None:
+                units, hedges = self._stale_only(units, hedges, fresh)
+
+        plan = ScrapePlan(
+            scope=scope,
+            units=tuple(units),
+            warnings=tuple(warnings),
+            queries=counter.count,
+            hedges=tuple(hedges),
+            fresh=tuple(fresh),
+        )
+        logger.debug(
+            f"Compiled {scope} plan: {len(plan.units)} unit(s), {plan.pages} page(s) "
+            f"in {plan.queries} queries"
+        )
+        return plan
+
+    def _stale_only(
+        self,
+        units: List[PlanUnit],
+        hedges: List[Tuple[SourceConfigModel, SourceConfigModel]],
+        fresh: List[Tuple[SourceConfigModel, Cadence]],
+    ):
+        """Drop configs (and hedges) whose last scrape is still fresh."""
+        configs = [cfg for unit in units for cfg in unit.configs]
+        configs += [primary for primary, _ in hedges]
+        _, cadences = self.cadence.stale(configs)  # type: ignore
+        fresh.extend((cfg, cadences[cfg.pk]) for cfg in configs if cfg.pk in cadences)
+
+        stale_units = []
+        for unit in units:
+            due = tuple(cfg for cfg in unit.configs if cfg.pk not in cadences)
+            if due:
+                stale_units.append(PlanUnit(unit.source, due))
+        stale_hedges = [pair for pair in hedges if pair[0].pk not in cadences]
+        return stale_units, stale_hedges
+
+    def _supported(self, sources: List[SourceModel], warnings: List[str]):
+        usable = []
+        for src in sources:
+            if src.name.lower() in self.supported:
+                usable.append(src)
+            else:
+                warnings.append(f"No scraper defined for source '{src.name}'")
+        return usable
+
+    def _healthy(
+        self, sources: List[SourceModel], source_key: Optional[str], warnings: List[str]
+    ) -> List[SourceModel]:
+        """Drop sources with an open circuit, unless the source was named explicitly."""
+        if self.health is None or source_key not in (None, ALL):
+            return sources
+        healthy = []
+        for src in sources:
+            if self.health.allows(src):
+                healthy.append(src)
+                continue
+            reopens = self.health.reopens_at(src)
+            warnings.append(
+                f"[{src.name}] circuit open; skipping"
+                + (f" until {timezone.localtime(reopens):%H:%M:%S}" if reopens else "")
+            )
+        return healthy
+
+    def _source_scope(self, source_key: str) -> Tuple[List[PlanUnit], List[str]]:
+        warnings: List[str] = []
+        sources = self._sources(source_key)
+        if source_key != ALL and not sources:
+            raise PlanError(f"Source '{source_key}' not found or disabled.")
+        sources = self._healthy(
+            self._supported(sources, warnings), source_key, warnings
+        )
+
+        by_source: Dict[str, List[SourceConfigModel]] = {s.name: [] for s in sources}
+        for cfg in self._configs(sources) if sources else []:
+            by_source[cfg.source.name].append(cfg)
+
+        units: List[PlanUnit] = []
+        for src in sources:
+            if not by_source[src.name]:
+                warnings.append(f"[{src.name}] no configured instruments")
+                continue
+            units.append(PlanUnit(src, tuple(by_source[src.name])))
+        return units, warnings
+
+    def _instrument_scope(
+        self,
+        symbol: str,
+        source_key: Optional[str],
+        only: Optional[Collection[str]] = None,
+        hedges: Optional[List] = None,
+    ) -> Tuple[List[PlanUnit], List[str]]:
+        warnings: List[str] = []
+        instruments = self._instruments(symbol, only)
+        if not instruments and only is not None:
+            return [], warnings
+        if not instruments:
+            if symbol != ALL:
+                raise PlanError(f"Instrument '{symbol}' not found or disabled.")
+            raise PlanError("No enabled instruments found.")
+
+        sources = self._sources(source_key)
+        if source_key not in (None, ALL) and not sources:
+            warnings.append(f"Source '{source_key}' not found/disabled; nothing to do.")
+            return [], warnings
+        supported = self._supported(sources, warnings)
+        sources = self._healthy(supported, source_key, warnings)
+        supported_pks = {s.pk for s in sources}
+        open_pks = {s.pk for s in supported} - supported_pks
+
+        by_instrument: Dict[str, List[SourceConfigModel]] = {}
+        for cfg in self._configs(sources, symbol) if sources else []:
+            by_instrument.setdefault(cfg.instrument.symbol, []).append(cfg)
+
+        # source name -> (source, configs) in instrument order
+        batches: Dict[str, Tuple[SourceModel, List[SourceConfigModel]]] = {}
+        for inst in instruments:
+            cfgs = by_instrument.get(inst.symbol, [])
+            if source_key is None:
+                picked = self._default_first(
+                    inst, cfgs, supported_pks, warnings, open_pks
+                )
+                if picked is None:
+                    warnings.append(
+                        f"[{inst.symbol}] no active default or fallback source; skipping."
+                    )
+                    continue
+                backup = next(
+                    (c for c in cfgs if c.source_id != picked.source_id), None
+                )
+                if self.hedge and inst.hedge and backup and hedges is not None:
+                    hedges.append((picked, backup))
+                    continue
+                cfgs = [picked]
+            elif not cfgs:
+                warnings.append(
+                    f"[{inst.symbol}] no active configured sources; skipping."
+                    if source_key == ALL
+                    else f"[{inst.symbol}] not configured for source '{source_key}'; skipping."
+                )
+                continue
+
+            for cfg in cfgs:
+                if cfg.source.name not in batches:
+                    batches[cfg.source.name] = (cfg.source, [])
+                batches[cfg.source.name][1].append(cfg)
+
+        units = [PlanUnit(src, tuple(cfgs)) for src, cfgs in batches.values()]
+        return units, warnings
+
+    @staticmethod
+    def _default_first(
+        inst: InstrumentModel,
+        cfgs: List[SourceConfigModel],
+        supported_pks: set,
+        warnings: List[str],
+        open_pks: Collection = (),
+    ) -> Optional[SourceConfigModel]:
+        default = inst.default_source
+        if default and default.enabled and default.pk in supported_pks:
+            for cfg in cfgs:
+                if cfg.source_id == default.pk:
+                    return cfg
+            warnings.append(
+                f"[{inst.symbol}] default source '{default.name}' has no config; "
+                f"falling back."
+            )
+        elif default and default.pk in open_pks and cfgs:
+            warnings.append(
+                f"[{inst.symbol}] default source '{default.name}' circuit open; "
+                f"falling back to {cfgs[0].source.name}."
+            )
+        return cfgs[0] if cfgs else None
+
+
+def compile_plan(
+    supported: Collection[str],
+    instrument: Optional[str] = None,
+    source: Optional[str] = None,
+    health: Optional[HealthTracker] = None,
+) -> ScrapePlan:
+    """Shortcut for PlanCompiler(supported, health).compile(instrument, source)."""
+    return PlanCompiler(supported, health).compile(instrument=instrument, source=source)
@@ -0,0 +1,304 @@
+import os
+import sys
+import time
+import pstats
+import logging
+import cProfile
+import threading
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import psutil
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Frames kept per allocation; the report groups by allocating line only, and
+# deeper tracebacks make traced runs several times slower
+TRACEMALLOC_FRAMES = 1
+# A new peak snapshot is taken when traced memory grows this much past the last
+# one (snapshots hold the GIL while they copy every trace)
+PEAK_SNAPSHOT_GROWTH = 1.5
+
+# Where thread time goes, by the file of the function (builtins: of their caller).
+# First match wins.
+AREAS: List[Tuple[str, Tuple[str, ...]]] = [
+    ("normalization", (f"scraping{os.sep}utils{os.sep}",)),
+    ("parsing", (f"{os.sep}bs4{os.sep}", "soupsieve", f"html{os.sep}parser", "lxml")),
+    ("orm", (f"django{os.sep}db{os.sep}", "sqlite3")),
+    (
+        "browser / network",
+        (
+            "selenium",
+            "urllib3",
+            "httpx",
+            "httpcore",
+            f"http{os.sep}client",
+            "socket",
+            "ssl",
+        ),
+    ),
+    (
+        "waiting",
+        (
+            "threading.py",
+            "queue.py",
+            "selectors.py",
+            f"concurrent{os.sep}futures",
+            "asyncio",
+        ),
+    ),
+    ("scraping", (f"{os.sep}scraping{os.sep}",)),
+]
+
+
+def area_of(filename: str) -> str:
+    for area, needles in AREAS:
+        if any(n in filename for n in needles):
+            return area
+    return "other"
+
+
+def time_by_area(stats: pstats.Stats) -> Dict[str, float]:
+    """
+    Own (tottime) seconds per area, summed over threads. Time spent in C
+    builtins (socket reads, lock waits, sleeps) goes to the area of the caller,
+    so waiting on Chrome shows up as browser time.
+    """
+    areas: Dict[str, float] = {}
+    for (filename, _, _), (_, _, tt, _, callers) in stats.stats.items():  # type: ignore
+        if filename != "~":
+            areas[area_of(filename)] = areas.get(area_of(filename), 0.0) + tt
+            continue
+        for (caller_file, _, _), caller_stats in callers.items():
+            area = area_of(caller_file)
+            areas[area] = areas.get(area, 0.0) + caller_stats[2]
+    return dict(sorted(areas.items(), key=lambda kv: kv[1], reverse=True))
+
+
+@dataclass
+class RssSample:
+    elapsed: float
+    python: int
+    chromedriver: int
+    chrome: int
+    other: int
+    children: int
+
+
+@dataclass
+class ProfileReport:
+    """Files written by a RunProfiler and the headline numbers of the run."""
+
+    pstats_path: Path
+    report_path: Path
+    rss_path: Path
+    wall: float = 0.0
+    areas: Dict[str, float] = field(default_factory=dict)
+    traced_peak: int = 0
+    rss_peaks: Dict[str, int] = field(default_factory=dict)
+
+
+class RunProfiler:
+    """
+    CPU and memory profile of one command run, for production boxes where the
+    code cannot be patched:
+
+    - cProfile over every thread of the run (workers, the pipeline parser,
+      the tick writer), merged into one pstats file;
+    - tracemalloc snapshots at the largest traced size seen and at the end,
+      reported as the top allocation sites;
+    - RSS of this process and of its chromedriver / Chrome children, sampled
+      every `interval` seconds into a CSV.
+
+    Threads started before start() are not profiled. Everything is slower
+    while profiling (tracemalloc mostly), so timings are relative, not absolute.
+    """
+
+    def __init__(
+        self, out_dir, label: str = "scrape", interval: float = 0.5, top: int = 25
+    ):
+        self.out_dir = Path(out_dir)
+        self.label = label
+        self.interval = max(0.05, interval)
+        self.top = top
+        self.samples: List[RssSample] = []
+        self._profiles: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._peak_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._peak_size = 0
+        self._started = 0.0
+
+    # -------------------- lifecycle --------------------
+
+    def _profile_thread(self, *args):
+        # threading.setprofile hook: runs once in each new thread, then the
+        # thread's own profiler replaces it
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        profile.enable()
+
+    def start(self):
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self._started = time.monotonic()
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        self._sampler = threading.Thread(
+            target=self._sample_loop, name="profile-rss", daemon=True
+        )
+        self._sampler.start()
+
+        main = cProfile.Profile()
+        self._profiles.append(main)
+        if sys.version_info < (3, 12):
+            # cProfile only sees the thread that enabled it before 3.12
+            threading.setprofile(self._profile_thread)
+        main.enable()
+
+    def stop(self) -> ProfileReport:
+        self._profiles[0].disable()
+        threading.setprofile(None)  # type: ignore
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        wall = time.monotonic() - self._started
+
+        end_snapshot = tracemalloc.take_snapshot()
+        traced_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        base = self.out_dir / f"{self.label}-{timezone.localtime():%Y%m%d-%H%M%S}"
+        report = ProfileReport(
+            pstats_path=base.with_suffix(".pstats"),
+            report_path=base.with_suffix(".txt"),
+            rss_path=base.with_suffix(".rss.csv"),
+            wall=wall,
+            traced_peak=traced_peak,
+        )
+
+        stats = None
+        for profile in self._profiles:
+            profile.create_stats()
+            if not profile.stats:  # type: ignore
+                continue
+            if stats is None:
+                stats = pstats.Stats(profile)
+            else:
+                stats.add(profile)
+        if stats is not None:
+            stats.dump_stats(report.pstats_path)
+            report.areas = time_by_area(stats)
+
+        self._write_rss(report)
+        self._write_report(report, stats, end_snapshot)
+        return report
+
+    # -------------------- sampling --------------------
+
+    @staticmethod
+    def _own_traces_removed(snapshot: tracemalloc.Snapshot) -> tracemalloc.Snapshot:
+        return snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+                tracemalloc.Filter(False, "<unknown>"),
+            ]
+        )
+
+    def _sample(self, process: psutil.Process) -> RssSample:
+        sizes = {"chromedriver": 0, "chrome": 0, "other": 0}
+        children = process.children(recursive=True)
+        for child in children:
+            try:
+                name = child.name().lower()
+                rss = child.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            if "chromedriver" in name:
+                sizes["chromedriver"] += rss
+            elif "chrome" in name or "chromium" in name:
+                sizes["chrome"] += rss
+            else:
+                sizes["other"] += rss
+        return RssSample(
+            elapsed=time.monotonic() - self._started,
+            python=process.memory_info().rss,
+            children=len(children),
+            **sizes,
+        )
+
+    def _sample_loop(self):
+        process = psutil.Process()
+        while True:
+            try:
+                self.samples.append(self._sample(process))
+            except psutil.Error as e:
+                logger.debug(f"RSS sample failed: {e}")
+            size = tracemalloc.get_traced_memory()[0]
+            if size > max(self._peak_size * PEAK_SNAPSHOT_GROWTH, 1 << 20):
+                self._peak_snapshot = tracemalloc.take_snapshot()
+                self._peak_size = size
+            if self._stop.wait(self.interval):
+                return
+
+    # -------------------- output --------------------
+
+    def _write_rss(self, report: ProfileReport):
+        kinds = ("python", "chromedriver", "chrome", "other")
+        lines = ["elapsed_s,python_mb,chromedriver_mb,chrome_mb,other_mb,children"]
+        for s in self.samples:
+            sizes = ",".join(f"{getattr(s, k) / 2**20:.1f}" for k in kinds)
+            lines.append(f"{s.elapsed:.2f},{sizes},{s.children}")
+        report.rss_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        report.rss_peaks = {
+            k: max((getattr(s, k) for s in self.samples), default=0) for k in kinds
+        }
+
+    def _allocations(self, title: str, snapshot: tracemalloc.Snapshot) -> List[str]:
+        stats = self._own_traces_removed(snapshot).statistics("lineno")
+        lines = [
+            f"{title}: {sum(s.size for s in stats) / 2**20:.1f} MB in "
+            f"{sum(s.count for s in stats)} blocks"
+        ]
+        for stat in stats[: self.top]:
+            frame = stat.traceback[0]
+            lines.append(
+                f"  {stat.size / 1024:10.1f} KB {stat.count:8d} blocks  "
+                f"{frame.filename}:{frame.lineno}"
+            )
+        return lines
+
+    def _write_report(self, report: ProfileReport, stats, end_snapshot):
+        lines = [f"{self.label} profile, {report.wall:.1f}s wall", ""]
+        lines.append("Thread time by area (own time; builtins count for their caller):")
+        for area, seconds in report.areas.items():
+            lines.append(f"  {area:<20} {seconds:9.2f}s")
+
+        lines += ["", "Peak RSS:"]
+        for kind, size in report.rss_peaks.items():
+            lines.append(f"  {kind:<20} {size / 2**20:9.1f} MB")
+        lines += [
+            "",
+            f"Peak traced Python memory: {report.traced_peak / 2**20:.1f} MB",
+            "",
+        ]
+        if self._peak_snapshot is not None:
+            lines += self._allocations(
+                "Allocations at the largest snapshot", self._peak_snapshot
+            )
+            lines.append("")
+        lines += self._allocations("Allocations still held at the end", end_snapshot)
+        report.report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        if stats is not None:
+            # Top functions, appended in pstats' own format
+            with open(report.report_path, "a", encoding="utf-8") as out:
+                stats.stream = out
+                for order in ("tottime", "cumulative"):
+                    out.write(f"\nTop {self.top} functions by {order}:\n")
+                    stats.sort_stats(order).print_stats(self.top)
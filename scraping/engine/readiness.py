@@ -0,0 +1,63 @@
+import time
+from dataclasses import dataclass
+from typing import Tuple
+
+from selenium.common.exceptions import WebDriverException
+
+# One round-trip per poll: the text of every element matching the locator plus
+# milliseconds since the last DOM mutation (the observer is installed lazily).
+_PROBE_SCRIPT = """
+const by = arguments[0], sel = arguments[1];
+if (!window.__awObserver) {
+  window.__awLastMutation = Date.now();
+  window.__awObserver = new MutationObserver(() => { window.__awLastMutation = Date.now(); });
+  window.__awObserver.observe(document, {subtree: true, childList: true, characterData: true, attributes: true});
+}
+let nodes = [];
+if (by === 'xpath') {
+  const r = document.evaluate(sel, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+  for (let i = 0; i < r.snapshotLength; i++) nodes.push(r.snapshotItem(i));
+} else {
+  nodes = Array.from(document.querySelectorAll(sel));
+}
+const text = nodes.map(n => (n.innerText || n.textContent || '').trim()).join('\\n').trim();
+return [text, Date.now() - window.__awLastMutation];
+"""
+
+
+@dataclass
+class Readiness:
+    elapsed: float
+    settled: bool  # False when the cap was reached first
+
+
+def wait_until_ready(
+    driver,
+    locator: Tuple[str, str],
+    cap: float,
+    poll: float = 0.25,
+    quiet: float = 0.5,
+) -> Readiness:
+    """
+    Wait until the elements behind `locator` hold non-empty text that has stopped
+    changing: either identical across two consecutive polls, or the DOM has been
+    free of mutations for `quiet` seconds. Never waits longer than `cap`.
+    """
+    by, selector = locator
+    started = time.monotonic()
+    previous = None
+
+    while True:
+        try:
+            text, quiet_ms = driver.execute_script(_PROBE_SCRIPT, by, selector)
+        except WebDriverException:
+            text, quiet_ms = "", 0
+
+        elapsed = time.monotonic() - started
+        if text and (text == previous or (quiet_ms or 0) / 1000.0 >= quiet):
+            return Readiness(elapsed, True)
+        previous = text
+
+        if elapsed >= cap:
+            return Readiness(elapsed, False)
+        time.sleep(min(poll, cap - elapsed))
@@ -0,0 +1,108 @@
+import logging
+from datetime import timedelta
+from typing import Iterable, List
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+
+from ..models import RefreshRequestModel, TickFingerprintModel
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "scraping:refresh:"
+
+
+def request_refresh(instruments: Iterable) -> int:
+    """
+    Read-through refresh: enqueue an on-demand scrape (RefreshRequestModel)
+    for each instrument whose `latest_timestamp`, as annotated by the API and
+    bot queries, is older than SCRAPING_FRESHNESS_SLA. Returns how many were
+    enqueued.
+
+    Meant to be called on every read, after the rows were fetched: fresh rows
+    cost nothing, and a stale instrument is looked at once per
+    SCRAPING_REFRESH_DEDUPE seconds per cache (cache.add lets one caller
+    through), so a burst of stale reads makes one request. The one-row-per-
+    instrument constraint dedupes across processes that do not share a cache.
+    Errors are logged, never raised: the reader still gets the stale value.
+    """
+    if not settings.SCRAPING_REFRESH_ON_READ:
+        return 0
+    try:
+        return _enqueue_stale(instruments)
+    except Exception as e:
+        logger.exception(f"Could not enqueue refresh of stale instruments: {e}")
+        return 0
+
+
+def _enqueue_stale(instruments: Iterable) -> int:
+    now = timezone.now()
+    cutoff = now - timedelta(seconds=settings.SCRAPING_FRESHNESS_SLA)
+    stale = {
+        inst.pk: inst
+        for inst in instruments
+        if getattr(inst, "latest_timestamp", None) is None
+        or inst.latest_timestamp < cutoff
+    }
+    stale = {
+        pk: inst
+        for pk, inst in stale.items()
+        if cache.add(f"{CACHE_PREFIX}{pk}", True, settings.SCRAPING_REFRESH_DEDUPE)
+    }
+    if not stale:
+        return 0
+
+    # Unchanged prices are not stored again (ChangeDetector): an instrument
+    # scraped within the SLA is fresh even though its last tick is older
+    for pk in TickFingerprintModel.objects.filter(
+        instrument_id__in=list(stale), seen_at__gte=cutoff
+    ).values_list("instrument_id", flat=True):
+        stale.pop(pk, None)
+    if not stale:
+        return 0
+
+    RefreshRequestModel.objects.bulk_create(
+        [
+            RefreshRequestModel(
+                instrument_id=pk,
+                stale_since=getattr(inst, "latest_timestamp", None),
+            )
+            for pk, inst in stale.items()
+        ],
+        ignore_conflicts=True,
+    )
+    logger.info(
+        f"Stale read; refresh requested for "
+        f"{', '.join(sorted(inst.symbol for inst in stale.values()))}"
+    )
+    return len(stale)
+
+
+def claim_refreshes(limit: int) -> List[RefreshRequestModel]:
+    """
+    Claim up to `limit` waiting requests, oldest first. A claim older than
+    SCRAPING_REFRESH_TIMEOUT (its daemon died) can be taken over; each claim
+    is a conditional update, so concurrent daemons never share a request.
+    """
+    now = timezone.now()
+    expired = now - timedelta(seconds=settings.SCRAPING_REFRESH_TIMEOUT)
+    claimed = []
+    for req in RefreshRequestModel.objects.filter(
+        Q(claimed_at__isnull=True) | Q(claimed_at__lt=expired)
+    ).select_related("instrument")[:limit]:
+        won = RefreshRequestModel.objects.filter(
+            pk=req.pk, claimed_at=req.claimed_at
+        ).update(claimed_at=now)
+        if won:
+            req.claimed_at = now
+            claimed.append(req)
+    return claimed
+
+
+def finish_refreshes(requests: Iterable[RefreshRequestModel]):
+    """Drop requests whose scrape has run (or had nothing to run)."""
+    pks = [req.pk for req in requests]
+    if pks:
+        RefreshRequestModel.objects.filter(pk__in=pks).delete()
@@ -0,0 +1,27 @@
+import threading
+
+
+class RetryBudget:
+    """
+    Number of page retries a source may spend in one run.
+    Shared by every scraper session of that source, so splitting a batch across
+    workers does not multiply the budget. Thread-safe.
+    """
+
+    def __init__(self, total: int):
+        self.total = max(0, int(total))
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        """Consume one retry; False when the budget is exhausted."""
+        with self._lock:
+            if self.used >= self.total:
+                return False
+            self.used += 1
+            return True
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            return self.total - self.used
@@ -0,0 +1,112 @@
+import heapq
+import random
+import itertools
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+@dataclass
+class ScheduledJob:
+    key: Hashable
+    interval: float
+    due: float
+    runs: int = 0
+    skipped: int = 0
+
+
+class JobScheduler:
+    """
+    In-process scheduler for recurring jobs with individual intervals.
+
+    - Each job is re-armed `interval * (1 ± jitter)` after it was dispatched, so
+      jobs sharing an interval drift apart instead of firing in lock-step.
+    - New jobs get a random initial offset within their first jitter window,
+      after an optional delay (e.g. until their data goes stale).
+    - The caller owns overlap detection; pop_due() only reports what is due.
+    """
+
+    def __init__(self, jitter: float = 0.1, rng: Optional[random.Random] = None):
+        self.jitter = max(0.0, min(jitter, 0.9))
+        self.rng = rng or random.Random()
+        self.jobs: Dict[Hashable, ScheduledJob] = {}
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._seq = itertools.count()
+
+    def _push(self, job: ScheduledJob):
+        heapq.heappush(self._heap, (job.due, next(self._seq), job.key))
+
+    def _jittered(self, interval: float) -> float:
+        if not self.jitter:
+            return interval
+        return interval * (1 + self.rng.uniform(-self.jitter, self.jitter))
+
+    def sync(
+        self,
+        intervals: Dict[Hashable, float],
+        now: float,
+        delays: Optional[Dict[Hashable, float]] = None,
+    ):
+        """
+        Add new jobs, update intervals of known ones and drop removed ones.
+        `delays` postpones the first run of new jobs by that many seconds.
+        """
+        for key in list(self.jobs):
+            if key not in intervals:
+                del self.jobs[key]  # stale heap entries are skipped lazily
+
+        for key, interval in intervals.items():
+            job = self.jobs.get(key)
+            if job is None:
+                offset = (
+                    self.rng.uniform(0, interval * self.jitter) if self.jitter else 0
+                )
+                delay = (delays or {}).get(key, 0.0)
+                job = ScheduledJob(key=key, interval=interval, due=now + delay + offset)
+                self.jobs[key] = job
+                self._push(job)
+            else:
+                self.retune(key, interval, now)
+
+    def retune(self, key: Hashable, interval: float, now: float):
+        """Change a job's interval; a shorter one brings its next run forward."""
+        job = self.jobs.get(key)
+        if job is None or job.interval == interval:
+            return
+        job.interval = interval
+        if job.due > now + interval:
+            job.due = now + interval
+            self._push(job)
+
+    def pop_due(self, now: float) -> List[ScheduledJob]:
+        due: List[ScheduledJob] = []
+        while self._heap and self._heap[0][0] <= now:
+            at, _, key = heapq.heappop(self._heap)
+            job = self.jobs.get(key)
+            if job is None or job.due != at:
+                continue  # removed or rescheduled
+            due.append(job)
+        return due
+
+    def schedule_next(self, job: ScheduledJob, now: float, skipped: bool = False):
+        if skipped:
+            job.skipped += 1
+        else:
+            job.runs += 1
+        if job.key not in self.jobs:
+            return
+        job.due = now + self._jittered(job.interval)
+        self._push(job)
+
+    def defer(self, job: ScheduledJob):
+        """Put back a due job that could not be dispatched; pop_due() returns it again."""
+        if job.key in self.jobs:
+            self._push(job)
+
+    def next_due(self) -> Optional[float]:
+        while self._heap:
+            at, _, key = self._heap[0]
+            job = self.jobs.get(key)
+            if job is not None and job.due == at:
+                return at
+            heapq.heappop(self._heap)
+        return None
@@ -0,0 +1,100 @@
+import math
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+
+@dataclass
+class PageStat:
+    """
+    What one page cost (logged, and stored as a ScrapePageModel). `settle` is
+    the time spent waiting for readiness; `navigation` the loads themselves,
+    retries and back-off included, without browser launch and settle.
+    """
+
+    url: str
+    via: str = ""  # "browser" | "http" | "async"; empty if never loaded
+    settle: float = 0.0
+    settled: bool = True  # False when the readiness cap was hit
+    symbols: str = ""
+    started_at: Optional[datetime] = None
+    launch: float = 0.0
+    navigation: float = 0.0
+    parse: float = 0.0
+    store: float = 0.0
+    retries: int = 0
+    outcome: str = "ok"  # "ok" | "partial" | "failed" | "skipped"
+    ticks: int = 0
+    error: str = ""
+
+    def finish(self, results: Sequence) -> None:
+        """Set the outcome from the parsed [(config, data)] of the page."""
+        parsed = sum(data is not None for _, data in results)
+        if self.outcome == "ok" and parsed < len(results):
+            self.outcome = "partial" if parsed else "failed"
+            self.error = self.error or "parse error"
+
+
+@dataclass
+class ScrapeStats:
+    """Counters for one scraper session, returned by BaseScraper.scrape()."""
+
+    source: str
+    pages: int = 0  # configs attempted
+    page_loads: int = 0  # navigations / fetches (configs sharing a URL share one)
+    succeeded: int = 0
+    failed: int = 0
+    retries: int = 0
+    budget_exhausted: bool = False
+    saved: int = 0
+    ok_symbols: List[str] = field(default_factory=list)  # got a price
+    failed_symbols: List[str] = field(default_factory=list)
+    # Configs never attempted because the run was stopped (also failed)
+    skipped_symbols: List[str] = field(default_factory=list)
+    # Stage timings (seconds): navigation + readiness, parsing, and the part of
+    # parsing the navigation loop had to wait for (the rest overlapped)
+    load_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    parse_wait_seconds: float = 0.0
+
+    @property
+    def overlap_seconds(self) -> float:
+        return max(0.0, self.parse_seconds - self.parse_wait_seconds)
+
+    def stages(self) -> str:
+        return (
+            f"load {self.load_seconds:.2f}s, parse {self.parse_seconds:.2f}s "
+            f"({self.overlap_seconds:.2f}s overlapped with navigation)"
+        )
+
+    def summary(self) -> str:
+        text = (
+            f"{self.succeeded}/{self.pages} config(s) ok from {self.page_loads} "
+            f"page load(s), {self.retries} retr"
+            f"{'y' if self.retries == 1 else 'ies'}, {self.saved} tick(s) stored"
+        )
+        if self.budget_exhausted:
+            text += ", retry budget exhausted"
+        return text
+
+
+def percentile(values: Sequence[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile (pct in 0..100); None for an empty sequence."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize_settle(stats: List[PageStat]) -> Optional[str]:
+    """One-line readiness summary for browser page loads, or None if there were none."""
+    settles = [s.settle for s in stats if s.via == "browser"]
+    if not settles:
+        return None
+    capped = sum(1 for s in stats if s.via == "browser" and not s.settled)
+    return (
+        f"{len(settles)} page(s), settle p50 {percentile(settles, 50):.2f}s, "
+        f"p95 {percentile(settles, 95):.2f}s, max {max(settles):.2f}s, "
+        f"{capped} hit the cap"
+    )
@@ -0,0 +1,121 @@
+import time
+import logging
+import threading
+from datetime import timedelta
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from ..models import ScrapePageModel, ScrapeRunModel, SourceModel
+from .stats import PageStat
+
+logger = logging.getLogger(__name__)
+
+
+class RunRecorder:
+    """
+    Collects the PageStats of every scraper of a run and writes them, with one
+    ScrapeRunModel, in a single transaction when the run ends (save()).
+
+    Scrapers hand their pages over with add() once they are done (thread-safe).
+    With the run's tick writer, the run's DB write time is what the writer
+    spent in save_ticks meanwhile; otherwise the pages' own store time.
+    """
+
+    def __init__(self, command: str, arguments: str = "", writer=None):
+        self.command = command
+        self.arguments = arguments[:255]
+        self.writer = writer
+        self.started_at = timezone.now()
+        self._started = time.monotonic()
+        self._write_seconds = writer.write_seconds if writer is not None else 0.0
+        self._pages: List[Tuple[SourceModel, PageStat]] = []
+        self._lock = threading.Lock()
+
+    def add(self, scraper):
+        with self._lock:
+            self._pages.extend((scraper.source, page) for page in scraper.page_stats)
+
+    def save(self) -> Optional[ScrapeRunModel]:
+        """Write the run and its pages; None when nothing was loaded."""
+        with self._lock:
+            pages, self._pages = self._pages, []
+        if not pages:
+            return None
+
+        # A page the async engine handed to the browser fails only if the
+        # browser did not load it either
+        loaded = {(s.pk, p.url) for s, p in pages if p.outcome in ("ok", "partial")}
+        failed = sum(
+            p.outcome in ("failed", "skipped") and (s.pk, p.url) not in loaded
+            for s, p in pages
+        )
+        if not failed:
+            outcome = ScrapeRunModel.Outcome.OK
+        elif failed < len(pages):
+            outcome = ScrapeRunModel.Outcome.PARTIAL
+        else:
+            outcome = ScrapeRunModel.Outcome.FAILED
+        if self.writer is not None:
+            db_write = self.writer.write_seconds - self._write_seconds
+        else:
+            db_write = sum(p.store for _, p in pages)
+
+        with transaction.atomic():
+            run = ScrapeRunModel.objects.create(
+                command=self.command,
+                arguments=self.arguments,
+                started_at=self.started_at,
+                finished_at=timezone.now(),
+                duration=time.monotonic() - self._started,
+                outcome=outcome,
+                page_loads=len(pages),
+                failed_pages=failed,
+                retries=sum(p.retries for _, p in pages),
+                ticks=sum(p.ticks for _, p in pages),
+                driver_launch=sum(p.launch for _, p in pages),
+                db_write=db_write,
+            )
+            ScrapePageModel.objects.bulk_create(
+                [
+                    ScrapePageModel(
+                        run=run,
+                        source=source,
+                        url=page.url[:500],
+                        symbols=page.symbols[:255],
+                        via=page.via,
+                        started_at=page.started_at or self.started_at,
+                        driver_launch=page.launch,
+                        navigation=page.navigation,
+                        wait=page.settle,
+                        parse=page.parse,
+                        db_write=page.store,
+                        retries=page.retries,
+                        outcome=page.outcome,
+                        ticks=page.ticks,
+                        error=page.error[:255],
+                    )
+                    for source, page in pages
+                ],
+                batch_size=500,
+            )
+        prune_runs()
+        return run
+
+
+def prune_runs():
+    """Drop runs (and their pages) older than SCRAPING_TELEMETRY_DAYS."""
+    days = settings.SCRAPING_TELEMETRY_DAYS
+    if days <= 0:
+        return
+    cutoff = timezone.now() - timedelta(days=days)
+    ScrapeRunModel.objects.filter(started_at__lt=cutoff).delete()
+
+
+def get_run_recorder(command: str, arguments: str = "", writer=None):
+    """A recorder for a new run, or None when SCRAPING_TELEMETRY is off."""
+    if not settings.SCRAPING_TELEMETRY:
+        return None
+    return RunRecorder(command, arguments, writer=writer)
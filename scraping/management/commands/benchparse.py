@@ -0,0 +1,217 @@
+"""
+===============================================================================
+ArzWatch Parse Benchmark (Django Management Command)
+===============================================================================
+
+Benchmarks the parsing half of the scrapers offline, over the fixture corpus
+saved by refreshcorpus (SCRAPING_CORPUS_DIR).
+
+Each source's pages are parsed in several variants: the whole document with
+html.parser (the baseline), then the scraper's fragment_selector, each with
+every installed parser backend. Per variant it reports:
+  ops/s    pages parsed per second (the corpus is run --repeat times,
+           bounded by --max-time)
+  allocs   memory blocks held by one parsed page (soup + records), average
+  peak     peak traced memory of one page, max (tracemalloc)
+  output   whether the records equal those saved in the corpus
+
+--check exits with an error when any variant's records differ from the
+corpus, so selector and parser changes can be verified locally.
+--html parses one saved page of --source instead of the corpus.
+
+Examples
+--------
+python manage.py benchparse
+python manage.py benchparse --source tgju --repeat 5000 --check
+python manage.py benchparse --source milli --html milli.html
+===============================================================================
+"""
+
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from bs4.builder import builder_registry
+from django.core.management.base import BaseCommand, CommandError
+
+from ...engine.corpus import get_page_corpus, normalize_records
+from ...engine.parsing import parse_html
+from ...models import SourceModel
+from .scrape import SCRAPER_MAP
+
+PARSERS = ("html.parser", "lxml")
+
+# (url, configs, html, expected records by symbol or None)
+BenchPage = Tuple[str, List, str, Optional[Dict[str, Any]]]
+
+
+class Command(BaseCommand):
+    help = "Benchmark scraper parsing over the fixture corpus (ops/s, allocations, output)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--source", default=None, help="Only benchmark this source."
+        )
+        parser.add_argument(
+            "--html",
+            default=None,
+            help="Parse this saved page (with --source) instead of the corpus.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=1000,
+            help="Passes over each source's pages per variant.",
+        )
+        parser.add_argument(
+            "--max-time",
+            type=float,
+            default=10.0,
+            help="Stop a variant's passes after this many seconds.",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Fail when any variant's records differ from the corpus.",
+        )
+
+    def handle(self, *args, **options):
+        if options["html"] and not options["source"]:
+            raise CommandError("--html needs --source.")
+        corpus = get_page_corpus()
+        names = [options["source"]] if options["source"] else corpus.sources()
+        if not names:
+            raise CommandError(
+                f"The corpus at {corpus.root} is empty; run refreshcorpus first."
+            )
+
+        mismatches = 0
+        for name in names:
+            scraper_cls = SCRAPER_MAP.get(name.lower())
+            source = SourceModel.objects.filter(name__iexact=name).first()
+            if scraper_cls is None or source is None:
+                self.stderr.write(self.style.WARNING(f"Unknown source '{name}'"))
+                continue
+            scraper = scraper_cls(source)
+            scraper.fragments = True
+            pages = self._pages(scraper, corpus, options["html"])
+            if not pages:
+                self.stderr.write(self.style.WARNING(f"No pages for {source.name}"))
+                continue
+            mismatches += self._bench(scraper, pages, options)
+
+        if options["check"] and mismatches:
+            raise CommandError(f"{mismatches} variant(s) differ from the corpus.")
+
+    def _pages(self, scraper, corpus, html_file: Optional[str]) -> List[BenchPage]:
+        groups = scraper.group_by_url(scraper.source_configs)
+        if html_file:
+            if not groups:
+                return []
+            url, configs = next(iter(groups.items()))
+            return [(url, configs, Path(html_file).read_text(encoding="utf-8"), None)]
+
+        pages: List[BenchPage] = []
+        for page in corpus.iter_pages(scraper.source.name):
+            configs = groups.get(page.url)
+            if not configs:
+                self.stderr.write(f"  no configs read {page.url}; skipped")
+                continue
+            expected = dict(zip(page.symbols, page.expected))
+            pages.append((page.url, configs, page.html, expected))
+        return pages
+
+    @staticmethod
+    def _parse(scraper, page: BenchPage, fragment: bool, parser: str):
+        url, configs, html, _ = page
+        soup = parse_html(
+            html, scraper.group_fragment(configs) if fragment else None, parser
+        )
+        rows = None
+        if any(scraper.uses_listing(c) for c in configs):
+            rows = scraper.listing_rows(soup)
+        records = [scraper.parse_config(c, url, soup, rows) for c in configs]
+        return soup, records
+
+    @staticmethod
+    def _by_symbol(page: BenchPage, records) -> Dict[str, Any]:
+        symbols = [c.instrument.symbol for c in page[1]]
+        return dict(zip(symbols, normalize_records(records)))
+
+    def _bench(self, scraper, pages: List[BenchPage], options) -> int:
+        """Run every variant over a source's pages; returns how many mismatched."""
+        fragments = [False]
+        if any(scraper.group_fragment(p[1]) for p in pages):
+            fragments.append(True)
+        else:
+            self.stdout.write(
+                self.style.WARNING(f"{type(scraper).__name__} has no fragment_selector")
+            )
+        self.stdout.write(
+            f"{scraper.source.name}: {len(pages)} page(s), "
+            f"{sum(len(p[2]) for p in pages) / 1024:.0f} KB"
+        )
+
+        mismatches = 0
+        baseline_ops = None
+        baseline_output = None
+        for fragment in fragments:
+            for parser in PARSERS:
+                label = "fragment" if fragment else "document"
+                if builder_registry.lookup(parser) is None:
+                    self.stdout.write(f"  {label:<9} {parser:<12} not installed")
+                    continue
+
+                # Allocations and output, one page at a time
+                blocks = 0
+                peak = 0
+                outputs = []
+                for page in pages:
+                    tracemalloc.start()
+                    before = tracemalloc.take_snapshot()
+                    kept = self._parse(scraper, page, fragment, parser)
+                    after = tracemalloc.take_snapshot()
+                    peak = max(peak, tracemalloc.get_traced_memory()[1])
+                    tracemalloc.stop()
+                    blocks += sum(
+                        max(0, stat.count_diff)
+                        for stat in after.compare_to(before, "filename")
+                    )
+                    outputs.append(self._by_symbol(page, kept[1]))
+                    del kept
+
+                # Throughput
+                parsed = 0
+                started = time.perf_counter()
+                for _ in range(max(1, options["repeat"])):
+                    for page in pages:
+                        self._parse(scraper, page, fragment, parser)
+                    parsed += len(pages)
+                    if time.perf_counter() - started > options["max_time"]:
+                        break
+                ops = parsed / (time.perf_counter() - started)
+
+                if all(p[3] is not None for p in pages):
+                    same = all(
+                        {s: out.get(s) for s in page[3]} == page[3]
+                        for page, out in zip(pages, outputs)
+                    )
+                    output = "matches corpus" if same else "DIFFERS from corpus"
+                elif baseline_output is None:
+                    same, output = True, "baseline"
+                else:
+                    same = outputs == baseline_output
+                    output = "same as baseline" if same else "DIFFERS from baseline"
+                mismatches += not same
+                if baseline_ops is None:
+                    baseline_ops, baseline_output = ops, outputs
+                speedup = f"{ops / baseline_ops:5.1f}x"
+
+                line = (
+                    f"  {label:<9} {parser:<12} {ops:9.1f} ops/s {speedup} "
+                    f"{blocks / len(pages):9.0f} allocs {peak / 1024:8.0f} KB peak  "
+                    f"{output}"
+                )
+                self.stdout.write(line if same else self.style.ERROR(line))
+        return mismatches
@@ -0,0 +1,65 @@
+"""
+===============================================================================
+ArzWatch Browser Cache Cleanup (Django Management Command)
+===============================================================================
+
+Removes persistent Chrome profiles created with SCRAPING_BROWSER_CACHE.
+Profiles held by a running browser are never touched.
+
+By default only profiles larger than SCRAPING_BROWSER_CACHE_MB (plus profile
+overhead) are removed; --max-age also removes profiles unused for that many
+days, --all removes every free profile.
+
+Examples
+--------
+python manage.py cleanbrowsercache
+python manage.py cleanbrowsercache --max-age 7
+python manage.py cleanbrowsercache --source wallex --all
+===============================================================================
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ...engine.browser_cache import BrowserCache
+
+
+class Command(BaseCommand):
+    help = "Remove oversized, stale or all persistent browser cache profiles."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--source",
+            default=None,
+            help="Only clean this source's profiles.",
+        )
+        parser.add_argument(
+            "--max-age",
+            type=float,
+            default=None,
+            help="Also remove profiles not used for this many days.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Remove every profile that is not in use.",
+        )
+
+    def handle(self, *args, **options):
+        cache = BrowserCache(
+            root=settings.SCRAPING_BROWSER_CACHE_DIR,
+            slots=settings.SCRAPING_BROWSER_CACHE_SLOTS,
+            size_mb=settings.SCRAPING_BROWSER_CACHE_MB,
+        )
+        removed, freed = cache.clean(
+            source_name=options["source"],
+            max_age_days=options["max_age"],
+            everything=options["all"],
+        )
+        for path in removed:
+            self.stdout.write(f"Removed {path}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Removed {len(removed)} profile(s), freed {freed / (1024 * 1024):.1f} MB"
+            )
+        )
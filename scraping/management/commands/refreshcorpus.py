@@ -0,0 +1,103 @@
+"""
+===============================================================================
+ArzWatch Fixture Corpus Refresh (Django Management Command)
+===============================================================================
+
+Saves the live pages of the enabled sources into the offline fixture corpus
+(SCRAPING_CORPUS_DIR), one file per distinct URL, together with the records
+the scraper parses from them. benchparse uses the corpus to benchmark and
+regression-test parsing without the live sites.
+
+Pages are loaded exactly like a scrape run (HTTP first where allowed, the
+browser otherwise) but always saved as full documents, so whole-document and
+fragment parsing can both be measured. No ticks are written.
+
+Examples
+--------
+python manage.py refreshcorpus
+python manage.py refreshcorpus --source tgju
+python manage.py refreshcorpus --source milli --instrument BAHAR --auto-driver
+===============================================================================
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...engine.corpus import get_page_corpus
+from ...models import SourceModel
+from .scrape import SCRAPER_MAP
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Save the live pages of each source into the offline fixture corpus."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--source", default=None, help="Only refresh this source's pages."
+        )
+        parser.add_argument(
+            "--instrument",
+            default=None,
+            help="Only refresh the page(s) of this instrument symbol.",
+        )
+        parser.add_argument(
+            "--auto-driver",
+            action="store_true",
+            help="Auto-install ChromeDriver via webdriver_manager.",
+        )
+
+    def handle(self, *args, **options):
+        corpus = get_page_corpus()
+        sources = SourceModel.objects.filter(enabled=True)
+        if options["source"]:
+            sources = sources.filter(name__iexact=options["source"])
+        if not sources:
+            raise CommandError("No enabled source matches.")
+        instruments = [options["instrument"].upper()] if options["instrument"] else None
+
+        saved = failed = 0
+        for source in sources:
+            scraper_cls = SCRAPER_MAP.get(source.name.lower())
+            if scraper_cls is None:
+                self.stderr.write(self.style.WARNING(f"No scraper for {source.name}"))
+                continue
+            scraper = scraper_cls(
+                source, auto_driver=options["auto_driver"], instruments=instruments
+            )
+            # Keep whole documents; fragments are cut at benchmark time
+            scraper.fragments = False
+            try:
+                for url, configs in scraper.group_by_url(
+                    scraper.source_configs
+                ).items():
+                    html = scraper.load_with_retry(url, configs[0])
+                    if html is None:
+                        failed += 1
+                        self.stderr.write(
+                            self.style.ERROR(f"[{source.name}] {url}: FAIL")
+                        )
+                        continue
+                    results, _ = scraper.parse_group(url, configs, html)
+                    page = corpus.save(
+                        source.name,
+                        url,
+                        html,
+                        symbols=[c.instrument.symbol for c in configs],
+                        records=[data for _, data in results],
+                    )
+                    saved += 1
+                    parsed = sum(data is not None for _, data in results)
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f"[{source.name}] {url} -> {page.html_path.name} "
+                            f"({parsed}/{len(configs)} parsed)"
+                        )
+                    )
+            finally:
+                scraper.close_driver()
+                scraper.health.save()
+
+        self.stdout.write(f"Saved {saved} page(s) to {corpus.root}, {failed} failed")
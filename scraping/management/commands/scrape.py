@@ -34,7 +34,71 @@ Core Rules
        Source-scoped run (iterate instruments configured for that source).
 
 5) Driver:
-   --auto-driver  : Use webdriver_manager to auto-install ChromeDriver.
+   --auto-driver  : Use webdriver_manager to auto-install ChromeDriver
+                    (resolved once per process).
+   Browsers come from a DriverPool shared by every scraper in the run, so a
+   warm Chrome is reused across sources/instruments and recycled after
+   SCRAPING_DRIVER_MAX_PAGES pages or SCRAPING_DRIVER_MAX_RSS_MB of memory.
+   --driver fake  : No Chrome, no network: browsers and HTTP clients serve the
+                    fixture corpus (refreshcorpus) with SCRAPING_FAKE_LATENCY,
+                    SCRAPING_FAKE_FAILURE_RATE and SCRAPING_FAKE_TIMEOUT_RATE,
+                    reproducibly for a given SCRAPING_FAKE_SEED. Ticks are
+                    stored as usual. Default: SCRAPING_DRIVER.
+
+6) Parallelism:
+   --workers N    : Run up to N independent (source, instrument-batch) units at
+                    the same time, each with its own WebDriver. Default 1.
+   --deadline S   : Global deadline for the run in seconds. Pending units are
+                    cancelled and running scrapers aborted once it passes.
+
+7) Plan:
+   Scopes are compiled up front (engine.planner) into an immutable plan of
+   (source, [config]) units using a fixed number of queries.
+   --explain      : Print the plan (units, instruments, expected pages), then run.
+   --dry-run      : Print the plan and exit without scraping.
+
+8) Engine:
+   --engine auto      : Configs that do not require JS are fetched concurrently
+                        by the async HTTP engine (one connection pool per host,
+                        SCRAPING_ASYNC_PER_HOST requests at a time); the rest,
+                        plus any page the engine could not use, go to browsers.
+   --engine async     : Try every config over HTTP first, whatever requires_js says.
+   --engine selenium  : Browsers only (previous behavior).
+   Default: SCRAPING_ENGINE.
+
+9) Circuit breaker:
+   Every page load is reported to a per-source health tracker (consecutive
+   failures, latency EWMA). SCRAPING_BREAKER_THRESHOLD consecutive failures
+   open the source's circuit: its remaining pages are skipped, the planner
+   leaves it out (default-first falls back to the next configured source) and,
+   under default-first, the affected instruments are re-scraped from that
+   source in a fallback wave of the same run. After SCRAPING_BREAKER_COOLDOWN
+   seconds the source is probed again. A source named with --source is always
+   planned (manual probe). State is stored in SourceHealthModel.
+
+10) Hedging:
+   Under default-first, instruments with InstrumentModel.hedge are raced: the
+   default source starts first and, if it has no valid price within its latency
+   budget (SCRAPING_HEDGE_PERCENTILE of its recent page loads, else
+   SCRAPING_HEDGE_BUDGET seconds), the first fallback source starts too. The
+   first valid price is stored and the other scraper is aborted.
+
+11) Freshness:
+   --skip-fresh   : Leave out configs scraped less than their interval ago
+                    (SourceConfigModel.scrape_interval, or adaptive between
+                    min_interval and max_interval with recent price moves; see
+                    engine.cadence), so frequent cron runs only spend pages on
+                    data that is due. --explain lists what was left out.
+                    Default: SCRAPING_SKIP_FRESH.
+
+12) Profiling:
+   --profile      : Run under cProfile (every thread) and tracemalloc while
+                    sampling the RSS of this process and its chromedriver /
+                    Chrome children every SCRAPING_PROFILE_INTERVAL seconds.
+                    Writes scrape-<time>.pstats (python -m pstats, snakeviz),
+                    .txt (thread time by area: browser / network, parsing,
+                    normalization, orm, ...; top functions; top allocation
+                    sites) and .rss.csv to SCRAPING_PROFILE_DIR.
 
 Examples
 --------
@@ -56,20 +120,67 @@ python manage.py scrape --instrument usd --source tgju
 # USD from ALL its active sources (explicit)
 python manage.py scrape --instrument usd --source
 
+# Show what a full instrument run would scrape, without scraping
+python manage.py scrape --instrument --dry-run
+
+# ALL instruments, 4 browsers at a time, give up after 10 minutes
+python manage.py scrape --instrument --workers 4 --deadline 600
+
+# Browsers only, no async HTTP pass
+python manage.py scrape --source --engine selenium
+
+# Load-test the whole path offline against the fixture corpus
+python manage.py scrape --instrument --workers 4 --driver fake
+
+# Cron every minute, scraping only what is due
+python manage.py scrape --instrument --skip-fresh
+
+# Where does the time of a TGJU run go (Chrome, BeautifulSoup, ORM)?
+python manage.py scrape --source tgju --profile
+
 Notes
 -----
 - Extend SCRAPER_MAP when adding a new source.
-- This command intentionally runs scrapers *sequentially* to avoid Selenium
-  contention and rate-limits. Parallelization can be added later if needed.
+- Scrapers run *sequentially* by default to avoid Selenium contention and
+  rate-limits. With --workers, each source is capped to its fair share of the
+  pool so one slow site cannot block the others.
+- Instrument-scoped runs resolve the source for every instrument first, then
+  scrape each source once for its whole batch (one scraper session, one config
+  query, one bulk insert). Output and failures are still reported per
+  instrument.
 ===============================================================================
 """
 
+import argparse
 import logging
-from typing import List, Optional, Tuple
+from dataclasses import replace
+from typing import Dict, List, Optional
 
+from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
 
-from ...models import InstrumentModel, SourceModel, SourceConfigModel
+from ...engine import (
+    AsyncJob,
+    DriverPool,
+    ParallelExecutor,
+    PlanCompiler,
+    PlanError,
+    RetryBudget,
+    ScrapePlan,
+    ScrapeStats,
+    ScrapeUnit,
+    UnitOutcome,
+    HedgedExecutor,
+    HedgeOutcome,
+    ProfileReport,
+    RunProfiler,
+    clear_instrument_cache,
+    get_async_engine,
+    get_cadence_policy,
+    get_health_tracker,
+    get_run_recorder,
+    get_tick_writer,
+)
 from ...sources import (
     TgjuScraper,
     MilliScraper,
@@ -158,6 +269,54 @@ class Command(BaseCommand):
             action="store_true",
             help="Auto-install ChromeDriver via webdriver_manager (useful in ephemeral environments).",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.SCRAPING_WORKERS,
+            help="Number of scrape units (each with its own WebDriver) to run in parallel.",
+        )
+        parser.add_argument(
+            "--explain",
+            action="store_true",
+            help="Print the compiled scrape plan (units, instruments, page counts) before running.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Print the compiled scrape plan and exit without scraping.",
+        )
+        parser.add_argument(
+            "--deadline",
+            type=float,
+            default=settings.SCRAPING_RUN_DEADLINE,
+            help="Global deadline for the run in seconds (0 = none). Stragglers are cancelled.",
+        )
+        parser.add_argument(
+            "--engine",
+            choices=["auto", "async", "selenium"],
+            default=settings.SCRAPING_ENGINE,
+            help="auto: browser-less configs via the async HTTP engine, the rest via Selenium; "
+            "async: try every config over HTTP first; selenium: browsers only.",
+        )
+        parser.add_argument(
+            "--driver",
+            choices=["chrome", "fake"],
+            default=settings.SCRAPING_DRIVER,
+            help="chrome: real browsers and network; fake: serve the fixture corpus "
+            "with simulated latency and failures.",
+        )
+        parser.add_argument(
+            "--skip-fresh",
+            action=argparse.BooleanOptionalAction,
+            default=settings.SCRAPING_SKIP_FRESH,
+            help="Leave out configs scraped less than their (adaptive) interval ago.",
+        )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Profile the run (cProfile, tracemalloc, RSS of Python and Chrome) "
+            "into SCRAPING_PROFILE_DIR. Slows the run down.",
+        )
 
     # -------------------- helpers --------------------
 
@@ -165,250 +324,408 @@ class Command(BaseCommand):
         """Return scraper class by source name (case-insensitive), or None if unsupported."""
         return SCRAPER_MAP.get(source_name.lower())
 
-    def _get_enabled_sources(self) -> List[SourceModel]:
-        """All enabled sources."""
-        return list(SourceModel.objects.filter(enabled=True))
+    def _report_warnings(self, plan: ScrapePlan):
+        for warn in plan.warnings:
+            self.stderr.write(self.style.WARNING(warn))
+            logger.warning(warn)
 
-    def _get_enabled_instruments(self) -> List[InstrumentModel]:
-        """All enabled instruments."""
-        return list(InstrumentModel.objects.filter(enabled=True))
-
-    def _configured_symbols_for_source(self, source: SourceModel) -> List[str]:
-        """Unique instrument symbols configured for a given source."""
-        qs = SourceConfigModel.objects.filter(source=source).select_related(
-            "instrument"
+    def _early_ok(self) -> bool:
+        """Whether the passes before the executor (async HTTP, hedges) stored anything."""
+        return any(job.stats.succeeded for job in self.http_jobs) or any(
+            h.ok for h in self.hedge_outcomes
         )
-        return sorted({cfg.instrument.symbol for cfg in qs})
 
-    def _active_sources_for_instrument(
-        self, instrument: InstrumentModel
-    ) -> List[SourceModel]:
-        """
-        All active (enabled) sources configured for a given instrument (order preserved by DB).
-        """
-        cfgs = SourceConfigModel.objects.filter(
-            instrument=instrument, source__enabled=True
-        ).select_related("source")
-        return [cfg.source for cfg in cfgs]
-
-    def _default_first_single_source(
-        self, instrument: InstrumentModel
-    ) -> Optional[SourceModel]:
-        """
-        Enforce the default-first rule for a single instrument:
-          - If default_source exists and is enabled -> return it.
-          - Else return the first active configured source as fallback.
-          - If none -> return None (caller should warn+skip).
-        """
-        if instrument.default_source and instrument.default_source.enabled:
-            return instrument.default_source
+    def _execute(
+        self,
+        units: List[ScrapeUnit],
+        auto_driver: bool,
+        on_start,
+        on_success,
+        on_failure,
+    ) -> List[UnitOutcome]:
+        """Run units through the executor (sequential when --workers is 1)."""
+        executor = ParallelExecutor(
+            workers=self.workers,
+            deadline=self.deadline,
+            grace=settings.SCRAPING_CANCEL_GRACE,
+        )
+        # One retry budget per source, shared by all of its units in this run
+        budgets = {
+            u.source.name: RetryBudget(settings.SCRAPING_RETRY_BUDGET) for u in units
+        }
+        outcomes = executor.run(
+            units,
+            build=lambda u: u.scraper_cls(
+                u.source,
+                auto_driver=auto_driver,
+                instruments=u.symbols,
+                configs=u.configs,
+                driver_pool=self.driver_pool,
+                retry_budget=budgets[u.source.name],
+                tick_writer=self.tick_writer,
+                recorder=self.recorder,
+                backend=self.backend,
+            ),
+            on_start=on_start,
+            on_success=on_success,
+            on_failure=on_failure,
+        )
+        return outcomes
+
+    def _save_telemetry(self):
+        if self.recorder is None:
+            return
+        try:
+            run = self.recorder.save()
+        except Exception as e:
+            # Telemetry must never fail the run itself
+            logger.error(f"Saving scrape telemetry failed: {e}")
+            return
+        if run is not None:
+            self.stdout.write(
+                f"Telemetry: run {run.pk} ({run.outcome}, {run.page_loads} page(s))"
+            )
 
-        for src in self._active_sources_for_instrument(instrument):
-            return src  # first active configured source (fallback)
-        return None
+    def _report_stats(self, outcomes: List[UnitOutcome]):
+        """One line of config / page-load / retry totals for the run."""
+        stats = [job.stats for job in self.http_jobs]
+        stats += [st for h in self.hedge_outcomes for st in h.stats]
+        stats += [o.stats for o in outcomes if o.stats]
+        if not stats:
+            return
+        exhausted = sorted({s.source for s in stats if s.budget_exhausted})
+        line = (
+            f"Configs: {sum(s.succeeded for s in stats)} ok, "
+            f"{sum(s.failed for s in stats)} failed, "
+            f"{sum(s.page_loads for s in stats)} page load(s), "
+            f"{sum(s.retries for s in stats)} retries"
+        )
+        if exhausted:
+            line += f" (retry budget exhausted: {', '.join(exhausted)})"
+        self.stdout.write(line)
 
     # -------------------- runners --------------------
 
-    def _run_source_scope(
-        self,
-        source_key: Optional[str],
-        auto_driver: bool,
-        instruments_subset: Optional[List[str]] = None,
-    ):
-        """
-        Source-scoped execution.
+    def _run_hedges(self, plan: ScrapePlan, auto_driver: bool):
+        """Race hedged instruments' default source against their first fallback."""
+        budgets: Dict[str, RetryBudget] = {}
 
-        - source_key == '__ALL__'  -> iterate over all enabled sources.
-        - source_key == '<name>'   -> run only that source.
-        - instruments_subset       -> if provided, limit instruments to this subset of symbols;
-                                     otherwise, use the source's configured instruments.
-        """
-        sources: List[SourceModel]
-        if source_key == "__ALL__":
-            sources = self._get_enabled_sources()
-        else:
-            if not source_key:
-                raise CommandError(
-                    "Internal: _run_source_scope requires a source scope."
+        def build(cfg, collector):
+            budget = budgets.setdefault(
+                cfg.source.name, RetryBudget(settings.SCRAPING_RETRY_BUDGET)
+            )
+            return self._scraper_for(cfg.source.name)(
+                cfg.source,
+                auto_driver=auto_driver,
+                instruments=[cfg.instrument.symbol],
+                configs=[cfg],
+                driver_pool=self.driver_pool,
+                retry_budget=budget,
+                tick_writer=collector,
+                recorder=self.recorder,
+                backend=self.backend,
+            )
+
+        def budget_for(source) -> float:
+            return (
+                self.health.latency_percentile(
+                    source, settings.SCRAPING_HEDGE_PERCENTILE
                 )
-            try:
-                src = SourceModel.objects.get(name__iexact=source_key, enabled=True)
-            except SourceModel.DoesNotExist:
-                raise CommandError(f"Source '{source_key}' not found or disabled.")
-            sources = [src]
-
-        any_success = False
-        failures: List[Tuple[str, str]] = []
-
-        for source in sources:
-            scraper_cls = self._scraper_for(source.name)
-            if not scraper_cls:
-                warn = f"No scraper defined for source '{source.name}'"
-                self.stderr.write(self.style.WARNING(warn))
-                logger.warning(warn)
-                continue
+                or settings.SCRAPING_HEDGE_BUDGET
+            )
 
-            # Resolve instruments for this source
-            if instruments_subset:
-                symbols = instruments_subset
-                # optionally ensure that each symbol is actually configured for this source
-                configured = set(self._configured_symbols_for_source(source))
-                symbols = [s for s in symbols if s in configured]
-                if not symbols:
-                    self.stderr.write(
-                        self.style.WARNING(
-                            f"[{source.name}] no matching configured instruments in the provided subset."
-                        )
+        def on_done(outcome: HedgeOutcome):
+            if not outcome.ok:
+                self.stderr.write(
+                    self.style.ERROR(
+                        f"[{outcome.symbol}] hedged: FAIL → no valid price from either source"
                     )
+                )
+                return
+            note = (
+                f"hedged after {outcome.budget:.1f}s, " if outcome.hedged else ""
+            ) + f"{outcome.elapsed:.1f}s"
+            self.stdout.write(
+                self.style.SUCCESS(f"[{outcome.symbol}] {outcome.winner}: OK ({note})")
+            )
+
+        executor = HedgedExecutor(
+            build=build,
+            store=self.tick_writer.submit,
+            budget_for=budget_for,
+            workers=self.workers,
+        )
+        self.hedge_outcomes = executor.run(list(plan.hedges), on_done=on_done)
+
+    def _run_http(self, plan: ScrapePlan) -> ScrapePlan:
+        """
+        Scrape browser-less configs through the async HTTP engine and return
+        the plan of what is left for the browser executor (JS pages, plus pages
+        the engine could not fetch or that lacked the expected element).
+        """
+        jobs: List[AsyncJob] = []
+        for pu in plan.units:
+            scraper = self._scraper_for(pu.source.name)(
+                pu.source,
+                instruments=list(pu.symbols),
+                configs=pu.configs,
+                tick_writer=self.tick_writer,
+                recorder=self.recorder,
+                backend=self.backend,
+            )
+            configs = [
+                cfg
+                for cfg in pu.configs
+                if self.engine == "async" or not scraper.requires_js(cfg)
+            ]
+            if configs:
+                jobs.append(AsyncJob(scraper, configs))
+        if not jobs:
+            return plan
+
+        self.http_jobs = get_async_engine(self.backend).run(jobs)
+        if self.recorder is not None:
+            for job in jobs:
+                self.recorder.add(job.scraper)
+        done = set()
+        for job in jobs:
+            source = job.scraper.source.name  # type: ignore
+            fallback = {cfg.pk for cfg in job.fallback}
+            ok = set(job.stats.ok_symbols)
+            for cfg in job.configs:
+                if cfg.pk in fallback:
                     continue
-            else:
-                symbols = self._configured_symbols_for_source(source)
-                if not symbols:
+                done.add(cfg.pk)
+                if plan.scope != "instrument":
+                    continue
+                if cfg.instrument.symbol in ok:
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f"[{cfg.instrument.symbol}] {source}: OK (http)"
+                        )
+                    )
+                else:
                     self.stderr.write(
-                        self.style.WARNING(f"[{source.name}] no configured instruments")
+                        self.style.ERROR(
+                            f"[{cfg.instrument.symbol}] {source}: FAIL → no price via HTTP"
+                        )
                     )
-                    continue
+            if plan.scope != "instrument" and job.stats.page_loads:
+                self.stdout.write(
+                    self.style.SUCCESS(f"[{source}] HTTP: {job.stats.summary()}")
+                )
+            if job.fallback:
+                self.stdout.write(
+                    self.style.NOTICE(
+                        f"[{source}] {len(job.fallback)} config(s) fall back to the browser"
+                    )
+                )
 
+        units = []
+        for pu in plan.units:
+            left = tuple(cfg for cfg in pu.configs if cfg.pk not in done)
+            if left:
+                units.append(replace(pu, configs=left))
+        return replace(plan, units=tuple(units))
+
+    def _run_source_scope(self, plan: ScrapePlan, auto_driver: bool):
+        """Source-scoped execution: one unit per source with all its configured instruments."""
+        units = [
+            ScrapeUnit(
+                pu.source.name,
+                pu.source,
+                list(pu.symbols),
+                self._scraper_for(pu.source.name),
+                configs=pu.configs,
+            )
+            for pu in plan.units
+        ]
+
+        def on_start(unit: ScrapeUnit):
             self.stdout.write(
                 self.style.NOTICE(
-                    f"[{source.name}] scraping {len(symbols)} instrument(s)..."
+                    f"[{unit.source.name}] scraping {len(unit.symbols)} instrument(s)..."
                 )
             )
 
-            try:
-                scraper = scraper_cls(
-                    source, auto_driver=auto_driver, instruments=symbols
+        def on_success(unit: ScrapeUnit, stats: Optional[ScrapeStats]):
+            self.stdout.write(self.style.SUCCESS(f"[{unit.source.name}] DONE"))
+            for symbol in stats.failed_symbols if stats else []:
+                self.stderr.write(
+                    self.style.ERROR(f"[{symbol}] {unit.source.name}: FAIL → no price")
                 )
-                scraper.scrape()
-                any_success = True
-                self.stdout.write(self.style.SUCCESS(f"[{source.name}] DONE"))
-            except Exception as e:
-                failures.append((source.name, str(e)))
-                self.stderr.write(self.style.ERROR(f"[{source.name}] FAIL → {e}"))
-                logger.exception("Source-scoped error", exc_info=e)
+
+        def on_failure(unit: ScrapeUnit, error: str, stats: Optional[ScrapeStats]):
+            note = f" ({stats.summary()})" if stats else ""
+            self.stderr.write(
+                self.style.ERROR(f"[{unit.source.name}] FAIL → {error}{note}")
+            )
+
+        outcomes = self._execute(units, auto_driver, on_start, on_success, on_failure)
+        self._report_stats(outcomes)
+        any_success = self._early_ok() or any(self._stored(o) for o in outcomes)
+        failures = [(o.unit.key, o.error or "") for o in outcomes if not o.ok]
+        failures += [
+            (f"{symbol}@{o.unit.source.name}", "no price")
+            for o in outcomes
+            if o.ok and o.stats
+            for symbol in o.stats.failed_symbols
+        ]
 
         if not any_success and failures:
             # Report a single aggregated error for CI/ops visibility
             raise CommandError("Source scope failed for all targets.")
 
-    def _run_instrument_scope(
-        self,
-        instrument_symbol: Optional[str],
-        auto_driver: bool,
-        source_key: Optional[str],
-    ):
+    @staticmethod
+    def _stored(outcome: UnitOutcome) -> bool:
         """
-        Instrument-scoped execution.
-
-        Behavior matrix:
-          - source_key is None:
-              For each instrument -> pick exactly ONE source using default-first,
-              else first active fallback; if none -> warn+skip.
-
-          - source_key == '__ALL__':
-              For each instrument -> scrape across ALL its active configured sources.
+        Whether a unit got at least one price (scrape() returning is not enough;
+        a unit stopped at the deadline may have stored some before it failed).
+        """
+        stats = outcome.stats
+        if stats is None:
+            return outcome.ok
+        return bool(stats.succeeded) or (outcome.ok and not stats.failed_symbols)
+
+    def _tripped_symbols(self, outcomes: List[UnitOutcome]) -> List[str]:
+        """Symbols that failed on a source whose circuit is now open."""
+        symbols = set()
+        for o in outcomes:
+            if self.health.allows(o.unit.source):
+                continue
+            if not o.ok or o.stats is None:
+                symbols.update(o.unit.symbols)
+            else:
+                symbols.update(o.stats.failed_symbols)
+        return sorted(symbols)
 
-          - source_key == '<name>':
-              For each instrument -> if that source is active & configured for it -> scrape it;
-                                     otherwise warn+skip.
+    def _run_instrument_scope(self, plan: ScrapePlan, auto_driver: bool):
         """
-        # Resolve instruments (single symbol or all)
-        if instrument_symbol and instrument_symbol != "__ALL__":
-            instruments = list(
-                InstrumentModel.objects.filter(
-                    symbol=instrument_symbol.upper(), enabled=True
-                )
+        Instrument-scoped execution with in-run fallback: under default-first,
+        instruments that failed on a source whose circuit opened during the
+        run are re-planned (the open source is now skipped) and scraped from
+        their next configured source in another wave.
+        """
+        outcomes = self._run_instrument_wave(plan, auto_driver)
+        all_outcomes = list(outcomes)
+        while self.src_opt is None and outcomes:
+            tripped = self._tripped_symbols(outcomes)
+            if not tripped:
+                break
+            wave = PlanCompiler(SCRAPER_MAP, self.health).compile(
+                instrument=self.inst_opt, only=tripped
             )
-            if not instruments:
-                raise CommandError(
-                    f"Instrument '{instrument_symbol}' not found or disabled."
+            self._report_warnings(wave)
+            if not wave.units:
+                break
+            self.stdout.write(
+                self.style.NOTICE(
+                    f"Fallback wave for {len(tripped)} instrument(s): "
+                    + ", ".join(
+                        f"{u.source.name} ({len(u.configs)})" for u in wave.units
+                    )
                 )
-        else:
-            instruments = self._get_enabled_instruments()
-            if not instruments:
-                raise CommandError("No enabled instruments found.")
-
-        any_success = False
-        failures: List[Tuple[str, str]] = []
-
-        for inst in instruments:
-            # Determine source set according to source_key mode
-            sources: List[SourceModel] = []
-
-            if source_key is None:
-                # Default-first single source (or single fallback)
-                picked = self._default_first_single_source(inst)
-                if picked is None:
-                    warn = f"[{inst.symbol}] no active default or fallback source; skipping."
-                    self.stderr.write(self.style.WARNING(warn))
-                    logger.warning(warn)
-                    continue
-                sources = [picked]
-
-            elif source_key == "__ALL__":
-                # All active configured sources for this instrument
-                sources = self._active_sources_for_instrument(inst)
-                if not sources:
-                    warn = f"[{inst.symbol}] no active configured sources; skipping."
-                    self.stderr.write(self.style.WARNING(warn))
-                    logger.warning(warn)
-                    continue
+            )
+            outcomes = self._run_instrument_wave(wave, auto_driver)
+            all_outcomes.extend(outcomes)
 
-            else:
-                # Specific source only
-                try:
-                    src = SourceModel.objects.get(name__iexact=source_key, enabled=True)
-                except SourceModel.DoesNotExist:
-                    warn = f"Source '{source_key}' not found/disabled; skipping {inst.symbol}."
-                    self.stderr.write(self.style.WARNING(warn))
-                    logger.warning(warn)
-                    continue
+        self._report_stats(all_outcomes)
+        any_success = self._early_ok() or any(self._stored(o) for o in all_outcomes)
+        failed = any(
+            not o.ok or (o.stats and o.stats.failed_symbols) for o in all_outcomes
+        )
+        if not any_success and failed:
+            raise CommandError("Instrument scope failed for all targets.")
 
-                # Verify this instrument is configured for that source
-                configured = SourceConfigModel.objects.filter(
-                    source=src, instrument=inst
-                ).exists()
-                if not configured:
-                    warn = f"[{inst.symbol}] not configured for source '{src.name}'; skipping."
-                    self.stderr.write(self.style.WARNING(warn))
-                    logger.warning(warn)
-                    continue
-                sources = [src]
-
-            # Execute scraping for decided sources
-            for src in sources:
-                scraper_cls = self._scraper_for(src.name)
-                if not scraper_cls:
-                    warn = f"No scraper defined for source '{src.name}'"
-                    self.stderr.write(self.style.WARNING(warn))
-                    logger.warning(warn)
-                    continue
+    def _run_instrument_wave(
+        self, plan: ScrapePlan, auto_driver: bool
+    ) -> List[UnitOutcome]:
+        """
+        One pass over an instrument plan. The plan already grouped the chosen
+        instruments by source; each source's batch is split into at most its
+        share of workers so --workers still parallelizes.
+        """
+        share = max(1, self.workers // max(1, len(plan.units)))
+        units = [
+            ScrapeUnit(
+                f"{','.join(part.symbols)}@{part.source.name}",
+                part.source,
+                list(part.symbols),
+                self._scraper_for(part.source.name),
+                configs=part.configs,
+            )
+            for pu in plan.units
+            for part in pu.split(share)
+        ]
+
+        def on_start(unit: ScrapeUnit):
+            for symbol in unit.symbols:
+                self.stdout.write(
+                    self.style.NOTICE(f"[{symbol}] {unit.source.name}: scraping...")
+                )
 
-                try:
+        def report(unit: ScrapeUnit, stats: Optional[ScrapeStats], error: str):
+            # OK only for symbols that got a price; never-attempted ones are skipped
+            ok = set(stats.ok_symbols) if stats else set()
+            skipped = set(stats.skipped_symbols) if stats else set()
+            failed = set(stats.failed_symbols) if stats else set(unit.symbols)
+            for symbol in unit.symbols:
+                if symbol in ok:
                     self.stdout.write(
-                        self.style.NOTICE(f"[{inst.symbol}] {src.name}: scraping...")
-                    )
-                    scraper = scraper_cls(
-                        src, auto_driver=auto_driver, instruments=[inst.symbol]
+                        self.style.SUCCESS(f"[{symbol}] {unit.source.name}: OK")
                     )
-                    scraper.scrape()
-                    any_success = True
-                    self.stdout.write(
-                        self.style.SUCCESS(f"[{inst.symbol}] {src.name}: OK")
+                elif symbol in failed and symbol not in skipped:
+                    self.stderr.write(
+                        self.style.ERROR(
+                            f"[{symbol}] {unit.source.name}: FAIL → {error}"
+                        )
                     )
-                except Exception as e:
-                    failures.append((f"{inst.symbol}@{src.name}", str(e)))
+                else:
                     self.stderr.write(
-                        self.style.ERROR(f"[{inst.symbol}] {src.name}: FAIL → {e}")
+                        self.style.WARNING(f"[{symbol}] {unit.source.name}: skipped")
                     )
-                    logger.exception("Instrument-scoped error", exc_info=e)
 
-        if not any_success and failures:
-            raise CommandError("Instrument scope failed for all targets.")
+        def on_success(unit: ScrapeUnit, stats: Optional[ScrapeStats]):
+            report(unit, stats, "no price")
+
+        def on_failure(unit: ScrapeUnit, error: str, stats: Optional[ScrapeStats]):
+            report(unit, stats, error)
+
+        return self._execute(units, auto_driver, on_start, on_success, on_failure)
 
     # -------------------- entrypoint --------------------
 
     def handle(self, *args, **options):
+        if not options["profile"]:
+            return self._handle(options)
+        profiler = RunProfiler(
+            settings.SCRAPING_PROFILE_DIR,
+            label="scrape",
+            interval=settings.SCRAPING_PROFILE_INTERVAL,
+        )
+        profiler.start()
+        try:
+            return self._handle(options)
+        finally:
+            self._report_profile(profiler.stop())
+
+    def _report_profile(self, report: ProfileReport):
+        areas = ", ".join(f"{area} {sec:.1f}s" for area, sec in report.areas.items())
+        peaks = ", ".join(
+            f"{kind} {size / 2**20:.0f} MB"
+            for kind, size in report.rss_peaks.items()
+            if size
+        )
+        self.stdout.write(f"Profile: {report.wall:.1f}s wall; thread time: {areas}")
+        self.stdout.write(
+            f"Profile: peak RSS {peaks}; peak traced {report.traced_peak / 2**20:.0f} MB"
+        )
+        self.stdout.write(
+            f"Profile written to {report.pstats_path}, {report.report_path.name}, "
+            f"{report.rss_path.name}"
+        )
+
+    def _handle(self, options):
         """
         Entrypoint routing according to presence/value of --source and --instrument.
         Rules:
@@ -418,11 +735,20 @@ class Command(BaseCommand):
                                            with source_key narrowing its behavior.
         """
         auto_driver = options["auto_driver"]
+        self.workers = max(1, options["workers"] or 1)
+        self.deadline = options["deadline"] or None
+        self.engine = options["engine"]
+        # Browser / HTTP backend, handed to the pool, scrapers and async engine
+        self.backend = options["driver"]
+        self.http_jobs: List[AsyncJob] = []
+        self.hedge_outcomes: List[HedgeOutcome] = []
+        self.health = get_health_tracker()
 
         src_opt: Optional[str] = options.get("source")  # None | '__ALL__' | '<name>'
         inst_opt: Optional[str] = options.get(
             "instrument"
         )  # None | '__ALL__' | '<symbol>'
+        self.src_opt, self.inst_opt = src_opt, inst_opt
 
         # Validate at least one scope flag is present
         if src_opt is None and inst_opt is None:
@@ -430,25 +756,60 @@ class Command(BaseCommand):
                 "Usage: provide --source [NAME] or --instrument [SYMBOL] (or both)."
             )
 
-        # Both provided -> instrument scope narrowed by source_key
-        if inst_opt is not None and src_opt is not None:
-            return self._run_instrument_scope(
-                instrument_symbol=inst_opt,
-                auto_driver=auto_driver,
-                source_key=src_opt,
-            )
-
-        # Only source
-        if src_opt is not None:
-            return self._run_source_scope(
-                source_key=src_opt,
-                auto_driver=auto_driver,
-                instruments_subset=None,  # no subset filter
-            )
-
-        # Only instrument
-        return self._run_instrument_scope(
-            instrument_symbol=inst_opt,
+        try:
+            plan = PlanCompiler(
+                SCRAPER_MAP,
+                self.health,
+                hedge=True,
+                cadence=get_cadence_policy() if options["skip_fresh"] else None,
+            ).compile(instrument=inst_opt, source=src_opt)
+        except PlanError as e:
+            raise CommandError(str(e))
+
+        if options["explain"] or options["dry_run"]:
+            for line in plan.explain():
+                self.stdout.write(line)
+        self._report_warnings(plan)
+        if options["dry_run"]:
+            return
+
+        self.driver_pool = DriverPool(
+            # A hedged race may hold two browsers at once
+            max_size=self.workers * 2 if plan.hedges else self.workers,
+            max_pages=settings.SCRAPING_DRIVER_MAX_PAGES,
+            max_rss_mb=settings.SCRAPING_DRIVER_MAX_RSS_MB,
             auto_driver=auto_driver,
-            source_key=None,  # triggers default-first single-source behavior
+            backend=self.backend,
         )
+        clear_instrument_cache()
+        self.tick_writer = get_tick_writer()
+        self.recorder = get_run_recorder(
+            "scrape",
+            f"source={src_opt} instrument={inst_opt} engine={self.engine} "
+            f"workers={self.workers} driver={options['driver']}",
+            writer=self.tick_writer,
+        )
+        try:
+            if plan.hedges:
+                self._run_hedges(plan, auto_driver)
+            if self.engine != "selenium":
+                plan = self._run_http(plan)
+            # Instrument scope takes precedence; --source only narrows it (see planner)
+            if plan.scope == "instrument":
+                return self._run_instrument_scope(plan, auto_driver)
+            return self._run_source_scope(plan, auto_driver)
+        finally:
+            self.driver_pool.close()
+            self.tick_writer.close()
+            self.health.save()
+            self._save_telemetry()
+            stats = self.driver_pool.stats()
+            self.stdout.write(
+                f"Driver pool: launched {stats['launched']}, reused {stats['reused']}, "
+                f"recycled {stats['recycled']}, discarded {stats['discarded']}"
+            )
+            ticks = self.tick_writer.stats()
+            self.stdout.write(
+                f"Ticks: written {ticks['written']} in {ticks['batches']} batch(es), "
+                f"unchanged {ticks['unchanged']}, failed {ticks['failed']}"
+            )
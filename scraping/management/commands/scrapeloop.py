@@ -0,0 +1,395 @@
+"""
+===============================================================================
+ArzWatch Scrape Loop (Django Management Command)
+===============================================================================
+
+Purpose
+-------
+Long-running replacement for cron-driven `manage.py scrape`. Django, models,
+reference data and browsers stay warm between runs, and every
+(instrument, source) pair is scraped on its own cadence.
+
+Scheduling
+----------
+- Jobs follow the same default-first rule as `scrape --instrument`: one job per
+  instrument on its active default source, else the first active configured
+  source. With --all-sources every active (instrument, source) pair gets a job.
+- Interval per job: SourceConfigModel.scrape_interval, else
+  SCRAPING_LOOP_INTERVAL. Each run is re-armed with ±SCRAPING_LOOP_JITTER.
+- Configs with min_interval / max_interval get an adaptive interval
+  (engine.cadence): short while recent ticks move a lot, long while the price
+  is flat. It is re-evaluated after every run of the job and on each reload.
+- On start, jobs scraped recently (by cron or a previous loop) wait until
+  their data goes stale instead of all running at once.
+- Jobs that come due while their previous run is still queued/running are
+  skipped (no overlapping runs for the same pair).
+- Due jobs of the same source are batched into one scraper session.
+- Reference data (instruments, sources, configs) is reloaded every
+  SCRAPING_LOOP_REFRESH seconds.
+- Sources whose circuit breaker is open are not dispatched. When a circuit
+  opens, jobs are re-planned right away so default-first instruments move to
+  their next configured source; after the cool-down the source is probed
+  again. Breaker state is saved after every run (SourceHealthModel).
+- Runs are only started on a free worker: while all --workers are busy, due
+  jobs stay in the schedule instead of queueing behind running ones.
+- Refreshes requested by stale API / bot reads (RefreshRequestModel, see
+  engine.refresh) are polled every SCRAPING_REFRESH_POLL seconds and take free
+  workers before scheduled jobs, default-first; the instrument's job then
+  counts its next run from the refresh.
+- Hedged instruments (InstrumentModel.hedge) are scheduled like any other;
+  racing sources is done by `scrape` runs only.
+
+Shutdown
+--------
+SIGTERM / SIGINT stop scheduling, let running scrapers finish the page they are
+on, store what they collected and exit. A second signal aborts immediately.
+
+Examples
+--------
+python manage.py scrapeloop
+python manage.py scrapeloop --workers 3 --all-sources
+===============================================================================
+"""
+
+import time
+import signal
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from django.utils import timezone
+
+from django.conf import settings
+from django.db import connections
+from django.core.management.base import BaseCommand
+
+from ...engine import (
+    Cadence,
+    JobScheduler,
+    PlanCompiler,
+    claim_refreshes,
+    clear_instrument_cache,
+    finish_refreshes,
+    get_cadence_policy,
+    get_driver_pool,
+    get_health_tracker,
+    get_run_recorder,
+    get_tick_writer,
+)
+from ...engine.planner import ALL
+from .scrape import SCRAPER_MAP
+
+logger = logging.getLogger(__name__)
+
+JobKey = Tuple[str, str]  # (instrument symbol, source name)
+
+
+class Command(BaseCommand):
+    help = "Run scrapers continuously with per-instrument schedules."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=max(1, settings.SCRAPING_WORKERS),
+            help="Number of scraper sessions allowed to run at the same time.",
+        )
+        parser.add_argument(
+            "--all-sources",
+            action="store_true",
+            help="Schedule every active (instrument, source) pair instead of default-first only.",
+        )
+        parser.add_argument(
+            "--auto-driver",
+            action="store_true",
+            help="Auto-install ChromeDriver via webdriver_manager (resolved once).",
+        )
+
+    # -------------------- reference data --------------------
+
+    def _load_jobs(self) -> Dict[JobKey, Tuple[Cadence, object]]:
+        """
+        Return {(symbol, source): (cadence, config)} for the jobs to schedule,
+        compiled by the same planner (and rules) as `scrape --instrument`.
+        """
+        plan = PlanCompiler(SCRAPER_MAP, self.health).compile(
+            instrument=ALL, source=ALL if self.all_sources else None
+        )
+        for warn in plan.warnings:
+            logger.warning(warn)
+
+        configs = [cfg for unit in plan.units for cfg in unit.configs]
+        cadences = self.cadence.evaluate(configs)
+        return {
+            (cfg.instrument.symbol, cfg.source.name): (cadences[cfg.pk], cfg)
+            for cfg in configs
+        }
+
+    def _refresh(self, now: float):
+        self.reference = self._load_jobs()
+        clear_instrument_cache()
+        wall = timezone.now()
+        self.scheduler.sync(
+            {key: c.interval for key, (c, _) in self.reference.items()},
+            now,
+            delays={key: c.due_in(wall) for key, (c, _) in self.reference.items()},
+        )
+        self.next_refresh = now + settings.SCRAPING_LOOP_REFRESH
+        logger.info(f"Scrape loop tracking {len(self.reference)} job(s)")
+
+    # -------------------- execution --------------------
+
+    @staticmethod
+    def _run(scraper):
+        try:
+            return scraper.scrape()
+        finally:
+            connections.close_all()
+
+    def _free(self) -> int:
+        return self.workers - len(self.running)
+
+    def _dispatch(self, now: float):
+        due = self.scheduler.pop_due(now)
+        batches: Dict[str, List] = defaultdict(list)
+        for job in due:
+            if job.key in self.in_flight:
+                logger.debug(
+                    f"Skipping {job.key[0]}@{job.key[1]}: previous run still active"
+                )
+                self.scheduler.schedule_next(job, now, skipped=True)
+                continue
+            batches[job.key[1]].append(job)
+
+        for source_name, jobs in batches.items():
+            configs = [self.reference[job.key][1] for job in jobs]
+            if not self.health.allows(configs[0].source):  # type: ignore
+                logger.debug(f"Skipping {source_name}: circuit open")
+                for job in jobs:
+                    self.scheduler.schedule_next(job, now, skipped=True)
+                continue
+            if self._free() <= 0:
+                # Stay due until a worker frees up (refreshes get it first)
+                for job in jobs:
+                    self.scheduler.defer(job)
+                continue
+            self._submit(configs[0].source, configs, "scrapeloop")
+            for job in jobs:
+                self.scheduler.schedule_next(job, now)
+
+    def _submit(self, source, configs: List, command: str) -> Optional[Future]:
+        """Start one scraper session over configs of a source (None if it cannot be built)."""
+        symbols = [cfg.instrument.symbol for cfg in configs]
+        try:
+            scraper = SCRAPER_MAP[source.name.lower()](
+                source,
+                auto_driver=self.auto_driver,
+                instruments=symbols,
+                configs=configs,
+                driver_pool=self.driver_pool,
+                tick_writer=self.tick_writer,
+                recorder=get_run_recorder(
+                    command, f"{source.name}: {', '.join(symbols)}"
+                ),
+            )
+        except Exception as e:
+            logger.exception(f"Could not build scraper for {source.name}: {e}")
+            return None
+
+        keys = [(symbol, source.name) for symbol in symbols]
+        self.in_flight.update(keys)
+        future = self.pool.submit(self._run, scraper)
+        self.running[future] = (scraper, keys, time.monotonic())
+        verb = "refreshing" if command == "refresh" else "scraping"
+        logger.info(f"[{source.name}] {verb} {', '.join(symbols)}")
+        return future
+
+    def _dispatch_refreshes(self, now: float):
+        """
+        Run on-demand refreshes requested by stale reads, ahead of scheduled
+        jobs: each claimed instrument is scraped default-first, like its job.
+        Only as many requests as there are free workers are claimed; while
+        all workers are busy the poll stays due, so the next free worker
+        goes to a waiting refresh.
+        """
+        free = self._free()
+        if free <= 0 or now < self.next_refresh_poll:
+            return
+        try:
+            requests = claim_refreshes(limit=free)
+            if len(requests) < free:
+                # Queue drained; otherwise poll again as soon as a worker is free
+                self.next_refresh_poll = now + settings.SCRAPING_REFRESH_POLL
+            if not requests:
+                return
+            plan = PlanCompiler(SCRAPER_MAP, self.health).compile(
+                instrument=ALL, only=[req.instrument.symbol for req in requests]
+            )
+        except Exception as e:
+            logger.exception(f"Could not plan requested refreshes: {e}")
+            return
+        for warn in plan.warnings:
+            logger.warning(warn)
+
+        by_symbol = {req.instrument.symbol: req for req in requests}
+        for unit in plan.units:
+            # A pair already being scraped is about to be fresh anyway
+            configs = [
+                cfg
+                for cfg in unit.configs
+                if (cfg.instrument.symbol, unit.source.name) not in self.in_flight
+            ]
+            future = self._submit(unit.source, configs, "refresh") if configs else None
+            if future is None:
+                continue
+            self.refreshing[future] = [
+                by_symbol.pop(cfg.instrument.symbol) for cfg in configs
+            ]
+            for cfg in configs:
+                # The scheduled job counts from this run
+                job = self.scheduler.jobs.get((cfg.instrument.symbol, unit.source.name))
+                if job is not None:
+                    self.scheduler.schedule_next(job, now)
+        try:
+            finish_refreshes(by_symbol.values())
+        except Exception as e:
+            logger.exception(f"Could not clear refresh requests: {e}")
+
+    def _reap(self):
+        done = [f for f in self.running if f.done()]
+        for future in done:
+            scraper, keys, started = self.running.pop(future)
+            self.in_flight.difference_update(keys)
+            exc = future.exception()
+            if exc:
+                logger.error(f"[{scraper.source.name}] run failed: {exc}")
+            else:
+                stats = future.result()
+                logger.info(
+                    f"[{scraper.source.name}] finished {len(keys)} job(s) "
+                    f"in {time.monotonic() - started:.1f}s"
+                    + (f": {stats.summary()}" if stats else "")
+                )
+            if not exc:
+                self._retune(keys)
+            requests = self.refreshing.pop(future, None)
+            if requests:
+                try:
+                    finish_refreshes(requests)
+                except Exception as e:
+                    logger.exception(f"Could not clear refresh requests: {e}")
+            if scraper.recorder is not None:
+                try:
+                    scraper.recorder.save()
+                except Exception as e:
+                    logger.exception(f"Could not save scrape telemetry: {e}")
+            if not self.health.allows(scraper.source):
+                # Re-plan now so default-first jobs move to their fallback source
+                self.next_refresh = 0.0
+        if done:
+            try:
+                self.health.save()
+            except Exception as e:
+                logger.exception(f"Could not save source health: {e}")
+
+    def _retune(self, keys: List[JobKey]):
+        """Re-evaluate the adaptive interval of jobs that just ran."""
+        configs = [self.reference[k][1] for k in keys if k in self.reference]
+        try:
+            cadences = self.cadence.evaluate(configs)
+        except Exception as e:
+            logger.exception(f"Could not evaluate scrape cadence: {e}")
+            return
+        now = time.monotonic()
+        for cfg in configs:
+            key = (cfg.instrument.symbol, cfg.source.name)  # type: ignore
+            cadence = cadences[cfg.pk]  # type: ignore
+            if cadence.interval != self.reference[key][0].interval:
+                logger.debug(
+                    f"{key[0]}@{key[1]}: interval {cadence.interval:.0f}s "
+                    f"(largest recent move {cadence.move or 0:.3%})"
+                )
+            self.reference[key] = (cadence, cfg)
+            self.scheduler.retune(key, cadence.interval, now)
+
+    # -------------------- signals --------------------
+
+    def _on_signal(self, signum, frame):
+        if not self.stopping.is_set():
+            logger.info(f"Signal {signum} received; finishing in-flight pages...")
+            self.stdout.write(self.style.WARNING("Stopping after in-flight pages..."))
+            self.stopping.set()
+            for scraper, _, _ in list(self.running.values()):
+                scraper.stop_event.set()
+        else:
+            logger.warning("Second signal received; aborting running scrapers.")
+            for scraper, _, _ in list(self.running.values()):
+                scraper.abort()
+
+    # -------------------- entrypoint --------------------
+
+    def handle(self, *args, **options):
+        self.auto_driver = options["auto_driver"]
+        self.all_sources = options["all_sources"]
+        self.workers = workers = max(1, options["workers"])
+
+        self.scheduler = JobScheduler(jitter=settings.SCRAPING_LOOP_JITTER)
+        self.driver_pool = get_driver_pool(auto_driver=self.auto_driver)
+        self.driver_pool.max_size = max(self.driver_pool.max_size, workers)
+        self.tick_writer = get_tick_writer()
+        self.health = get_health_tracker()
+        self.cadence = get_cadence_policy()
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="loop")
+        self.running: Dict[Future, Tuple[object, List[JobKey], float]] = {}
+        self.in_flight: set = set()
+        self.refreshing: Dict[Future, List] = {}
+        self.next_refresh_poll = 0.0
+        self.stopping = threading.Event()
+
+        signal.signal(signal.SIGTERM, self._on_signal)
+        signal.signal(signal.SIGINT, self._on_signal)
+
+        self.stdout.write(self.style.SUCCESS("Scrape loop started."))
+        self._refresh(time.monotonic())
+
+        try:
+            while not self.stopping.is_set():
+                now = time.monotonic()
+                if now >= self.next_refresh:
+                    try:
+                        self._refresh(now)
+                    except Exception as e:
+                        logger.exception(f"Reference data refresh failed: {e}")
+                    connections.close_all()
+
+                self._reap()
+                self._dispatch_refreshes(now)
+                self._dispatch(now)
+
+                next_due = self.scheduler.next_due()
+                sleep_for = settings.SCRAPING_LOOP_TICK
+                if next_due is not None and self._free() > 0:
+                    sleep_for = min(sleep_for, max(0.05, next_due - time.monotonic()))
+                self.stopping.wait(sleep_for)
+
+            # Graceful drain: scrapers stop after their current page
+            for future in list(self.running):
+                try:
+                    future.result()
+                except Exception:
+                    pass
+            self._reap()
+        finally:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+            self.driver_pool.close()
+            self.tick_writer.close()
+            stats = self.driver_pool.stats()
+            ticks = self.tick_writer.stats()
+            self.stdout.write(
+                f"Scrape loop stopped. Driver pool: launched {stats['launched']}, "
+                f"reused {stats['reused']}, recycled {stats['recycled']}, "
+                f"discarded {stats['discarded']}. Ticks written: {ticks['written']}, "
+                f"unchanged: {ticks['unchanged']}"
+            )
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping", "0002_delete_logviewer"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sourceconfigmodel",
+            name="requires_js",
+            field=models.BooleanField(
+                blank=True,
+                help_text="Override the source's JavaScript requirement for this page (empty = inherit from source).",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="sourcemodel",
+            name="requires_js",
+            field=models.BooleanField(
+                default=True,
+                help_text="Load pages through headless Chrome. Disable for server-rendered sources to fetch with plain HTTP first (Chrome is then only a fallback).",
+            ),
+        ),
+    ]
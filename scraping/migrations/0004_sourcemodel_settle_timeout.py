@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping", "0003_sourceconfigmodel_requires_js_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sourcemodel",
+            name="settle_timeout",
+            field=models.FloatField(
+                blank=True,
+                help_text="Max seconds to wait for page values to stabilize after the ready element appears (empty = SCRAPING_SLEEP_TIME).",
+                null=True,
+            ),
+        ),
+    ]
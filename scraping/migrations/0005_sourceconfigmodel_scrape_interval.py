@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping", "0004_sourcemodel_settle_timeout"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sourceconfigmodel",
+            name="scrape_interval",
+            field=models.PositiveIntegerField(
+                blank=True,
+                help_text="Seconds between scrapes in scrapeloop (empty = SCRAPING_LOOP_INTERVAL).",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping", "0005_sourceconfigmodel_scrape_interval"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sourceconfigmodel",
+            name="row_key",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Key of this instrument's row on the source's listing page (e.g., price_dollar_rl). Empty = scrape `path` on its own.",
+                max_length=100,
+            ),
+        ),
+        migrations.AddField(
+            model_name="sourcemodel",
+            name="listing_path",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Path of a listing/table page holding many instruments (e.g., currency). Configs with a row key are read from it in one page load.",
+                max_length=255,
+            ),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:29
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping", "0006_sourceconfigmodel_row_key_sourcemodel_listing_path"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TickFingerprintModel",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "fingerprint",
+                    models.CharField(
+                        help_text="SHA-1 of the last written tick's price, currency and meta.",
+                        max_length=40,
+                    ),
+                ),
+                (
+                    "written_at",
+                    models.DateTimeField(
+                        help_text="When a tick was last written for this pair (heartbeats included)."
+                    ),
+                ),
+                (
+                    "instrument",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="tick_fingerprints",
+                        to="scraping.instrumentmodel",
+                    ),
+                ),
+                (
+                    "source",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="tick_fingerprints",
+                        to="scraping.sourcemodel",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Tick Fingerprint",
+                "verbose_name_plural": "Tick Fingerprints",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("instrument", "source"),
+                        name="unique_fingerprint_instrument_source",
+                    )
+                ],
+            },
+        ),
+    ]
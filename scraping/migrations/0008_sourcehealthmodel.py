@@ -0,0 +1,78 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:32
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping", "0007_tickfingerprintmodel"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SourceHealthModel",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "state",
+                    models.CharField(
+                        choices=[
+                            ("closed", "Closed"),
+                            ("open", "Open"),
+                            ("half_open", "Half-open"),
+                        ],
+                        db_index=True,
+                        default="closed",
+                        help_text="Open = skipped by the planner until the cool-down has passed; the next run then probes it (half-open).",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "consecutive_failures",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Failed page loads since the last success."
+                    ),
+                ),
+                (
+                    "latency_ewma",
+                    models.FloatField(
+                        blank=True,
+                        help_text="Exponentially weighted average page load time (seconds).",
+                        null=True,
+                    ),
+                ),
+                ("opened_at", models.DateTimeField(blank=True, null=True)),
+                ("last_success_at", models.DateTimeField(blank=True, null=True)),
+                ("last_failure_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "last_error",
+                    models.CharField(blank=True, default="", max_length=255),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "source",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="health",
+                        to="scraping.sourcemodel",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Source Health",
+                "verbose_name_plural": "Source Health",
+                "ordering": ["source__name"],
+            },
+        ),
+    ]
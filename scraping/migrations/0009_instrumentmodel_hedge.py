@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping", "0008_sourcehealthmodel"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="instrumentmodel",
+            name="hedge",
+            field=models.BooleanField(
+                default=False,
+                help_text="Race the default source against the first fallback source: the fallback starts once the default exceeds its latency budget (SCRAPING_HEDGE_PERCENTILE) and the first valid price wins.",
+            ),
+        ),
+    ]
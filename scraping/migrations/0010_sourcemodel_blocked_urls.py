@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping", "0009_instrumentmodel_hedge"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sourcemodel",
+            name="blocked_urls",
+            field=models.TextField(
+                blank=True,
+                default="",
+                help_text="Extra URL patterns the browser must not load for this source, one per line (e.g., *.cdn-ads.example/*). Images, fonts, media and common trackers are blocked already.",
+            ),
+        ),
+    ]
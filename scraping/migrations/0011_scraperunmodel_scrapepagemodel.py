@@ -0,0 +1,204 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:51
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping", "0010_sourcemodel_blocked_urls"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScrapeRunModel",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "command",
+                    models.CharField(help_text="scrape or scrapeloop.", max_length=20),
+                ),
+                (
+                    "arguments",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        help_text="Scope of the run.",
+                        max_length=255,
+                    ),
+                ),
+                ("started_at", models.DateTimeField(db_index=True)),
+                ("finished_at", models.DateTimeField()),
+                ("duration", models.FloatField(help_text="Wall-clock seconds.")),
+                (
+                    "outcome",
+                    models.CharField(
+                        choices=[
+                            ("ok", "OK"),
+                            ("partial", "Partial"),
+                            ("failed", "Failed"),
+                        ],
+                        help_text="Partial = some pages failed, failed = none succeeded.",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "page_loads",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Pages loaded or skipped."
+                    ),
+                ),
+                ("failed_pages", models.PositiveIntegerField(default=0)),
+                ("retries", models.PositiveIntegerField(default=0)),
+                (
+                    "ticks",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Ticks handed to storage (before dedupe)."
+                    ),
+                ),
+                (
+                    "driver_launch",
+                    models.FloatField(
+                        default=0.0,
+                        help_text="Seconds spent launching or acquiring browsers.",
+                    ),
+                ),
+                (
+                    "db_write",
+                    models.FloatField(
+                        default=0.0,
+                        help_text="Seconds spent writing ticks to the database.",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Scrape Run",
+                "verbose_name_plural": "Scrape Runs",
+                "ordering": ["-started_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ScrapePageModel",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("url", models.CharField(max_length=500)),
+                (
+                    "symbols",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        help_text="Instruments read from it.",
+                        max_length=255,
+                    ),
+                ),
+                (
+                    "via",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("browser", "Browser"),
+                            ("http", "HTTP"),
+                            ("async", "Async HTTP"),
+                        ],
+                        default="",
+                        max_length=10,
+                    ),
+                ),
+                ("started_at", models.DateTimeField()),
+                (
+                    "driver_launch",
+                    models.FloatField(
+                        default=0.0,
+                        help_text="Seconds to launch or acquire the browser (first page).",
+                    ),
+                ),
+                (
+                    "navigation",
+                    models.FloatField(
+                        default=0.0,
+                        help_text="Seconds loading the page, retries and back-off included.",
+                    ),
+                ),
+                (
+                    "wait",
+                    models.FloatField(
+                        default=0.0,
+                        help_text="Seconds waiting for the data to be ready and stable.",
+                    ),
+                ),
+                (
+                    "parse",
+                    models.FloatField(
+                        default=0.0, help_text="Seconds parsing the page."
+                    ),
+                ),
+                (
+                    "db_write",
+                    models.FloatField(
+                        default=0.0,
+                        help_text="Share of the seconds spent handing its ticks to storage.",
+                    ),
+                ),
+                ("retries", models.PositiveIntegerField(default=0)),
+                (
+                    "outcome",
+                    models.CharField(
+                        choices=[
+                            ("ok", "OK"),
+                            ("partial", "Partial"),
+                            ("failed", "Failed"),
+                            ("skipped", "Skipped"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("ticks", models.PositiveIntegerField(default=0)),
+                ("error", models.CharField(blank=True, default="", max_length=255)),
+                (
+                    "source",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="scrape_pages",
+                        to="scraping.sourcemodel",
+                    ),
+                ),
+                (
+                    "run",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pages",
+                        to="scraping.scraperunmodel",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Scrape Page",
+                "verbose_name_plural": "Scrape Pages",
+                "ordering": ["-started_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["source", "started_at"],
+                        name="scraping_sc_source__e1bec0_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.5 on 2026-10-17 03:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping", "0011_scraperunmodel_scrapepagemodel"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sourceconfigmodel",
+            name="max_interval",
+            field=models.PositiveIntegerField(
+                blank=True,
+                help_text="Longest interval (seconds) while the price is flat (empty = scrape_interval). See SCRAPING_CADENCE_FLAT.",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="sourceconfigmodel",
+            name="min_interval",
+            field=models.PositiveIntegerField(
+                blank=True,
+                help_text="Shortest interval (seconds) while the price moves a lot (empty = scrape_interval). See SCRAPING_CADENCE_VOLATILE.",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="tickfingerprintmodel",
+            name="seen_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When the pair was last scraped, unchanged ticks included.",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.5 on 2026-10-17 03:11
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping", "0012_sourceconfigmodel_max_interval_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RefreshRequestModel",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "requested_at",
+                    models.DateTimeField(
+                        auto_now_add=True, db_index=True, help_text="First stale read."
+                    ),
+                ),
+                (
+                    "stale_since",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="Timestamp of the stale tick that was served (empty = no tick at all).",
+                        null=True,
+                    ),
+                ),
+                (
+                    "claimed_at",
+                    models.DateTimeField(
+                        blank=True,
+                        db_index=True,
+                        help_text="When a scrapeloop picked it up; empty = waiting. Claims older than SCRAPING_REFRESH_TIMEOUT are picked up again.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "instrument",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="refresh_request",
+                        to="scraping.instrumentmodel",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Refresh Request",
+                "verbose_name_plural": "Refresh Requests",
+                "ordering": ["requested_at"],
+            },
+        ),
+    ]
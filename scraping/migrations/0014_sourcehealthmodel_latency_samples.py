@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-17 03:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping", "0013_refreshrequestmodel"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sourcehealthmodel",
+            name="latency_samples",
+            field=models.JSONField(
+                blank=True,
+                default=list,
+                help_text="Most recent page load times (seconds), for the hedge budget.",
+            ),
+        ),
+    ]
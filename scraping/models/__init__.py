@@ -1,3 +1,8 @@
 from .price_tick_model import PriceTickModel
 from .instrument_model import InstrumentModel
 from .source_model import SourceModel, SourceConfigModel
+from .tick_fingerprint_model import TickFingerprintModel
+from .source_health_model import SourceHealthModel
+from .scrape_run_model import ScrapeRunModel
+from .scrape_page_model import ScrapePageModel
+from .refresh_request_model import RefreshRequestModel
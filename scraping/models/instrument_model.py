@@ -43,6 +43,13 @@ class InstrumentModel(models.Model):
         help_text="Default source for scraping this instrument.",
     )
 
+    hedge = models.BooleanField(
+        default=False,
+        help_text="Race the default source against the first fallback source: the "
+        "fallback starts once the default exceeds its latency budget "
+        "(SCRAPING_HEDGE_PERCENTILE) and the first valid price wins.",
+    )
+
     enabled = models.BooleanField(default=True)
     updated_at = models.DateTimeField(auto_now=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -0,0 +1,45 @@
+import uuid
+from django.db import models
+
+from .instrument_model import InstrumentModel
+
+
+class RefreshRequestModel(models.Model):
+    """
+    On-demand scrape of an instrument, enqueued when the API or the bot served
+    a price older than SCRAPING_FRESHNESS_SLA (see engine.refresh). At most one
+    per instrument; scrapeloop claims it, scrapes the instrument default-first
+    ahead of its scheduled jobs and deletes it.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    instrument = models.OneToOneField(
+        InstrumentModel, on_delete=models.CASCADE, related_name="refresh_request"
+    )
+
+    requested_at = models.DateTimeField(
+        auto_now_add=True, db_index=True, help_text="First stale read."
+    )
+
+    stale_since = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Timestamp of the stale tick that was served (empty = no tick at all).",
+    )
+
+    claimed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text="When a scrapeloop picked it up; empty = waiting. Claims older "
+        "than SCRAPING_REFRESH_TIMEOUT are picked up again.",
+    )
+
+    class Meta:
+        ordering = ["requested_at"]
+        verbose_name = "Refresh Request"
+        verbose_name_plural = "Refresh Requests"
+
+    def __str__(self):
+        return f"Refresh {self.instrument} ({self.requested_at:%Y-%m-%d %H:%M:%S})"
@@ -0,0 +1,80 @@
+import uuid
+from django.db import models
+
+from .source_model import SourceModel
+from .scrape_run_model import ScrapeRunModel
+
+
+class ScrapePageModel(models.Model):
+    """
+    Timing breakdown of one page of a scrape run: where the time went
+    between browser launch, navigation, readiness wait, parsing and storage.
+    """
+
+    class Via(models.TextChoices):
+        BROWSER = "browser", "Browser"
+        HTTP = "http", "HTTP"
+        ASYNC = "async", "Async HTTP"
+
+    class Outcome(models.TextChoices):
+        OK = "ok", "OK"
+        PARTIAL = "partial", "Partial"
+        FAILED = "failed", "Failed"
+        SKIPPED = "skipped", "Skipped"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    run = models.ForeignKey(
+        ScrapeRunModel, on_delete=models.CASCADE, related_name="pages"
+    )
+
+    source = models.ForeignKey(
+        SourceModel, on_delete=models.CASCADE, related_name="scrape_pages"
+    )
+
+    url = models.CharField(max_length=500)
+    symbols = models.CharField(
+        max_length=255, blank=True, default="", help_text="Instruments read from it."
+    )
+    via = models.CharField(max_length=10, choices=Via.choices, blank=True, default="")
+    started_at = models.DateTimeField()
+
+    driver_launch = models.FloatField(
+        default=0.0, help_text="Seconds to launch or acquire the browser (first page)."
+    )
+    navigation = models.FloatField(
+        default=0.0,
+        help_text="Seconds loading the page, retries and back-off included.",
+    )
+    wait = models.FloatField(
+        default=0.0, help_text="Seconds waiting for the data to be ready and stable."
+    )
+    parse = models.FloatField(default=0.0, help_text="Seconds parsing the page.")
+    db_write = models.FloatField(
+        default=0.0,
+        help_text="Share of the seconds spent handing its ticks to storage.",
+    )
+
+    retries = models.PositiveIntegerField(default=0)
+    outcome = models.CharField(max_length=10, choices=Outcome.choices)
+    ticks = models.PositiveIntegerField(default=0)
+    error = models.CharField(max_length=255, blank=True, default="")
+
+    @property
+    def total(self) -> float:
+        return (
+            self.driver_launch
+            + self.navigation
+            + self.wait
+            + self.parse
+            + self.db_write
+        )
+
+    def __str__(self):
+        return f"{self.source.name}: {self.url} ({self.outcome})"
+
+    class Meta:
+        ordering = ["-started_at"]
+        indexes = [models.Index(fields=["source", "started_at"])]
+        verbose_name = "Scrape Page"
+        verbose_name_plural = "Scrape Pages"
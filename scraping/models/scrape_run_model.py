@@ -0,0 +1,56 @@
+import uuid
+from django.db import models
+
+
+class ScrapeRunModel(models.Model):
+    """
+    One scrape run (a `scrape` command, or one scraper session of
+    `scrapeloop`) with totals over its pages (see ScrapePageModel).
+    Written in bulk with its pages when the run ends.
+    """
+
+    class Outcome(models.TextChoices):
+        OK = "ok", "OK"
+        PARTIAL = "partial", "Partial"
+        FAILED = "failed", "Failed"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    command = models.CharField(max_length=20, help_text="scrape or scrapeloop.")
+    arguments = models.CharField(
+        max_length=255, blank=True, default="", help_text="Scope of the run."
+    )
+
+    started_at = models.DateTimeField(db_index=True)
+    finished_at = models.DateTimeField()
+    duration = models.FloatField(help_text="Wall-clock seconds.")
+
+    outcome = models.CharField(
+        max_length=10,
+        choices=Outcome.choices,
+        help_text="Partial = some pages failed, failed = none succeeded.",
+    )
+
+    page_loads = models.PositiveIntegerField(
+        default=0, help_text="Pages loaded or skipped."
+    )
+    failed_pages = models.PositiveIntegerField(default=0)
+    retries = models.PositiveIntegerField(default=0)
+    ticks = models.PositiveIntegerField(
+        default=0, help_text="Ticks handed to storage (before dedupe)."
+    )
+
+    driver_launch = models.FloatField(
+        default=0.0, help_text="Seconds spent launching or acquiring browsers."
+    )
+    db_write = models.FloatField(
+        default=0.0, help_text="Seconds spent writing ticks to the database."
+    )
+
+    def __str__(self):
+        return f"{self.command} {self.arguments} @ {self.started_at:%Y-%m-%d %H:%M:%S}"
+
+    class Meta:
+        ordering = ["-started_at"]
+        verbose_name = "Scrape Run"
+        verbose_name_plural = "Scrape Runs"
@@ -0,0 +1,62 @@
+import uuid
+from django.db import models
+
+from .source_model import SourceModel
+
+
+class SourceHealthModel(models.Model):
+    """
+    Circuit-breaker state of a source, persisted so it survives across runs
+    and daemon cycles (see engine.health.HealthTracker).
+    """
+
+    class State(models.TextChoices):
+        CLOSED = "closed", "Closed"
+        OPEN = "open", "Open"
+        HALF_OPEN = "half_open", "Half-open"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    source = models.OneToOneField(
+        SourceModel, on_delete=models.CASCADE, related_name="health"
+    )
+
+    state = models.CharField(
+        max_length=10,
+        choices=State.choices,
+        default=State.CLOSED,
+        db_index=True,
+        help_text="Open = skipped by the planner until the cool-down has passed; "
+        "the next run then probes it (half-open).",
+    )
+
+    consecutive_failures = models.PositiveIntegerField(
+        default=0, help_text="Failed page loads since the last success."
+    )
+
+    latency_ewma = models.FloatField(
+        null=True,
+        blank=True,
+        help_text="Exponentially weighted average page load time (seconds).",
+    )
+
+    latency_samples = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Most recent page load times (seconds), for the hedge budget.",
+    )
+
+    opened_at = models.DateTimeField(null=True, blank=True)
+    last_success_at = models.DateTimeField(null=True, blank=True)
+    last_failure_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.CharField(max_length=255, blank=True, default="")
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.source.name}: {self.state}"
+
+    class Meta:
+        ordering = ["source__name"]
+        verbose_name = "Source Health"
+        verbose_name_plural = "Source Health"
@@ -11,6 +11,35 @@ class SourceModel(models.Model):
     name = models.CharField(max_length=50, unique=True, db_index=True)
     base_url = models.URLField()
 
+    requires_js = models.BooleanField(
+        default=True,
+        help_text="Load pages through headless Chrome. Disable for server-rendered "
+        "sources to fetch with plain HTTP first (Chrome is then only a fallback).",
+    )
+
+    settle_timeout = models.FloatField(
+        null=True,
+        blank=True,
+        help_text="Max seconds to wait for page values to stabilize after the "
+        "ready element appears (empty = SCRAPING_SLEEP_TIME).",
+    )
+
+    listing_path = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        help_text="Path of a listing/table page holding many instruments "
+        "(e.g., currency). Configs with a row key are read from it in one page load.",
+    )
+
+    blocked_urls = models.TextField(
+        blank=True,
+        default="",
+        help_text="Extra URL patterns the browser must not load for this source, one "
+        "per line (e.g., *.cdn-ads.example/*). Images, fonts, media and common "
+        "trackers are blocked already.",
+    )
+
     enabled = models.BooleanField(default=True)
     updated_at = models.DateTimeField(auto_now=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -48,6 +77,51 @@ class SourceConfigModel(models.Model):
         help_text="URL path for scraping (e.g., profile/price_dollar_rl)",
     )
 
+    row_key = models.CharField(
+        max_length=100,
+        blank=True,
+        default="",
+        help_text="Key of this instrument's row on the source's listing page "
+        "(e.g., price_dollar_rl). Empty = scrape `path` on its own.",
+    )
+
+    requires_js = models.BooleanField(
+        null=True,
+        blank=True,
+        help_text="Override the source's JavaScript requirement for this page "
+        "(empty = inherit from source).",
+    )
+
+    scrape_interval = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Seconds between scrapes in scrapeloop (empty = SCRAPING_LOOP_INTERVAL).",
+    )
+
+    min_interval = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Shortest interval (seconds) while the price moves a lot "
+        "(empty = scrape_interval). See SCRAPING_CADENCE_VOLATILE.",
+    )
+
+    max_interval = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Longest interval (seconds) while the price is flat "
+        "(empty = scrape_interval). See SCRAPING_CADENCE_FLAT.",
+    )
+
+    def clean(self):
+        if (
+            self.min_interval is not None
+            and self.max_interval is not None
+            and self.min_interval > self.max_interval
+        ):
+            raise ValidationError(
+                {"min_interval": "Must not be larger than max_interval."}
+            )
+
     class Meta:
         verbose_name = "Source Config"
         verbose_name_plural = "Source Configs"
@@ -0,0 +1,50 @@
+import uuid
+from django.db import models
+
+from .source_model import SourceModel
+from .instrument_model import InstrumentModel
+
+
+class TickFingerprintModel(models.Model):
+    """
+    Fingerprint of the last tick written per (instrument, source).
+    Lets ingestion skip ticks whose payload did not change since then.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    source = models.ForeignKey(
+        SourceModel, on_delete=models.CASCADE, related_name="tick_fingerprints"
+    )
+
+    instrument = models.ForeignKey(
+        InstrumentModel, on_delete=models.CASCADE, related_name="tick_fingerprints"
+    )
+
+    fingerprint = models.CharField(
+        max_length=40,
+        help_text="SHA-1 of the last written tick's price, currency and meta.",
+    )
+
+    written_at = models.DateTimeField(
+        help_text="When a tick was last written for this pair (heartbeats included)."
+    )
+
+    seen_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the pair was last scraped, unchanged ticks included.",
+    )
+
+    def __str__(self):
+        return f"{self.instrument.symbol} fingerprint from {self.source.name}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["instrument", "source"],
+                name="unique_fingerprint_instrument_source",
+            )
+        ]
+        verbose_name = "Tick Fingerprint"
+        verbose_name_plural = "Tick Fingerprints"
@@ -1,89 +1,642 @@
+import time
 import logging
-import platform
-from typing import List, Dict, Any
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from bs4 import BeautifulSoup
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 from abc import ABC, abstractmethod
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 
 from django.conf import settings
-from django.db import transaction
-from ..models import InstrumentModel, PriceTickModel, SourceModel
+from django.utils import timezone
+from ..models import SourceConfigModel, SourceModel
+from ..engine.http_client import fetch_html
+from ..engine.parsing import fragment_html, parse_html
+from ..engine.readiness import wait_until_ready
+from ..engine.ingestion import TickRecord, TickWriter, save_ticks
+from ..engine.retry import RetryBudget
+from ..engine.health import HealthTracker, get_health_tracker
+from ..engine.stats import PageStat, ScrapeStats, summarize_settle
+from ..engine.telemetry import RunRecorder
+from ..engine.driver_pool import (
+    DriverPool,
+    apply_blocked_urls,
+    blocked_urls_for,
+    create_driver,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class BaseScraper(ABC):
-    def __init__(self, source: SourceModel, auto_driver=False):
+    # Element that proves the page holds the data we parse. Used both as the
+    # WebDriverWait condition and as the HTTP-first probe.
+    ready_locator: Tuple[str, str] = (By.TAG_NAME, "body")
+    # CSS selector of the only part of the page parse_page reads (it must also
+    # contain the ready_locator element). Only that subtree is taken from the
+    # browser and parsed; None parses the whole document.
+    fragment_selector: Optional[str] = None
+    page_timeout = 30
+    # Errors worth another attempt at the same page; parse errors are not.
+    retry_exceptions: Tuple[type, ...] = (TimeoutException, WebDriverException)
+    # Listing pages: scrapers that set these (and implement parse_row) can serve
+    # every config with a row_key from the source's listing_path in one navigation.
+    listing_row_selector: Optional[str] = None
+    listing_row_key: Optional[str] = None  # row attribute matched against row_key
+
+    def __init__(
+        self,
+        source: SourceModel,
+        auto_driver=False,
+        instruments: Optional[List[str]] = None,
+        configs: Optional[Iterable[SourceConfigModel]] = None,
+        driver_pool: Optional[DriverPool] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        tick_writer: Optional[TickWriter] = None,
+        health: Optional[HealthTracker] = None,
+        recorder: Optional[RunRecorder] = None,
+        backend: Optional[str] = None,
+    ):
         self.driver = None
         self.source = source
+        self.source_configs = self.load_configs(instruments, configs)
         self.auto_driver = auto_driver
+        self.driver_pool = driver_pool
+        # Browser / HTTP backend ("chrome" / "fake"); SCRAPING_DRIVER when None
+        self.backend = backend
+        self.tick_writer = tick_writer
+        self.health = health or get_health_tracker()
+        self.recorder = recorder
         self.sleep_time = settings.SCRAPING_SLEEP_TIME
+        self.stop_event = threading.Event()
+        self.aborted = False
+        self.pages_loaded = 0
+        self.page_stats: List[PageStat] = []
+        self._page: Optional[PageStat] = None  # page being loaded
+        self._yield_page: Optional[PageStat] = None  # page of the last yielded record
+        self.pipeline = settings.SCRAPING_PIPELINE
+        self.fragments = settings.SCRAPING_HTML_FRAGMENTS
+        self.retry_attempts = max(1, settings.SCRAPING_RETRY_ATTEMPTS)
+        self.retry_budget = retry_budget or RetryBudget(settings.SCRAPING_RETRY_BUDGET)
+        self.stats = ScrapeStats(source=source.name)
+        self._soup_cache: Tuple[
+            Optional[str], Optional[str], Optional[BeautifulSoup]
+        ] = (
+            None,
+            None,
+            None,
+        )
+
+    def load_configs(
+        self,
+        instruments: Optional[List[str]] = None,
+        configs: Optional[Iterable[SourceConfigModel]] = None,
+    ) -> List[SourceConfigModel]:
+        """
+        Configs to scrape. A compiled plan passes them in directly; otherwise
+        they are loaded (with their instrument) in a single query.
+        """
+        if configs is None:
+            qs = SourceConfigModel.objects.filter(source=self.source).select_related(
+                "instrument"
+            )
+            if instruments:
+                qs = qs.filter(instrument__symbol__in=instruments)
+            configs = qs
+        configs = list(configs)
+        if not configs:
+            logger.warning(
+                f"No configurations found for source {self.source.name} for instruments {instruments}"
+            )
+        return configs
 
     def init_driver(self):
-        driver_path = (
-            f"{settings.BASE_DIR}/scraping/sources/drivers/chromedriver.exe"
-            if platform.system() == "Windows"
-            else f"{settings.BASE_DIR}/scraping/sources/drivers/chromedriver"
+        # Persistent per-source profile (disk cache) when SCRAPING_BROWSER_CACHE is on
+        key = self.source.name if settings.SCRAPING_BROWSER_CACHE else None
+        started = time.monotonic()
+        if self.driver_pool:
+            self.driver = self.driver_pool.acquire(key)
+        else:
+            self.driver = create_driver(
+                self.auto_driver, cache_key=key, backend=self.backend
+            )
+        if self._page is not None:
+            self._page.launch += time.monotonic() - started
+        # Pooled browsers move between sources, so the blocklist is set per use
+        apply_blocked_urls(self.driver, blocked_urls_for(self.source))
+
+    def close_driver(self):
+        """Hand the driver back to the pool (or quit it when running unpooled)."""
+        driver, self.driver = self.driver, None
+        if not driver:
+            return
+        if self.driver_pool:
+            self.driver_pool.release(
+                driver, pages=self.pages_loaded, broken=self.aborted
+            )
+            return
+        try:
+            driver.quit()
+        except Exception:
+            # Already quit by abort()
+            pass
+
+    def abort(self):
+        """
+        Ask a running scrape to stop: no further configs are started and the
+        driver is quit so a blocked Selenium call returns immediately.
+        Safe to call from another thread.
+        """
+        self.aborted = True
+        self.stop_event.set()
+        driver = self.driver
+        if driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def iter_configs(self, groups: Iterable[Tuple[str, List]]) -> Iterator:
+        """
+        Yield (url, configs) page groups until the scraper is asked to stop.
+        The configs of the pages left are recorded as skipped (and failed).
+        """
+        groups = iter(groups)
+        for url, configs in groups:
+            if self.stop_event.is_set():
+                logger.warning(
+                    f"Stop requested; skipping remaining configs for {self.source.name}"
+                )
+                self._skip(url, configs)
+                for url, configs in groups:
+                    self._skip(url, configs)
+                return
+            yield url, configs
+
+    def _skip(self, url: str, configs: List):
+        symbols = [c.instrument.symbol for c in configs]
+        self.page_stats.append(
+            PageStat(
+                url=url,
+                symbols=", ".join(symbols)[:255],
+                started_at=timezone.now(),
+                outcome="skipped",
+                error="stopped",
+            )
+        )
+        self.stats.failed += len(symbols)
+        self.stats.failed_symbols.extend(symbols)
+        self.stats.skipped_symbols.extend(symbols)
+
+    # -------------------- page loading --------------------
+
+    def requires_js(self, config) -> bool:
+        """Per-config override wins; otherwise the source decides."""
+        override = getattr(config, "requires_js", None)
+        if override is not None:
+            return override
+        return getattr(self.source, "requires_js", True)
+
+    def page_ready(
+        self, soup: BeautifulSoup, locator: Optional[Tuple[str, str]] = None
+    ) -> bool:
+        """
+        Whether a statically fetched document already contains the expected data.
+        Only CSS locators can be checked here; override for anything else.
+        """
+        by, selector = locator or self.ready_locator
+        if by == By.CSS_SELECTOR:
+            return soup.select_one(selector) is not None
+        return False
+
+    def make_soup(self, html: str, fragment: Optional[str] = None) -> BeautifulSoup:
+        """Parse html (only `fragment` if given), reusing the soup of the HTTP probe."""
+        cached_html, cached_fragment, cached_soup = self._soup_cache
+        if (
+            cached_html is html
+            and cached_fragment == fragment
+            and cached_soup is not None
+        ):
+            return cached_soup
+        soup = parse_html(html, fragment)
+        self._soup_cache = (html, fragment, soup)
+        return soup
+
+    def fragment_for(self, config) -> Optional[str]:
+        """Selector of the subtree a config is parsed from (None: whole page)."""
+        if not self.fragments:
+            return None
+        if self.uses_listing(config):
+            return self.listing_row_selector
+        return self.fragment_selector
+
+    def group_fragment(self, configs: List) -> Optional[str]:
+        """The fragment shared by every config read from one page, if any."""
+        fragments = {self.fragment_for(c) for c in configs}
+        return fragments.pop() if len(fragments) == 1 else None
+
+    @property
+    def settle_cap(self) -> float:
+        """Upper bound for the readiness wait (per source, else SCRAPING_SLEEP_TIME)."""
+        cap = getattr(self.source, "settle_timeout", None)
+        return self.sleep_time if cap is None else cap
+
+    def load_page(self, url: str, config=None) -> str:
+        """
+        Return the HTML for url.
+
+        Configs that do not require JavaScript are fetched with the pooled httpx
+        client first; the WebDriver is only used (and only launched) when that
+        fails or the document lacks the config's ready locator.
+        """
+        locator = self.page_locator(config) if config is not None else None
+        locator = locator or self.ready_locator
+        fragment = self.fragment_for(config) if config is not None else None
+        page = self.page_stat(url)
+        if config is not None and not self.requires_js(config):
+            html = fetch_html(url, self.backend)
+            if html is not None:
+                if self.page_ready(self.make_soup(html, fragment), locator):
+                    page.via = "http"
+                    return html
+                logger.info(
+                    f"Expected element missing in static HTML of {url}; falling back to WebDriver"
+                )
+
+        if not self.driver:
+            self.init_driver()
+
+        self.pages_loaded += 1
+        self.driver.get(url)  # type: ignore
+
+        WebDriverWait(self.driver, self.page_timeout).until(  # type: ignore
+            EC.presence_of_element_located(locator)
         )
-        service = (
-            Service(driver_path)
-            if not self.auto_driver
-            else Service(ChromeDriverManager().install())
+
+        # Wait until the target values are filled in and stable (bounded by the cap)
+        readiness = wait_until_ready(
+            self.driver,
+            locator,
+            cap=self.settle_cap,
+            poll=settings.SCRAPING_READY_POLL,
+            quiet=settings.SCRAPING_READY_QUIET,
+        )
+        page.via = "browser"
+        page.settle += readiness.elapsed
+        page.settled = readiness.settled
+        if not readiness.settled:
+            logger.info(f"Readiness cap of {self.settle_cap}s reached for {url}")
+
+        # Serializing the whole DOM is slow on large pages; take only the fragment
+        if fragment:
+            html = fragment_html(self.driver, fragment)
+            if html is not None:
+                return html
+        return self.driver.page_source  # type: ignore
+
+    # -------------------- fetching --------------------
+
+    def uses_listing(self, config) -> bool:
+        """Whether this config is read from a row of the source's listing page."""
+        return bool(
+            self.listing_row_selector
+            and getattr(self.source, "listing_path", "")
+            and getattr(config, "row_key", "")
+        )
+
+    def page_url(self, config) -> str:
+        path = self.source.listing_path if self.uses_listing(config) else config.path
+        return f"{self.source.base_url}/{path}"
+
+    def page_locator(self, config) -> Tuple[str, str]:
+        if self.uses_listing(config):
+            return (By.CSS_SELECTOR, self.listing_row_selector)  # type: ignore
+        return self.ready_locator
+
+    def listing_rows(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """Rows of a listing page keyed by their `listing_row_key` attribute."""
+        rows: Dict[str, Any] = {}
+        for row in soup.select(self.listing_row_selector or ""):
+            key = row.get(self.listing_row_key or "")
+            if key:
+                rows.setdefault(str(key), row)
+        return rows
+
+    def parse_row(self, config, url: str, row) -> Dict[str, Any]:
+        """Extract one record from a listing row (scrapers with listing support)."""
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support listing pages"
         )
-        options = Options()
-        options.add_argument("--headless")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64)")
-        self.driver = webdriver.Chrome(service=service, options=options)
 
     @abstractmethod
-    def fetch_data(self) -> List[Dict[str, Any]]:
-        pass
+    def parse_page(self, config, url: str, soup: BeautifulSoup) -> Dict[str, Any]:
+        """Extract one record (symbol, price, currency, meta); raise ValueError if the page lacks it."""
 
-    def scrape(self):
-        if not self.source.enabled:
-            logger.warning(f"Source {self.source.name} is disabled.")
+    def _reset_driver(self):
+        """Drop a browser that raised a WebDriver error; the next load starts a fresh one."""
+        driver, self.driver = self.driver, None
+        if not driver:
+            return
+        if self.driver_pool:
+            self.driver_pool.release(driver, pages=self.pages_loaded, broken=True)
+            self.pages_loaded = 0
             return
-
-        self.init_driver()
         try:
-            data = self.fetch_data() or []
-            if not data:
-                logger.info(f"No data fetched from {self.source.name}")
-                return
+            driver.quit()
+        except Exception:
+            pass
 
-            symbols = [d.get("symbol") for d in data if d.get("symbol")]
-            inst_map = {
-                i.symbol: i for i in InstrumentModel.objects.filter(symbol__in=symbols)
-            }
+    def _retry_delay(self, attempt: int) -> float:
+        # Exponential backoff, bounded like the old whole-run retries (4s..10s)
+        return min(
+            settings.SCRAPING_RETRY_WAIT_MAX,
+            max(settings.SCRAPING_RETRY_WAIT_MIN, 2 ** (attempt - 1)),
+        )
 
-            objs = []
-            for d in data:
-                inst = inst_map.get(d["symbol"])
-                if not inst:
-                    logger.warning(f"Instrument not found: {d['symbol']}")
-                    continue
-                objs.append(
-                    PriceTickModel(
-                        instrument=inst,
-                        source=self.source,
-                        price=d["price"],
-                        currency=d.get("currency") or "IRR",
-                        meta=d.get("meta") or {},
+    def load_with_retry(self, url: str, config) -> Optional[str]:
+        """
+        load_page() with retries: transient browser errors are retried up to
+        SCRAPING_RETRY_ATTEMPTS times for this page only, while the source's
+        retry budget lasts. Returns None when the page could not be loaded.
+        Each page load is reported to the source's circuit breaker once, after
+        its retries: a page that could not be loaded is one failure, however
+        many attempts it took. Once the circuit is open the remaining pages
+        are skipped without loading.
+        """
+        attempt = 1
+        page = self.page_stat(url)
+        while True:
+            if not self.health.allows(self.source):
+                logger.warning(
+                    f"Circuit for {self.source.name} is open; skipping {url}"
+                )
+                page.outcome, page.error = "skipped", "circuit open"
+                return None
+            started = time.monotonic()
+            try:
+                html = self.load_page(url, config)
+                self.health.record_success(self.source, time.monotonic() - started)
+                page.outcome, page.error = "ok", ""
+                return html
+            except self.retry_exceptions as e:
+                # Selenium messages carry a multi-line stacktrace; keep the first line
+                reason = (str(e).strip() or type(e).__name__).splitlines()[0]
+                page.outcome, page.error = "failed", reason[:255]
+                if self.aborted or self.stop_event.is_set():
+                    logger.error(f"Error fetching {url} while stopping: {reason}")
+                    return None
+                if attempt >= self.retry_attempts:
+                    logger.error(
+                        f"Giving up on {url} after {attempt} attempt(s): {reason}"
                     )
+                    self.health.record_failure(self.source, reason)
+                    return None
+                if not self.retry_budget.take():
+                    self.stats.budget_exhausted = True
+                    logger.error(
+                        f"Retry budget of {self.source.name} exhausted; not retrying {url}: {reason}"
+                    )
+                    self.health.record_failure(self.source, reason)
+                    return None
+                if not isinstance(e, TimeoutException):
+                    self._reset_driver()
+                delay = self._retry_delay(attempt)
+                attempt += 1
+                self.stats.retries += 1
+                page.retries += 1
+                logger.warning(
+                    f"Retrying {url} in {delay:.0f}s (attempt {attempt}/{self.retry_attempts}): {reason}"
                 )
+                if self.stop_event.wait(delay):
+                    return None
+            except Exception as e:
+                logger.error(f"Unexpected error fetching data from {url}: {str(e)}")
+                self.health.record_failure(self.source, str(e))
+                page.outcome, page.error = "failed", str(e)[:255]
+                return None
 
-            with transaction.atomic():
-                PriceTickModel.objects.bulk_create(objs, ignore_conflicts=True)
+    def parse_config(
+        self, config, url: str, soup: BeautifulSoup, rows: Optional[Dict] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Parse the record of one config from a loaded page; None on parse errors."""
+        symbol = config.instrument.symbol
+        try:
+            if self.uses_listing(config):
+                row = (rows or {}).get(config.row_key)
+                if row is None:
+                    raise ValueError(
+                        f"Row '{config.row_key}' not found on listing page"
+                    )
+                data = self.parse_row(config, url, row)
+            else:
+                data = self.parse_page(config, url, soup)
+            if not data or data.get("price") is None:
+                raise ValueError("Current price not found")
+            logger.debug(f"Extracted data for {symbol}: {data}")
+            return data
+        except ValueError as e:
+            logger.error(f"Parsing error for {symbol}: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error parsing {symbol} from {url}: {str(e)}")
+        return None
+
+    def fetch_config(self, config) -> Optional[Dict[str, Any]]:
+        """Load and parse the page of a single config."""
+        url = self.page_url(config)
+        logger.info(f"Fetching data for {config.instrument.symbol} from {url}")
+        html = self.load_with_retry(url, config)
+        if html is None:
+            return None
+        soup = self.make_soup(html, self.fragment_for(config))
+        rows = self.listing_rows(soup) if self.uses_listing(config) else None
+        return self.parse_config(config, url, soup, rows)
+
+    def group_by_url(self, configs: Iterable) -> Dict[str, List]:
+        """Configs keyed by the page they are read from, in first-seen order."""
+        groups: Dict[str, List] = {}
+        for config in configs:
+            groups.setdefault(self.page_url(config), []).append(config)
+        return groups
+
+    def page_stat(self, url: str) -> PageStat:
+        """PageStat of the page being loaded; a new one for a new URL."""
+        page = self._page
+        if page is None or page.url != url:
+            page = PageStat(url=url, started_at=timezone.now())
+            self.page_stats.append(page)
+            self._page = page
+        return page
 
-            logger.info(f"Saved {len(objs)} ticks for {self.source.name}")
+    def parse_group(
+        self, url: str, configs: List, html: Optional[str]
+    ) -> Tuple[List[Tuple[Any, Optional[Dict[str, Any]]]], float]:
+        """Parse one loaded page for all its configs. Returns ([(config, data)], seconds)."""
+        started = time.monotonic()
+        soup = None
+        if html is not None:
+            soup = self.make_soup(html, self.group_fragment(configs))
+        rows = None
+        if soup is not None and any(self.uses_listing(c) for c in configs):
+            rows = self.listing_rows(soup)
+        results = []
+        for config in configs:
+            data = None
+            if soup is not None:
+                data = self.parse_config(config, url, soup, rows)
+            results.append((config, data))
+        return results, time.monotonic() - started
+
+    def _collect(
+        self, results: List[Tuple[Any, Optional[Dict[str, Any]]]], page: PageStat
+    ):
+        page.finish(results)
+        self._yield_page = page
+        for config, data in results:
+            self.stats.pages += 1
+            if data is None:
+                self.stats.failed += 1
+                self.stats.failed_symbols.append(config.instrument.symbol)
+                continue
+            self.stats.succeeded += 1
+            self.stats.ok_symbols.append(config.instrument.symbol)
+            yield data
+
+    def iter_data(self) -> Iterator[Dict[str, Any]]:
+        """
+        Scrape page by page, yielding each record as soon as it is parsed.
+        Configs sharing a URL (listing pages, duplicate paths) cost one page
+        load. Pages that succeeded are kept whatever happens to the others.
+
+        With SCRAPING_PIPELINE, page N is parsed on a worker thread while the
+        browser navigates to page N+1 (at most one page waits to be parsed).
+        Load / parse times and the overlap are recorded in self.stats.
+        """
+        groups = self.group_by_url(self.source_configs)
+        pool = (
+            ThreadPoolExecutor(1, thread_name_prefix=f"parse-{self.source.name}")
+            if self.pipeline and len(groups) > 1
+            else None
+        )
+        pending: Deque[Tuple[Future, PageStat]] = deque()
 
+        def finish(future: Future, page: PageStat):
+            waited = time.monotonic()
+            results, took = future.result()
+            self.stats.parse_wait_seconds += time.monotonic() - waited
+            self.stats.parse_seconds += took
+            page.parse = took
+            return results, page
+
+        try:
+            for url, configs in self.iter_configs(groups.items()):
+                symbols = ", ".join(c.instrument.symbol for c in configs)
+                logger.info(f"Fetching data for {symbols} from {url}")
+                self.stats.page_loads += 1
+                page = self.page_stat(url)
+                page.symbols = symbols[:255]
+                started = time.monotonic()
+                html = self.load_with_retry(url, configs[0])
+                loaded = time.monotonic() - started
+                self.stats.load_seconds += loaded
+                page.navigation = max(0.0, loaded - page.launch - page.settle)
+                if html is None and page.outcome == "ok":
+                    page.outcome = "failed"
+
+                if pool is None:
+                    results, took = self.parse_group(url, configs, html)
+                    self.stats.parse_seconds += took
+                    self.stats.parse_wait_seconds += took
+                    page.parse = took
+                    yield from self._collect(results, page)
+                    continue
+
+                future = pool.submit(self.parse_group, url, configs, html)
+                pending.append((future, page))
+                # Hand back finished pages; never let more than one wait for parsing
+                while pending and (pending[0][0].done() or len(pending) > 1):
+                    yield from self._collect(*finish(*pending.popleft()))
+            while pending:
+                yield from self._collect(*finish(*pending.popleft()))
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+    def fetch_data(self) -> List[Dict[str, Any]]:
+        """All records as a list (kept for callers that want the whole batch)."""
+        return list(self.iter_data())
+
+    def stream(self) -> Iterator[Dict[str, Any]]:
+        """
+        Records in streaming order. Scrapers that still override fetch_data()
+        to return a list are adapted: their list is streamed once it is ready.
+        """
+        if type(self).fetch_data is not BaseScraper.fetch_data:
+            return iter(self.fetch_data() or [])
+        return self.iter_data()
+
+    def store(self, records: List[TickRecord]) -> int:
+        if self.tick_writer:
+            # Write-behind: the shared writer batches ticks of all scrapers
+            return self.tick_writer.submit(records)
+        return save_ticks(records)
+
+    def _store_batch(self, batch: List[Tuple[TickRecord, Optional[PageStat]]]) -> int:
+        """store() a batch, sharing its time and ticks out to the pages they came from."""
+        started = time.monotonic()
+        saved = self.store([record for record, _ in batch])
+        share = (time.monotonic() - started) / len(batch)
+        for _, page in batch:
+            if page is not None:
+                page.ticks += 1
+                page.store += share
+        return saved
+
+    def scrape(self) -> ScrapeStats:
+        """
+        Fetch -> parse -> store as a stream: records are stored in batches of
+        SCRAPING_STREAM_BATCH_SIZE while the run goes on, so a crash late in the
+        run keeps earlier ticks and memory stays bounded.
+        """
+        if not self.source.enabled:
+            logger.warning(f"Source {self.source.name} is disabled.")
+            return self.stats
+
+        batch_size = max(1, settings.SCRAPING_STREAM_BATCH_SIZE)
+        pending: List[Tuple[TickRecord, Optional[PageStat]]] = []
+        try:
+            for data in self.stream():
+                record = TickRecord.from_data(self.source, data)
+                pending.append((record, self._yield_page))
+                if len(pending) >= batch_size:
+                    self.stats.saved += self._store_batch(pending)
+                    pending = []
         except Exception as e:
             logger.exception(f"Failed to scrape {self.source.name}: {e}")
         finally:
-            if self.driver:
-                self.driver.quit()
+            try:
+                if pending:
+                    self.stats.saved += self._store_batch(pending)
+            except Exception as e:
+                logger.exception(f"Failed to store ticks for {self.source.name}: {e}")
+            self.close_driver()
+            if self.recorder is not None:
+                self.recorder.add(self)
+            if self.stats.saved:
+                verb = "Queued" if self.tick_writer else "Saved"
+                logger.info(f"{verb} {self.stats.saved} ticks for {self.source.name}")
+            else:
+                logger.info(f"No data fetched from {self.source.name}")
+            summary = summarize_settle(self.page_stats)
+            if summary:
+                logger.info(f"Readiness for {self.source.name}: {summary}")
+            logger.info(f"Run stats for {self.source.name}: {self.stats.summary()}")
+            if self.stats.page_loads:
+                logger.info(
+                    f"Stage timings for {self.source.name}: {self.stats.stages()}"
+                )
+        return self.stats
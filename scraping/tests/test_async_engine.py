@@ -0,0 +1,72 @@
+from unittest import mock
+
+from django.test import TransactionTestCase
+
+from ..engine.async_engine import AsyncHttpEngine, AsyncJob
+from ..engine.corpus import get_page_corpus
+from ..engine.fake_web import FakeWeb
+from ..engine.health import HealthTracker
+from ..engine.ingestion import clear_instrument_cache
+from ..models import PriceTickModel, SourceConfigModel, SourceModel
+from ..sources import TgjuScraper, WallexScraper
+
+
+class _CrashingScraper(TgjuScraper):
+    """Parsing EUR raises outside the scraper's own error handling."""
+
+    def parse_config(self, config, url, soup, rows=None):
+        if config.instrument.symbol == "EUR":
+            raise RuntimeError("parser crashed")
+        return super().parse_config(config, url, soup, rows)
+
+
+class AsyncEngineErrorTests(TransactionTestCase):
+    """One bad page must not take the other pages of the run down."""
+
+    fixtures = ["corpus_sources"]
+
+    def setUp(self):
+        clear_instrument_cache()
+        self.health = HealthTracker(threshold=10)
+        web = FakeWeb(get_page_corpus(), latency=0, jitter=0)
+        patcher = mock.patch("scraping.engine.fake_web._shared_web", web)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _job(self, scraper_cls, source_name):
+        source = SourceModel.objects.get(name=source_name)
+        scraper = scraper_cls(source, health=self.health)
+        return AsyncJob(scraper, scraper.source_configs)
+
+    def _run(self, *jobs):
+        return AsyncHttpEngine(backend="fake").run(list(jobs))
+
+    def test_a_crashing_page_falls_back_to_the_browser(self):
+        tgju = self._job(_CrashingScraper, "tgju")
+        wallex = self._job(WallexScraper, "wallex")
+        with self.assertLogs("scraping.engine.async_engine", "ERROR") as logs:
+            self._run(tgju, wallex)
+
+        self.assertIn("parser crashed", logs.output[0])
+        self.assertEqual(tgju.stats.ok_symbols, ["USD"])
+        self.assertEqual([c.instrument.symbol for c in tgju.fallback], ["EUR"])
+        eur = next(p for p in tgju.scraper.page_stats if "price_eur" in p.url)
+        self.assertEqual((eur.outcome, eur.error), ("failed", "parser crashed"))
+        self.assertEqual(wallex.stats.ok_symbols, ["BTC"])
+        self.assertEqual(
+            sorted(PriceTickModel.objects.values_list("instrument__symbol", flat=True)),
+            ["BTC", "USD"],
+        )
+
+    def test_an_unreachable_page_falls_back_to_the_browser(self):
+        SourceConfigModel.objects.filter(instrument__symbol="EUR").update(
+            path="profile/not-recorded"
+        )
+        tgju = self._job(TgjuScraper, "tgju")
+        self._run(tgju)
+
+        self.assertEqual(tgju.stats.ok_symbols, ["USD"])
+        self.assertEqual([c.instrument.symbol for c in tgju.fallback], ["EUR"])
+        # HTTP errors are left to the browser retry, not the circuit breaker
+        source = tgju.scraper.source
+        self.assertEqual(self.health._health[source.pk].consecutive_failures, 0)
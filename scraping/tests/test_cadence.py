@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from ..engine.cadence import Cadence, CadencePolicy
+from ..models import InstrumentModel, PriceTickModel, SourceConfigModel, SourceModel
+
+
+class CadenceIntervalTests(SimpleTestCase):
+    def setUp(self):
+        self.policy = CadencePolicy(default=300, volatile=0.01, flat=0.001)
+
+    def test_bounds_fall_back_to_scrape_interval_then_default(self):
+        self.assertEqual(self.policy.bounds(SourceConfigModel()), (300.0, 300.0))
+        self.assertEqual(
+            self.policy.bounds(SourceConfigModel(scrape_interval=120)), (120.0, 120.0)
+        )
+        self.assertEqual(
+            self.policy.bounds(SourceConfigModel(min_interval=60, max_interval=600)),
+            (60.0, 600.0),
+        )
+
+    def test_interval_shrinks_linearly_with_the_move(self):
+        cfg = SourceConfigModel(min_interval=60, max_interval=600)
+        self.assertEqual(self.policy.interval(cfg, None), 600)
+        self.assertEqual(self.policy.interval(cfg, 0.0005), 600)
+        self.assertEqual(self.policy.interval(cfg, 0.02), 60)
+        self.assertAlmostEqual(self.policy.interval(cfg, 0.0055), 330)
+
+    def test_fixed_interval_ignores_moves(self):
+        cfg = SourceConfigModel(scrape_interval=120)
+        self.assertEqual(self.policy.interval(cfg, 0.5), 120)
+
+    def test_due_in_and_fresh(self):
+        now = timezone.now()
+        self.assertEqual(Cadence(interval=100).due_in(now), 0.0)
+        cadence = Cadence(interval=100, seen_at=now - timedelta(seconds=40))
+        self.assertEqual(cadence.due_in(now), 60)
+        self.assertTrue(cadence.fresh(now, slack=0.1))
+        self.assertFalse(cadence.fresh(now, slack=0.7))
+
+
+class CadenceEvaluateTests(TestCase):
+    def test_evaluate_uses_recent_moves(self):
+        source = SourceModel.objects.create(
+            name="tgju", base_url="https://tgju.example"
+        )
+        usd = InstrumentModel.objects.create(
+            name="US Dollar", fa_name="دلار", symbol="USD", category="currency"
+        )
+        cfg = SourceConfigModel.objects.create(
+            source=source, instrument=usd, path="usd", min_interval=60, max_interval=600
+        )
+        now = timezone.now()
+        for minutes, price in [(3, 1000), (2, 1100), (1, 1100)]:
+            tick = PriceTickModel.objects.create(
+                instrument=usd, source=source, price=price
+            )
+            PriceTickModel.objects.filter(pk=tick.pk).update(
+                timestamp=now - timedelta(minutes=minutes)
+            )
+
+        cadence = CadencePolicy(default=300, volatile=0.05).evaluate([cfg])[cfg.pk]
+
+        self.assertAlmostEqual(cadence.move, 0.1)
+        self.assertEqual(cadence.interval, 60)
+        self.assertEqual(cadence.seen_at, now - timedelta(minutes=1))
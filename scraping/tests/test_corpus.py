@@ -0,0 +1,29 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from ..engine.corpus import get_page_corpus
+
+
+class CorpusTests(TestCase):
+    """The shipped synthetic pages against their hand-written records."""
+
+    fixtures = ["corpus_sources"]
+
+    def test_every_page_has_a_record_per_symbol(self):
+        pages = list(get_page_corpus().iter_pages())
+        self.assertTrue(pages)
+        for page in pages:
+            with self.subTest(url=page.url):
+                self.assertEqual(len(page.expected), len(page.symbols))
+                for symbol, record in zip(page.symbols, page.expected):
+                    self.assertEqual(record["symbol"], symbol)
+                    self.assertTrue(record["price"])
+
+    def test_scrapers_parse_the_expected_records(self):
+        out, err = StringIO(), StringIO()
+        # --check raises CommandError when any variant's records differ
+        call_command("benchparse", check=True, repeat=1, stdout=out, stderr=err)
+        for source in get_page_corpus().sources():
+            self.assertIn(f"{source}:", out.getvalue())
@@ -0,0 +1,100 @@
+import threading
+
+from django.test import SimpleTestCase, override_settings
+
+from ..engine.driver_pool import DriverPool
+from ..engine.fake_web import FakeWebDriver
+from ..engine.http_client import close_http_client, get_http_client
+
+
+@override_settings(SCRAPING_DRIVER="fake")
+class DriverPoolTests(SimpleTestCase):
+    def test_reuses_released_browser(self):
+        pool = DriverPool(max_size=2)
+        first = pool.acquire()
+        pool.release(first, pages=1)
+        second = pool.acquire()
+
+        self.assertIsInstance(first, FakeWebDriver)
+        self.assertIs(first, second)
+        stats = pool.stats()
+        self.assertEqual((stats["launched"], stats["reused"]), (1, 1))
+        pool.release(second)
+        pool.close()
+
+    def test_recycles_after_max_pages(self):
+        pool = DriverPool(max_size=1, max_pages=3)
+        driver = pool.acquire()
+        pool.release(driver, pages=2)
+        self.assertIs(pool.acquire(), driver)
+        pool.release(driver, pages=1)
+
+        self.assertEqual(pool.stats()["recycled"], 1)
+        self.assertIsNot(pool.acquire(), driver)
+        self.assertEqual(pool.stats()["launched"], 2)
+        pool.close()
+
+    def test_discards_broken_and_dead_browsers(self):
+        pool = DriverPool(max_size=1)
+        broken = pool.acquire()
+        pool.release(broken, broken=True)
+        dead = pool.acquire()
+        pool.release(dead)
+        dead.quit()  # dies while idle: fails the health check on acquire
+
+        fresh = pool.acquire()
+        self.assertIsNot(fresh, broken)
+        self.assertIsNot(fresh, dead)
+        stats = pool.stats()
+        self.assertEqual((stats["launched"], stats["discarded"]), (3, 2))
+        pool.release(fresh)
+        pool.close()
+
+    def test_keyed_browsers_are_only_reused_for_their_key(self):
+        pool = DriverPool(max_size=1)
+        tgju = pool.acquire(key="tgju")
+        pool.release(tgju)
+        milli = pool.acquire(key="milli")  # full: evicts the idle tgju browser
+
+        self.assertIsNot(milli, tgju)
+        self.assertEqual(pool.stats()["discarded"], 1)
+        pool.release(milli)
+        self.assertIs(pool.acquire(key="milli"), milli)
+        pool.close()
+
+    def test_waits_for_a_free_slot(self):
+        pool = DriverPool(max_size=1, acquire_timeout=5)
+        held = pool.acquire()
+        got = []
+        waiter = threading.Thread(target=lambda: got.append(pool.acquire()))
+        waiter.start()
+        waiter.join(0.1)
+        self.assertEqual(got, [])
+
+        pool.release(held)
+        waiter.join(5)
+        self.assertEqual(got, [held])
+        pool.close()
+
+    def test_acquire_times_out_when_full(self):
+        pool = DriverPool(max_size=1, acquire_timeout=0.05)
+        pool.acquire()
+        with self.assertRaises(TimeoutError):
+            pool.acquire()
+        pool.close()
+
+
+@override_settings(SCRAPING_DRIVER="chrome")
+class BackendTests(SimpleTestCase):
+    def test_pool_uses_its_own_backend_over_the_setting(self):
+        pool = DriverPool(max_size=1, backend="fake")
+        driver = pool.acquire()
+        self.assertIsInstance(driver, FakeWebDriver)
+        pool.release(driver)
+        pool.close()
+
+    def test_http_clients_are_kept_per_backend(self):
+        self.addCleanup(close_http_client)
+        fake = get_http_client("fake")
+        self.assertIs(get_http_client("fake"), fake)
+        self.assertIsNot(get_http_client(), fake)
@@ -0,0 +1,179 @@
+import threading
+import time
+from collections import defaultdict
+
+from django.test import SimpleTestCase
+
+from ..engine.executor import ParallelExecutor, ScrapeUnit
+from ..engine.stats import ScrapeStats
+from ..models import InstrumentModel, SourceConfigModel, SourceModel
+from ..sources import TgjuScraper
+
+
+class _FakeScraper:
+    """Sleeps instead of scraping; abort() cuts the sleep short."""
+
+    def __init__(self, unit, duration, tracker):
+        self.unit = unit
+        self.duration = duration
+        self.tracker = tracker
+        self.aborted = threading.Event()
+
+    def scrape(self):
+        with self.tracker.enter(self.unit.source.name):
+            self.aborted.wait(self.duration)
+        return ScrapeStats(source=self.unit.source.name)
+
+    def abort(self):
+        self.aborted.set()
+
+
+class _Concurrency:
+    """Highest number of units running at once, per source and overall."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.now = defaultdict(int)
+        self.peak = defaultdict(int)
+        self.total = 0
+        self.peak_total = 0
+
+    def enter(self, name):
+        tracker = self
+
+        class _Slot:
+            def __enter__(self):
+                with tracker.lock:
+                    tracker.now[name] += 1
+                    tracker.total += 1
+                    tracker.peak[name] = max(tracker.peak[name], tracker.now[name])
+                    tracker.peak_total = max(tracker.peak_total, tracker.total)
+
+            def __exit__(self, *exc):
+                with tracker.lock:
+                    tracker.now[name] -= 1
+                    tracker.total -= 1
+
+        return _Slot()
+
+
+def _units(source, count, prefix=""):
+    return [
+        ScrapeUnit(
+            key=f"{prefix}{i}@{source.name}",
+            source=source,
+            symbols=[],
+            scraper_cls=object,
+        )
+        for i in range(count)
+    ]
+
+
+class ParallelExecutorTests(SimpleTestCase):
+    def setUp(self):
+        self.tgju = SourceModel(name="tgju", base_url="https://tgju.example")
+        self.milli = SourceModel(name="milli", base_url="https://milli.example")
+        self.tracker = _Concurrency()
+
+    def _build(self, durations):
+        return lambda unit: _FakeScraper(unit, durations(unit), self.tracker)
+
+    def test_caps_workers_and_per_source_concurrency(self):
+        units = _units(self.tgju, 6) + _units(self.milli, 6)
+        outcomes = ParallelExecutor(workers=4, per_source=2).run(
+            units, self._build(lambda unit: 0.05)
+        )
+
+        self.assertEqual(len(outcomes), 12)
+        self.assertTrue(all(o.ok for o in outcomes))
+        self.assertLessEqual(self.tracker.peak_total, 4)
+        self.assertLessEqual(self.tracker.peak["tgju"], 2)
+        self.assertLessEqual(self.tracker.peak["milli"], 2)
+
+    def test_default_cap_shares_workers_between_sources(self):
+        # 4 workers over 2 sources: 2 each, handed out round-robin
+        slow = _units(self.tgju, 6)
+        fast = _units(self.milli, 2)
+        started = []
+        ParallelExecutor(workers=4).run(
+            slow + fast,
+            self._build(lambda unit: 0.1 if unit.source is self.tgju else 0.01),
+            on_start=lambda unit: started.append(unit.key),
+        )
+
+        self.assertLessEqual(self.tracker.peak["tgju"], 2)
+        self.assertEqual(
+            started[:4], [slow[0].key, fast[0].key, slow[1].key, fast[1].key]
+        )
+
+    def test_deadline_cancels_pending_and_aborts_running(self):
+        units = _units(self.tgju, 3)
+        failures = {}
+        started = time.monotonic()
+        outcomes = ParallelExecutor(workers=1, deadline=0.2, grace=1.0).run(
+            units,
+            self._build(lambda unit: 5.0),
+            on_failure=lambda unit, error, stats: failures.setdefault(unit.key, error),
+        )
+
+        self.assertLess(time.monotonic() - started, 2.0)
+        by_key = {o.unit.key: o for o in outcomes}
+        self.assertEqual(len(by_key), 3)
+        # The running unit was aborted: it returned within the grace period,
+        # but stopping early is a failure, not a clean success
+        aborted = by_key[units[0].key]
+        self.assertFalse(aborted.ok)
+        self.assertEqual(aborted.error, "stopped at deadline")
+        self.assertIsInstance(aborted.stats, ScrapeStats)
+        for unit in units[1:]:
+            self.assertFalse(by_key[unit.key].ok)
+            self.assertEqual(by_key[unit.key].error, "cancelled: deadline")
+            self.assertEqual(failures[unit.key], "cancelled: deadline")
+
+    def test_unit_outliving_the_grace_period_fails(self):
+        class _Stuck(_FakeScraper):
+            def abort(self):
+                pass  # ignores the abort request
+
+        outcomes = ParallelExecutor(workers=1, deadline=0.1, grace=0.1).run(
+            _units(self.tgju, 1),
+            lambda unit: _Stuck(unit, 0.5, self.tracker),
+        )
+
+        self.assertFalse(outcomes[0].ok)
+        self.assertEqual(outcomes[0].error, "deadline exceeded")
+
+    def test_errors_fail_only_their_unit(self):
+        def build(unit):
+            if unit.key.startswith("0@"):
+                raise RuntimeError("no driver")
+            return _FakeScraper(unit, 0.0, self.tracker)
+
+        outcomes = ParallelExecutor(workers=2).run(_units(self.tgju, 3), build)
+
+        by_key = {o.unit.key: o for o in outcomes}
+        self.assertEqual(by_key["0@tgju"].error, "no driver")
+        self.assertTrue(by_key["1@tgju"].ok)
+        self.assertTrue(by_key["2@tgju"].ok)
+        self.assertIsInstance(by_key["1@tgju"].stats, ScrapeStats)
+
+
+class StoppedScraperTests(SimpleTestCase):
+    def test_configs_left_after_a_stop_are_skipped_and_failed(self):
+        source = SourceModel(name="tgju", base_url="https://tgju.example")
+        configs = [
+            SourceConfigModel(
+                source=source,
+                instrument=InstrumentModel(symbol=symbol),
+                path=symbol.lower(),
+            )
+            for symbol in ("USD", "EUR")
+        ]
+        scraper = TgjuScraper(source, configs=configs)
+        scraper.stop_event.set()
+        stats = scraper.scrape()
+
+        self.assertEqual(stats.page_loads, 0)
+        self.assertEqual(stats.skipped_symbols, ["USD", "EUR"])
+        self.assertEqual(stats.failed_symbols, ["USD", "EUR"])
+        self.assertEqual([p.outcome for p in scraper.page_stats], ["skipped"] * 2)
@@ -0,0 +1,63 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from ..engine.fingerprint import ChangeDetector
+from ..models import InstrumentModel, PriceTickModel, SourceModel, TickFingerprintModel
+
+
+class ChangeDetectorTests(TestCase):
+    def setUp(self):
+        self.source = SourceModel.objects.create(
+            name="tgju", base_url="https://tgju.example"
+        )
+        self.usd = InstrumentModel.objects.create(
+            name="US Dollar", fa_name="دلار", symbol="USD", category="currency"
+        )
+        self.now = timezone.now()
+        patcher = mock.patch(
+            "scraping.engine.fingerprint.timezone.now", side_effect=lambda: self.now
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _tick(self, price):
+        return PriceTickModel(
+            instrument=self.usd, source=self.source, price=price, meta={"high": price}
+        )
+
+    def _write(self, detector, price):
+        with self.captureOnCommitCallbacks(execute=True):
+            keep, fingerprints = detector.select([self._tick(price)])
+            detector.save(fingerprints)
+        return keep
+
+    def test_unchanged_ticks_are_dropped_until_heartbeat(self):
+        detector = ChangeDetector(heartbeat=60)
+        self.assertEqual(len(self._write(detector, 1000)), 1)
+
+        self.now += timedelta(seconds=30)
+        self.assertEqual(self._write(detector, 1000), [])
+        self.assertEqual(detector.skipped, 1)
+
+        # The heartbeat counts from the last write, not the last scrape
+        self.now += timedelta(seconds=31)
+        self.assertEqual(len(self._write(detector, 1000)), 1)
+
+    def test_changed_price_is_kept(self):
+        detector = ChangeDetector(heartbeat=60)
+        self._write(detector, 1000)
+        self.assertEqual(len(self._write(detector, 1001)), 1)
+        self.assertEqual(detector.skipped, 0)
+
+    def test_new_process_loads_last_fingerprint(self):
+        self._write(ChangeDetector(heartbeat=60), 1000)
+        self.now += timedelta(seconds=10)
+
+        fresh = ChangeDetector(heartbeat=60)
+        self.assertEqual(self._write(fresh, 1000), [])
+        row = TickFingerprintModel.objects.get(instrument=self.usd, source=self.source)
+        self.assertEqual(row.seen_at, self.now)
+        self.assertEqual(row.written_at, self.now - timedelta(seconds=10))
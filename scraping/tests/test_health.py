@@ -0,0 +1,138 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from selenium.common.exceptions import WebDriverException
+
+from ..engine.health import CLOSED, HALF_OPEN, OPEN, HealthTracker
+from ..models import (
+    InstrumentModel,
+    SourceConfigModel,
+    SourceHealthModel,
+    SourceModel,
+)
+from ..sources import TgjuScraper
+
+
+class HealthTrackerTests(TestCase):
+    def setUp(self):
+        self.source = SourceModel.objects.create(
+            name="tgju", base_url="https://tgju.example"
+        )
+        self.now = timezone.now()
+        patcher = mock.patch(
+            "scraping.engine.health.timezone.now", side_effect=lambda: self.now
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.tracker = HealthTracker(threshold=3, cooldown=60)
+
+    def _fail(self, times=1):
+        for _ in range(times):
+            self.tracker.record_failure(self.source, "timeout")
+
+    def test_opens_after_threshold_consecutive_failures(self):
+        self._fail(2)
+        self.assertEqual(self.tracker.state(self.source), CLOSED)
+        self.tracker.record_success(self.source, 1.0)
+        self._fail(2)
+        self.assertTrue(self.tracker.allows(self.source))
+
+        self._fail()
+        self.assertEqual(self.tracker.state(self.source), OPEN)
+        self.assertFalse(self.tracker.allows(self.source))
+        self.assertEqual(
+            self.tracker.reopens_at(self.source), self.now + timedelta(seconds=60)
+        )
+
+    def test_half_open_after_cooldown_then_probe_decides(self):
+        self._fail(3)
+        self.now += timedelta(seconds=61)
+        self.assertEqual(self.tracker.state(self.source), HALF_OPEN)
+        self.assertTrue(self.tracker.allows(self.source))
+
+        # A failed probe re-opens right away
+        self._fail()
+        self.assertEqual(self.tracker.state(self.source), OPEN)
+
+        self.now += timedelta(seconds=61)
+        self.tracker.record_success(self.source, 0.5)
+        self.assertEqual(self.tracker.state(self.source), CLOSED)
+        self._fail(2)
+        self.assertEqual(self.tracker.state(self.source), CLOSED)
+
+    def test_latency_ewma(self):
+        tracker = HealthTracker(alpha=0.5)
+        tracker.record_success(self.source, 2.0)
+        tracker.record_success(self.source, 4.0)
+        self.assertEqual(tracker.latency(self.source), 3.0)
+
+    def test_state_survives_save_and_load(self):
+        self._fail(3)
+        self.tracker.save()
+        row = SourceHealthModel.objects.get(source=self.source)
+        self.assertEqual((row.state, row.consecutive_failures), (OPEN, 3))
+
+        fresh = HealthTracker(threshold=3, cooldown=60)
+        self.assertEqual(fresh.state(self.source), OPEN)
+
+    def test_latency_percentile_survives_save_and_load(self):
+        for latency in range(1, 11):
+            self.tracker.record_success(self.source, float(latency))
+        p90 = self.tracker.latency_percentile(self.source, 90)
+        self.assertGreater(p90, self.tracker.latency(self.source))
+        self.tracker.save()
+
+        # A new process sees the earlier runs' page loads, not just the EWMA
+        fresh = HealthTracker(threshold=3, cooldown=60)
+        self.assertEqual(fresh.latency_percentile(self.source, 90), p90)
+
+
+class _BrokenPageScraper(TgjuScraper):
+    """Every page load raises a browser error."""
+
+    def load_page(self, url, config=None):
+        self.loads += 1
+        raise WebDriverException("net::ERR_CONNECTION_RESET")
+
+
+@override_settings(SCRAPING_RETRY_WAIT_MIN=0, SCRAPING_RETRY_WAIT_MAX=0)
+class PageFailureReportingTests(TestCase):
+    def setUp(self):
+        self.source = SourceModel.objects.create(
+            name="tgju", base_url="https://tgju.example"
+        )
+        self.tracker = HealthTracker(threshold=3, cooldown=300)
+
+    def _scraper(self, *symbols):
+        configs = [
+            SourceConfigModel(
+                source=self.source,
+                instrument=InstrumentModel(symbol=symbol),
+                path=symbol.lower(),
+            )
+            for symbol in symbols
+        ]
+        scraper = _BrokenPageScraper(self.source, configs=configs, health=self.tracker)
+        scraper.loads = 0
+        return scraper
+
+    def test_retried_page_counts_as_one_failure(self):
+        scraper = self._scraper("USD")
+        scraper.retry_attempts = 3
+        scraper.scrape()
+
+        self.assertEqual(scraper.loads, 3)
+        self.assertEqual(self.tracker.state(self.source), CLOSED)
+        self.assertEqual(self.tracker._health[self.source.pk].consecutive_failures, 1)
+
+    def test_threshold_failed_pages_open_the_circuit(self):
+        scraper = self._scraper("USD", "EUR", "GBP", "AED")
+        scraper.retry_attempts = 2
+        stats = scraper.scrape()
+
+        self.assertEqual(self.tracker.state(self.source), OPEN)
+        # The fourth page is not loaded once the circuit is open
+        self.assertEqual(scraper.loads, 6)
+        self.assertEqual(stats.failed_symbols, ["USD", "EUR", "GBP", "AED"])
@@ -0,0 +1,88 @@
+import threading
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase
+
+from ..engine.hedge import HedgedExecutor
+from ..engine.stats import ScrapeStats
+
+
+def _config(source):
+    return SimpleNamespace(
+        source=SimpleNamespace(name=source), instrument=SimpleNamespace(symbol="BTC")
+    )
+
+
+class _Contender:
+    """Hands `records` to the collector after `delay` seconds, unless aborted."""
+
+    def __init__(self, config, collector, delay, records):
+        self.source = config.source
+        self.collector = collector
+        self.delay = delay
+        self.records = records
+        self.aborted = threading.Event()
+
+    def scrape(self):
+        if not self.aborted.wait(self.delay) and self.records:
+            self.collector.submit(self.records)
+        return ScrapeStats(source=self.source.name)
+
+    def abort(self):
+        self.aborted.set()
+
+
+class HedgedExecutorTests(SimpleTestCase):
+    def setUp(self):
+        self.built = {}
+        self.stored = []
+
+    def _race(self, primary, backup, budget=0.1):
+        """primary / backup: (delay, records) of each contender."""
+        behaviour = {"wallex": primary, "arzdigital": backup}
+
+        def build(config, collector):
+            delay, records = behaviour[config.source.name]
+            scraper = _Contender(config, collector, delay, records)
+            self.built[config.source.name] = scraper
+            return scraper
+
+        def store(records):
+            self.stored.extend(records)
+            return len(records)
+
+        executor = HedgedExecutor(build, store, budget_for=lambda source: budget)
+        [outcome] = executor.run([(_config("wallex"), _config("arzdigital"))])
+        return outcome
+
+    def test_default_within_budget_is_not_hedged(self):
+        outcome = self._race((0, ["wallex tick"]), (0, ["arzdigital tick"]))
+
+        self.assertEqual(outcome.winner, "wallex")
+        self.assertFalse(outcome.hedged)
+        self.assertNotIn("arzdigital", self.built)
+        self.assertEqual(self.stored, ["wallex tick"])
+
+    def test_slow_default_loses_to_the_fallback_and_is_aborted(self):
+        outcome = self._race((5, ["wallex tick"]), (0, ["arzdigital tick"]))
+
+        self.assertEqual(outcome.winner, "arzdigital")
+        self.assertTrue(outcome.hedged)
+        self.assertTrue(self.built["wallex"].aborted.is_set())
+        # The loser's ticks are dropped
+        self.assertEqual(self.stored, ["arzdigital tick"])
+        self.assertLess(outcome.elapsed, 5)
+
+    def test_failed_default_starts_the_fallback_before_the_budget(self):
+        outcome = self._race((0, []), (0, ["arzdigital tick"]), budget=5)
+
+        self.assertEqual(outcome.winner, "arzdigital")
+        self.assertTrue(outcome.hedged)
+        self.assertLess(outcome.elapsed, 5)
+
+    def test_no_winner_when_both_fail(self):
+        outcome = self._race((0, []), (0, []))
+
+        self.assertFalse(outcome.ok)
+        self.assertEqual(self.stored, [])
+        self.assertEqual(len(outcome.stats), 2)
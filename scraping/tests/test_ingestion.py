@@ -0,0 +1,134 @@
+import threading
+from unittest import mock
+
+from django.db import OperationalError
+from django.test import SimpleTestCase, TestCase
+
+from ..engine.ingestion import (
+    InstrumentCache,
+    TickRecord,
+    TickWriter,
+    clear_instrument_cache,
+)
+from ..models import InstrumentModel, SourceModel
+
+
+class _SaveTicks:
+    """Stands in for save_ticks: records batch sizes, optionally fails or blocks."""
+
+    def __init__(self, errors=(), gate=None):
+        self.batches = []
+        self.calls = 0
+        self.errors = list(errors)
+        self.gate = gate
+
+    def __call__(self, batch, cache=None):
+        self.calls += 1
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.errors:
+            raise self.errors.pop(0)
+        self.batches.append(len(batch))
+        return len(batch)
+
+
+class TickWriterTests(SimpleTestCase):
+    def setUp(self):
+        self.source = SourceModel(name="tgju", base_url="https://tgju.example")
+
+    def _records(self, count):
+        return [
+            TickRecord(symbol="USD", source=self.source, price=i) for i in range(count)
+        ]
+
+    def _patch(self, save):
+        patcher = mock.patch("scraping.engine.ingestion.save_ticks", save)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_batches_by_size_and_flushes_rest_on_close(self):
+        save = _SaveTicks()
+        self._patch(save)
+        writer = TickWriter(batch_size=3, flush_interval=60)
+        writer.submit(self._records(7))
+        writer.close()
+
+        self.assertEqual(save.batches, [3, 3, 1])
+        self.assertEqual((writer.written, writer.batches), (7, 3))
+        with self.assertRaises(RuntimeError):
+            writer.submit(self._records(1))
+
+    def test_flushes_partial_batch_after_interval(self):
+        save = _SaveTicks()
+        self._patch(save)
+        writer = TickWriter(batch_size=100, flush_interval=0.05)
+        writer.submit(self._records(2))
+        writer.flush()
+
+        self.assertEqual(save.batches, [2])
+        writer.close()
+
+    def test_full_queue_blocks_then_raises(self):
+        gate = threading.Event()
+        save = _SaveTicks(gate=gate)
+        self._patch(save)
+        writer = TickWriter(batch_size=1, max_queue=1, put_timeout=0.1)
+        try:
+            # One record is being written (blocked), one fills the queue
+            with self.assertRaisesRegex(RuntimeError, "queue full"):
+                writer.submit(self._records(5))
+        finally:
+            gate.set()
+            writer.close()
+        self.assertEqual(writer.failed, 0)
+
+    def test_retries_locked_database(self):
+        save = _SaveTicks(errors=[OperationalError("database is locked")] * 2)
+        self._patch(save)
+        writer = TickWriter(batch_size=10, flush_interval=0, lock_retries=5)
+        with mock.patch("scraping.engine.ingestion.time.sleep"):
+            writer.submit(self._records(4))
+            writer.close()
+
+        self.assertEqual(save.calls, 3)
+        self.assertEqual((writer.written, writer.failed), (4, 0))
+
+    def test_gives_up_on_other_errors(self):
+        save = _SaveTicks(errors=[OperationalError("no such table")])
+        self._patch(save)
+        writer = TickWriter(batch_size=10, flush_interval=0)
+        writer.submit(self._records(4))
+        writer.close()
+
+        self.assertEqual(save.calls, 1)
+        self.assertEqual((writer.written, writer.failed), (0, 4))
+
+
+class InstrumentCacheTests(TestCase):
+    def _add_usd(self):
+        return InstrumentModel.objects.create(
+            name="US Dollar", fa_name="دلار", symbol="USD", category="currency"
+        )
+
+    def test_misses_expire(self):
+        cache = InstrumentCache(miss_ttl=0)
+        self.assertEqual(cache.resolve(["USD"]), {})
+        usd = self._add_usd()
+        self.assertEqual(cache.resolve(["USD"])["USD"], usd)
+
+    def test_misses_are_cached_within_ttl(self):
+        cache = InstrumentCache(miss_ttl=60)
+        cache.resolve(["USD"])
+        self._add_usd()
+        with self.assertNumQueries(0):
+            self.assertEqual(cache.resolve(["USD"]), {})
+
+    def test_clearing_the_shared_cache_reaches_the_writer(self):
+        writer = TickWriter()
+        clear_instrument_cache()
+        self.addCleanup(clear_instrument_cache)
+        self.assertEqual(writer._cache.resolve(["USD"]), {})
+        usd = self._add_usd()
+
+        clear_instrument_cache()
+        self.assertEqual(writer._cache.resolve(["USD"])["USD"], usd)
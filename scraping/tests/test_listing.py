@@ -0,0 +1,95 @@
+from decimal import Decimal
+
+from django.test import TestCase
+
+from ..engine.health import HealthTracker
+from ..engine.ingestion import clear_instrument_cache
+from ..engine.planner import PlanUnit
+from ..models import InstrumentModel, PriceTickModel, SourceConfigModel, SourceModel
+from ..sources import TgjuScraper
+
+LISTING = """
+<table><tbody>
+<tr data-market-row="price_dollar_rl" data-price="1,042,500"><th>دلار</th>
+  <td>۱,۰۴۲,۵۰۰</td><td>(0.53%) ۵,۵۰۰</td><td>۱,۰۳۶,۵۰۰</td><td>۱,۰۴۸,۰۰۰</td>
+  <td>۱۴:۲۵:۰۳</td></tr>
+<tr data-market-row="price_eur"><th>یورو</th><td>۱,۲۱۸,۹۰۰</td></tr>
+</tbody></table>
+"""
+
+PROFILE = """
+<table><tbody class="table-padding-lg">
+<tr><td>نرخ فعلی</td><td>۱۳۹,۸۰۰</td></tr>
+</tbody></table>
+"""
+
+
+class _ListingScraper(TgjuScraper):
+    def load_page(self, url, config=None):
+        self.loads.append(url)
+        return self.web[url]
+
+
+class ListingFanOutTests(TestCase):
+    def setUp(self):
+        # Instruments cached by earlier tests were rolled back with them
+        clear_instrument_cache()
+        self.source = SourceModel.objects.create(
+            name="tgju", base_url="https://tgju.example", listing_path="currency"
+        )
+        for symbol, path, row_key in [
+            ("USD", "profile/price_dollar_rl", "price_dollar_rl"),
+            ("EUR", "profile/price_eur", "price_eur"),
+            ("GBP", "profile/price_gbp", "price_gbp"),
+            ("AED", "profile/price_aed", ""),
+        ]:
+            inst = InstrumentModel.objects.create(
+                name=symbol, fa_name=symbol, symbol=symbol, category="currency"
+            )
+            SourceConfigModel.objects.create(
+                source=self.source, instrument=inst, path=path, row_key=row_key
+            )
+
+    def _scraper(self):
+        scraper = _ListingScraper(self.source, health=HealthTracker())
+        scraper.loads = []
+        scraper.web = {
+            "https://tgju.example/currency": LISTING,
+            "https://tgju.example/profile/price_aed": PROFILE,
+        }
+        return scraper
+
+    def test_configs_with_a_row_key_share_the_listing_page(self):
+        scraper = self._scraper()
+        groups = scraper.group_by_url(scraper.source_configs)
+
+        self.assertEqual(
+            {
+                url: sorted(c.instrument.symbol for c in cfgs)
+                for url, cfgs in groups.items()
+            },
+            {
+                "https://tgju.example/currency": ["EUR", "GBP", "USD"],
+                "https://tgju.example/profile/price_aed": ["AED"],
+            },
+        )
+        self.assertEqual(PlanUnit(self.source, tuple(scraper.source_configs)).pages, 2)
+
+    def test_one_navigation_serves_every_row(self):
+        scraper = self._scraper()
+        stats = scraper.scrape()
+
+        self.assertEqual(
+            sorted(scraper.loads),
+            ["https://tgju.example/currency", "https://tgju.example/profile/price_aed"],
+        )
+        self.assertEqual(sorted(stats.ok_symbols), ["AED", "EUR", "USD"])
+        # A missing row fails only its own config
+        self.assertEqual(stats.failed_symbols, ["GBP"])
+
+        usd = PriceTickModel.objects.get(instrument__symbol="USD")
+        self.assertEqual(usd.price, Decimal("1042500"))
+        self.assertEqual(usd.meta["row_key"], "price_dollar_rl")
+        self.assertEqual(usd.meta["highest_price"], "1048000")
+        eur = PriceTickModel.objects.get(instrument__symbol="EUR")
+        self.assertEqual(eur.price, Decimal("1218900"))
@@ -0,0 +1,71 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from ..engine.planner import ALL, PlanCompiler
+from ..models import (
+    InstrumentModel,
+    PriceTickModel,
+    ScrapeRunModel,
+    SourceConfigModel,
+    SourceModel,
+)
+
+SUPPORTED = ["tgju", "wallex", "arzdigital", "milli", "alanchand", "zarminex"]
+
+
+class PlanCompilerTests(TestCase):
+    fixtures = ["corpus_sources"]
+
+    def _compile(self, **scope):
+        return PlanCompiler(SUPPORTED).compile(**scope)
+
+    def test_default_first_picks_each_instruments_default_source(self):
+        plan = self._compile(instrument=ALL)
+        picked = {s: u.source.name for u in plan.units for s in u.symbols}
+        self.assertEqual(picked["USD"], "tgju")
+        self.assertEqual(picked["EUR"], "tgju")
+        self.assertEqual(len(picked), 5)
+        # USD and EUR share one tgju session
+        self.assertEqual(len(plan.units), 4)
+
+    def test_query_count_does_not_grow_with_instruments(self):
+        with self.assertNumQueries(3):
+            small = self._compile(instrument=ALL)
+
+        tgju = SourceModel.objects.get(name="tgju")
+        for i in range(20):
+            inst = InstrumentModel.objects.create(
+                name=f"Coin {i}",
+                fa_name=f"سکه {i}",
+                symbol=f"C{i:02d}",
+                category="coin",
+                default_source=tgju,
+            )
+            SourceConfigModel.objects.create(
+                source=tgju, instrument=inst, path=f"profile/c{i}"
+            )
+
+        with self.assertNumQueries(3):
+            large = self._compile(instrument=ALL)
+        self.assertEqual(small.queries, large.queries)
+        self.assertEqual(large.pages, small.pages + 20)
+
+    def test_source_scope_reads_every_config_of_the_source(self):
+        plan = self._compile(source="tgju")
+        self.assertEqual([u.symbols for u in plan.units], [("EUR", "USD")])
+
+
+class DryRunTests(TestCase):
+    fixtures = ["corpus_sources"]
+
+    def test_prints_the_plan_without_scraping(self):
+        out = StringIO()
+        call_command("scrape", "--instrument", "--dry-run", stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("Plan (instrument scope): 4 unit(s), 5 page(s)", output)
+        self.assertIn("EUR, USD", output)
+        self.assertFalse(PriceTickModel.objects.exists())
+        self.assertFalse(ScrapeRunModel.objects.exists())
@@ -0,0 +1,84 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from ..engine.refresh import claim_refreshes, finish_refreshes, request_refresh
+from ..models import (
+    InstrumentModel,
+    RefreshRequestModel,
+    SourceModel,
+    TickFingerprintModel,
+)
+
+
+@override_settings(
+    SCRAPING_REFRESH_ON_READ=True,
+    SCRAPING_FRESHNESS_SLA=60,
+    SCRAPING_REFRESH_DEDUPE=30,
+    SCRAPING_REFRESH_TIMEOUT=600,
+)
+class RefreshQueueTests(TestCase):
+    fixtures = ["corpus_sources"]
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.now = timezone.now()
+
+    def _read(self, symbol, age):
+        """The instrument as served by a read, its last tick `age` seconds old."""
+        inst = InstrumentModel.objects.get(symbol=symbol)
+        inst.latest_timestamp = self.now - timedelta(seconds=age)
+        return inst
+
+    def test_fresh_reads_cost_nothing(self):
+        usd = self._read("USD", age=10)
+        with self.assertNumQueries(0):
+            self.assertEqual(request_refresh([usd]), 0)
+        self.assertFalse(RefreshRequestModel.objects.exists())
+
+    def test_burst_of_stale_reads_makes_one_request(self):
+        usd = self._read("USD", age=120)
+        counts = [request_refresh([usd]) for _ in range(5)]
+
+        self.assertEqual(counts, [1, 0, 0, 0, 0])
+        request = RefreshRequestModel.objects.get()
+        self.assertEqual(request.instrument.symbol, "USD")
+        self.assertEqual(request.stale_since, usd.latest_timestamp)
+
+    def test_processes_without_a_shared_cache_still_make_one_request(self):
+        usd = self._read("USD", age=120)
+        request_refresh([usd])
+        cache.clear()  # another process
+        request_refresh([usd])
+
+        self.assertEqual(RefreshRequestModel.objects.count(), 1)
+
+    def test_recently_seen_unchanged_price_is_fresh(self):
+        usd = self._read("USD", age=120)
+        TickFingerprintModel.objects.create(
+            source=SourceModel.objects.get(name="tgju"),
+            instrument=usd,
+            fingerprint="0" * 40,
+            written_at=usd.latest_timestamp,
+            seen_at=self.now,
+        )
+        self.assertEqual(request_refresh([usd]), 0)
+        self.assertFalse(RefreshRequestModel.objects.exists())
+
+    def test_a_request_is_claimed_once_until_its_claim_expires(self):
+        request_refresh([self._read("USD", age=120), self._read("EUR", age=120)])
+
+        first = claim_refreshes(limit=10)
+        self.assertEqual(len(first), 2)
+        self.assertEqual(claim_refreshes(limit=10), [])
+
+        # The daemon holding the claim died
+        RefreshRequestModel.objects.update(claimed_at=self.now - timedelta(seconds=601))
+        taken_over = claim_refreshes(limit=1)
+        self.assertEqual(len(taken_over), 1)
+
+        finish_refreshes(first)
+        self.assertFalse(RefreshRequestModel.objects.exists())
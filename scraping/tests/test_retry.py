@@ -0,0 +1,77 @@
+from django.test import TestCase, override_settings
+from selenium.common.exceptions import TimeoutException
+
+from ..engine.corpus import get_page_corpus
+from ..engine.health import HealthTracker
+from ..engine.ingestion import clear_instrument_cache
+from ..engine.retry import RetryBudget
+from ..models import PriceTickModel, SourceModel
+from ..sources import TgjuScraper
+
+
+class _FlakyScraper(TgjuScraper):
+    """Serves the corpus pages; a page times out `failures[url]` times first."""
+
+    def load_page(self, url, config=None):
+        self.loads.append(url)
+        if self.failures.get(url, 0):
+            self.failures[url] -= 1
+            raise TimeoutException("page load timed out")
+        return self.pages[url].html
+
+
+@override_settings(SCRAPING_RETRY_WAIT_MIN=0, SCRAPING_RETRY_WAIT_MAX=0)
+class PageRetryTests(TestCase):
+    fixtures = ["corpus_sources"]
+
+    USD = "https://www.tgju.org/profile/price_dollar_rl"
+    EUR = "https://www.tgju.org/profile/price_eur"
+
+    def setUp(self):
+        # Instruments cached by earlier tests were rolled back with them
+        clear_instrument_cache()
+        self.source = SourceModel.objects.get(name="tgju")
+        self.pages = get_page_corpus().index()
+
+    def _scraper(self, failures, budget=None, attempts=3, symbols=None):
+        scraper = _FlakyScraper(
+            self.source,
+            instruments=symbols,
+            retry_budget=budget or RetryBudget(6),
+            health=HealthTracker(threshold=10),
+        )
+        scraper.retry_attempts = attempts
+        scraper.pages, scraper.failures, scraper.loads = self.pages, failures, []
+        return scraper
+
+    def test_only_the_failing_page_is_retried(self):
+        scraper = self._scraper({self.USD: 2})
+        stats = scraper.scrape()
+
+        self.assertEqual(sorted(scraper.loads), sorted([self.EUR] + [self.USD] * 3))
+        self.assertEqual(stats.retries, 2)
+        self.assertEqual(sorted(stats.ok_symbols), ["EUR", "USD"])
+        self.assertEqual(PriceTickModel.objects.count(), 2)
+
+    def test_gives_up_on_a_page_after_its_attempts(self):
+        scraper = self._scraper({self.USD: 5}, attempts=2)
+        stats = scraper.scrape()
+
+        self.assertEqual(scraper.loads.count(self.USD), 2)
+        self.assertEqual(stats.failed_symbols, ["USD"])
+        # The other page is still stored
+        self.assertEqual(stats.ok_symbols, ["EUR"])
+
+    def test_budget_is_shared_by_the_sources_sessions(self):
+        budget = RetryBudget(1)
+        first = self._scraper({self.USD: 1}, budget=budget, symbols=["USD"])
+        second = self._scraper({self.EUR: 1}, budget=budget, symbols=["EUR"])
+
+        self.assertEqual(first.scrape().ok_symbols, ["USD"])
+        stats = second.scrape()
+
+        # The one retry went to USD: EUR fails on its first error
+        self.assertEqual(second.loads, [self.EUR])
+        self.assertTrue(stats.budget_exhausted)
+        self.assertEqual(stats.failed_symbols, ["EUR"])
+        self.assertEqual(budget.remaining, 0)
@@ -0,0 +1,64 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.test import TransactionTestCase
+
+from ..engine.corpus import get_page_corpus
+from ..engine.fake_web import FakeWeb
+
+
+class ScrapeCommandReportTests(TransactionTestCase):
+    """scrape over the fixture corpus with the fake driver."""
+
+    fixtures = ["corpus_sources"]
+
+    def _scrape(self, latency=0.0, **options):
+        """Run scrape; returns (output, CommandError or None)."""
+        web = FakeWeb(get_page_corpus(), latency=latency, jitter=0)
+        out, err = StringIO(), StringIO()
+        error = None
+        with mock.patch("scraping.engine.fake_web._shared_web", web):
+            try:
+                call_command(
+                    "scrape",
+                    driver="fake",
+                    engine="selenium",
+                    stdout=out,
+                    stderr=err,
+                    **options,
+                )
+            except CommandError as e:
+                error = e
+        return out.getvalue() + err.getvalue(), error
+
+    def test_every_symbol_with_a_price_is_ok(self):
+        output, error = self._scrape(instrument="__ALL__")
+
+        self.assertIsNone(error)
+        for line in (
+            "[USD] tgju: OK",
+            "[EUR] tgju: OK",
+            "[BTC] wallex: OK",
+            "[BAHAR] milli: OK",
+            "[GOLD18] zarminex: OK",
+        ):
+            self.assertIn(line, output)
+
+    def test_deadline_reports_unreached_symbols_as_skipped(self):
+        # tgju's pages load in plan order (EUR, USD): EUR is loading when the
+        # deadline passes and USD is never reached
+        output, error = self._scrape(
+            latency=1.0, instrument="__ALL__", source="tgju", deadline=0.3
+        )
+
+        self.assertIsNotNone(error)
+        self.assertIn("[EUR] tgju: FAIL → stopped at deadline", output)
+        self.assertIn("[USD] tgju: skipped", output)
+        self.assertNotIn(": OK", output)
+
+    def test_source_scope_stopped_at_deadline_fails(self):
+        output, error = self._scrape(source="tgju", deadline=0.3, latency=1.0)
+
+        self.assertIsNotNone(error)
+        self.assertIn("[tgju] FAIL → stopped at deadline", output)